@@ -3,6 +3,8 @@ from abc import abstractmethod
 
 class Attribute(object):
 
+    __slots__ = ()
+
     @abstractmethod
     def continuousAttributeSize(self) -> int:
         pass
@@ -3,6 +3,8 @@ from Classification.Attribute.DiscreteAttribute import DiscreteAttribute
 
 class BinaryAttribute(DiscreteAttribute):
 
+    __slots__ = ()
+
     def __init__(self, value: bool):
         """
         Constructor for a binary discrete attribute. The attribute can take only two values "True" or "False".
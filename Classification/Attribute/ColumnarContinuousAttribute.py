@@ -0,0 +1,60 @@
+from Classification.Attribute.ContinuousAttribute import ContinuousAttribute
+
+
+class ColumnarContinuousAttribute(ContinuousAttribute):
+
+    __slots__ = ("__column", "__row")
+
+    __column: object
+    __row: int
+
+    def __init__(self, column, row: int):
+        """
+        Constructor for a continuous attribute whose value is stored in a column of a columnar instance list. The
+        attribute does not keep a copy of the value, it reads and writes the given row of the column.
+
+        PARAMETERS
+        ----------
+        column
+            Float array that stores the values of the attribute.
+        row : int
+            Row of the value in the column.
+        """
+        self.__column = column
+        self.__row = row
+
+    def getValue(self) -> float:
+        """
+        Accessor method for value.
+
+        RETURNS
+        -------
+        float
+            value
+        """
+        return self.__column[self.__row]
+
+    def setValue(self, value: float):
+        """
+        Mutator method for value. The new value is written back to the column.
+
+        PARAMETERS
+        ----------
+        value : float
+            New value of value.
+        """
+        self.__column[self.__row] = value
+
+    def __str__(self) -> str:
+        """
+        Converts value to {@link String}.
+
+        RETURNS
+        -------
+        str
+            String representation of value.
+        """
+        return self.__column[self.__row].__str__()
+
+    def continuousAttributes(self) -> list:
+        return [self.__column[self.__row]]
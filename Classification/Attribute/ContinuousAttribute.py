@@ -3,6 +3,8 @@ from Classification.Attribute.Attribute import Attribute
 
 class ContinuousAttribute(Attribute):
 
+    __slots__ = ("__value",)
+
     __value: float
 
     def __init__(self, value: float):
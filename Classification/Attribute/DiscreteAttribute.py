@@ -3,6 +3,8 @@ from Classification.Attribute.Attribute import Attribute
 
 class DiscreteAttribute(Attribute):
 
+    __slots__ = ("__value",)
+
     __value: str
 
     def __init__(self, value: str):
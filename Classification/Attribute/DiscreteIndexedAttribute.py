@@ -3,6 +3,8 @@ from Classification.Attribute.DiscreteAttribute import DiscreteAttribute
 
 class DiscreteIndexedAttribute(DiscreteAttribute):
 
+    __slots__ = ("__index", "__maxIndex")
+
     __index: int
     __maxIndex: int
 
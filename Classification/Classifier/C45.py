@@ -22,8 +22,9 @@ class C45(Classifier):
         """
         if parameters.isPrune():
             partition = Partition(trainSet, parameters.getCrossValidationRatio(), parameters.getSeed(), True)
-            tree = DecisionTree(DecisionNode(partition.get(1)))
+            tree = DecisionTree(DecisionNode(partition.get(1), None, parameters))
             tree.prune(partition.get(0))
         else:
-            tree = DecisionTree(DecisionNode(trainSet))
+            tree = DecisionTree(DecisionNode(trainSet, None, parameters))
+        tree.compile()
         self.model = tree
@@ -2,6 +2,7 @@ from Classification.Classifier.Classifier import Classifier
 from Classification.InstanceList.InstanceList import InstanceList
 from Classification.Model.DecisionTree.DecisionNode import DecisionNode
 from Classification.Model.DecisionTree.DecisionTree import DecisionTree
+from Classification.Parameter.DecisionTreeParameter import DecisionTreeParameter
 from Classification.Parameter.Parameter import Parameter
 
 
@@ -16,6 +17,12 @@ class C45Stump(Classifier):
         trainSet : InstanceList
             Training data given to the algorithm.
         parameters: Parameter
-            Parameter of the C45Stump algorithm.
+            Parameter of the C45Stump algorithm. If it is a DecisionTreeParameter, its options such as presorting are
+            used.
         """
-        self.model = DecisionTree(DecisionNode(trainSet, None, None, True))
+        if isinstance(parameters, DecisionTreeParameter):
+            tree = DecisionTree(DecisionNode(trainSet, None, parameters, True))
+        else:
+            tree = DecisionTree(DecisionNode(trainSet, None, None, True))
+        tree.compile()
+        self.model = tree
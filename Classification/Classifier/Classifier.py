@@ -54,9 +54,10 @@ class Classifier(object):
         """
         classLabels = testSet.getUnionOfPossibleClassLabels()
         confusion = ConfusionMatrix(classLabels)
-        for i in range(testSet.size()):
-            instance = testSet.get(i)
-            confusion.classify(instance.getClassLabel(), self.model.predict(instance))
+        instances = list(testSet.getInstances())
+        predictions = self.model.predictBatch(instances)
+        for i in range(len(instances)):
+            confusion.classify(instances[i].getClassLabel(), predictions[i])
         return DetailedClassificationPerformance(confusion)
 
     def singleRun(self, parameter: Parameter, trainSet: InstanceList, testSet: InstanceList) -> Performance:
@@ -17,4 +17,6 @@ class Knn(Classifier):
         parameters : KnnParameter
             Parameters of the Knn algorithm.
         """
-        self.model = KnnModel(trainSet, parameters.getK(), parameters.getDistanceMetric())
+        self.model = KnnModel(trainSet, parameters.getK(), parameters.getDistanceMetric(), parameters.isUseIndex(),
+                              parameters.getBlockSize(), parameters.getHashTables(), parameters.getHashBits(),
+                              parameters.getSeed())
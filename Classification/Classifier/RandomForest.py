@@ -1,7 +1,6 @@
 from Classification.Classifier.Classifier import Classifier
 from Classification.InstanceList.InstanceList import InstanceList
-from Classification.Model.DecisionTree.DecisionNode import DecisionNode
-from Classification.Model.DecisionTree.DecisionTree import DecisionTree
+from Classification.Model.DecisionTree.ForestBuilder import ForestBuilder
 from Classification.Model.TreeEnsembleModel import TreeEnsembleModel
 from Classification.Parameter.RandomForestParameter import RandomForestParameter
 
@@ -12,18 +11,17 @@ class RandomForest(Classifier):
         """
         Training algorithm for random forest classifier. Basically the algorithm creates K distinct decision trees from
         K bootstrap samples of the original training set.
+        The out-of-bag performance of the forest is computed from the instances left out of the bootstrap samples
+        and stored in the model.
 
         PARAMETERS
         ----------
         trainSet : InstanceList
             Training data given to the algorithm
         parameters : RandomForestParameter
-            Parameters of the bagging trees algorithm. ensembleSize returns the number of trees in the random forest.
+            Parameters of the bagging trees algorithm. ensembleSize returns the number of trees in the random forest,
+            workers the number of processes training them.
         """
-        forestSize = parameters.getEnsembleSize()
-        forest = []
-        for i in range(forestSize):
-            bootstrap = trainSet.bootstrap(i)
-            tree = DecisionTree(DecisionNode(InstanceList(bootstrap.getSample()), None, parameters, False))
-            forest.append(tree)
-        self.model = TreeEnsembleModel(forest)
+        builder = ForestBuilder(trainSet, parameters)
+        forest = builder.build()
+        self.model = TreeEnsembleModel(forest, builder.outOfBagPerformance(forest))
@@ -0,0 +1,175 @@
+import os
+
+from Classification.Attribute.AttributeType import AttributeType
+from Classification.DataSet.DataDefinition import DataDefinition
+from Classification.InstanceList.ColumnarInstanceList import ColumnarInstanceList
+from Classification.InstanceList.InstanceList import InstanceList
+
+
+class ChunkedReader(object):
+
+    __fileName: str
+    __separator: str
+    __definition: DataDefinition
+    __memoryBudget: int
+    __bufferSize: int
+    __progress: object
+    INSTANCE_SIZE = 200
+    ATTRIBUTE_SIZE = 180
+    COLUMNAR_INSTANCE_SIZE = 160
+    COLUMNAR_ATTRIBUTE_SIZE = 8
+
+    def __init__(self, fileName: str, separator: str = ",", definition: DataDefinition = None,
+                 memoryBudget: int = 64 * 1024 * 1024, bufferSize: int = 1024 * 1024, progress=None):
+        """
+        Constructor for a streaming reader of a data file. The file is read in fixed-size byte chunks, so neither the
+        whole file nor all of its lines are kept in memory. The instances are returned in blocks whose estimated size
+        does not exceed the given memory budget.
+
+        PARAMETERS
+        ----------
+        fileName : str
+            Name of the data set file.
+        separator : str
+            Separator character which separates the attribute values in the data file.
+        definition : DataDefinition
+            Data definition of the data set. If it is None, the attribute types are determined from the first line
+            of the file; attributes that can be parsed as float are continuous, the others are discrete.
+        memoryBudget : int
+            Approximate number of bytes that a single block of instances may occupy.
+        bufferSize : int
+            Number of bytes read from the file at once.
+        progress
+            Function called with the number of bytes read so far and the size of the file, after each chunk of the
+            file is processed.
+        """
+        self.__fileName = fileName
+        self.__separator = separator
+        self.__definition = definition
+        self.__memoryBudget = memoryBudget
+        self.__bufferSize = bufferSize
+        self.__progress = progress
+
+    def getDataDefinition(self) -> DataDefinition:
+        """
+        Accessor for the data definition. If the definition is determined from the file, it is available after the
+        first line is read.
+
+        RETURNS
+        -------
+        DataDefinition
+            Data definition of the data set.
+        """
+        return self.__definition
+
+    def lines(self):
+        """
+        Generator that reads the file chunk by chunk and returns its lines one by one. The progress function, if
+        given, is called after the lines of each chunk are consumed.
+
+        RETURNS
+        -------
+        generator
+            Lines of the file without the line separators.
+        """
+        total = os.path.getsize(self.__fileName)
+        file = open(self.__fileName, 'rb')
+        bytesRead = 0
+        remainder = b""
+        chunk = file.read(self.__bufferSize)
+        while len(chunk) > 0:
+            bytesRead += len(chunk)
+            lines = (remainder + chunk).split(b"\n")
+            remainder = lines.pop()
+            for line in lines:
+                yield line.decode('utf8').strip()
+            if self.__progress is not None:
+                self.__progress(bytesRead, total)
+            chunk = file.read(self.__bufferSize)
+        file.close()
+        if len(remainder) > 0:
+            yield remainder.decode('utf8').strip()
+
+    def __setDefinition(self, attributeList: list):
+        """
+        Determines the attribute types from the items of the first line. Items that can be parsed as float are
+        continuous attributes, the others are discrete attributes. The last item is the class label.
+
+        PARAMETERS
+        ----------
+        attributeList : list
+            Items of the first line.
+        """
+        attributeTypes = []
+        for i in range(len(attributeList) - 1):
+            try:
+                float(attributeList[i])
+                attributeTypes.append(AttributeType.CONTINUOUS)
+            except ValueError:
+                attributeTypes.append(AttributeType.DISCRETE)
+        self.__definition = DataDefinition(attributeTypes)
+
+    def blockSize(self, columnar: bool = False) -> int:
+        """
+        Estimates the number of instances that fit into the memory budget.
+
+        PARAMETERS
+        ----------
+        columnar : bool
+            If true, the size is estimated for columnar blocks.
+
+        RETURNS
+        -------
+        int
+            Number of instances in a block.
+        """
+        if columnar:
+            instanceSize = self.COLUMNAR_INSTANCE_SIZE + self.COLUMNAR_ATTRIBUTE_SIZE * \
+                           self.__definition.attributeCount()
+        else:
+            instanceSize = self.INSTANCE_SIZE + self.ATTRIBUTE_SIZE * self.__definition.attributeCount()
+        return max(1, self.__memoryBudget // instanceSize)
+
+    def chunks(self, columnar: bool = False):
+        """
+        Generator that builds the instances of the file incrementally and returns them in blocks. Each block is a new
+        InstanceList (or ColumnarInstanceList) with at most blockSize instances, so a consumer that processes the
+        blocks one by one never holds the whole data set in memory. Lines whose number of items does not match the
+        data definition are skipped.
+
+        PARAMETERS
+        ----------
+        columnar : bool
+            If true, the blocks are ColumnarInstanceLists.
+
+        RETURNS
+        -------
+        generator
+            Blocks of instances.
+        """
+        block = None
+        size = 0
+        sharedValues = None
+        for line in self.lines():
+            attributeList = line.split(self.__separator)
+            if self.__definition is None:
+                self.__setDefinition(attributeList)
+            if len(attributeList) != self.__definition.attributeCount() + 1:
+                continue
+            if sharedValues is None:
+                sharedValues = [{} for _ in range(len(attributeList))]
+            if block is None:
+                size = self.blockSize(columnar)
+                if columnar:
+                    block = ColumnarInstanceList(self.__definition)
+                else:
+                    block = InstanceList()
+            if columnar:
+                block.addRow(attributeList)
+            else:
+                block.add(InstanceList.parseInstance(self.__definition, attributeList, sharedValues))
+            if block.size() >= size:
+                yield block
+                block = None
+        if block is not None:
+            yield block
@@ -1,5 +1,9 @@
 from __future__ import annotations
+import os
 from Classification.FeatureSelection.FeatureSubSet import FeatureSubSet
+from Classification.DataSet.ChunkedReader import ChunkedReader
+from Classification.DataSet.ParallelReader import ParallelReader
+from Classification.InstanceList.ColumnarInstanceList import ColumnarInstanceList
 from Classification.InstanceList.InstanceList import InstanceList
 from Classification.DataSet.DataDefinition import DataDefinition
 from Classification.Attribute.AttributeType import AttributeType
@@ -16,7 +20,8 @@ class DataSet(object):
     __instances: InstanceList
     __definition: DataDefinition
 
-    def __init__(self, definition: DataDefinition = None, separator: str = None, fileName: str = None):
+    def __init__(self, definition: DataDefinition = None, separator: str = None, fileName: str = None,
+                 columnar: bool = False, cache: bool = False, workers: int = 1):
         """
         Constructor for generating a new DataSet with given DataDefinition.
 
@@ -28,13 +33,102 @@ class DataSet(object):
             Separator character which separates the attribute values in the data file.
         fileName : str
             Name of the data set file.
+        columnar : bool
+            If true, the instances are stored in a ColumnarInstanceList, that is, in float and integer coded arrays
+            per attribute instead of an Instance object per line.
+        cache : bool
+            If true, the instances are stored in a binary sidecar file next to the data file (fileName + ".bin") and
+            later data sets are loaded from that file without parsing. The sidecar file is rebuilt when the size or the
+            modification time of the data file changes. Cached data sets are always columnar.
+        workers : int
+            Number of processes used to parse the data file. If it is more than 1, the file is split into byte ranges
+            parsed in parallel, and the instances are stored in a ColumnarInstanceList.
         """
         self.__definition = definition
-        if separator is None:
+        if cache and fileName is not None:
+            self.__instances = self.__cachedInstances(separator, fileName, workers)
+        elif workers > 1 and fileName is not None:
+            self.__instances = ParallelReader(fileName, separator, definition, workers).read()
+        elif columnar:
+            self.__instances = ColumnarInstanceList(definition, separator, fileName)
+        elif separator is None:
             self.__instances = InstanceList()
         else:
             self.__instances = InstanceList(definition, separator, fileName)
 
+    def __cachedInstances(self, separator: str, fileName: str, workers: int) -> ColumnarInstanceList:
+        """
+        Returns the instances of the given data file from its binary sidecar file. If the sidecar file does not exist,
+        was created from a different version of the data file or with a different data definition, the data file is
+        parsed and the sidecar file is written again.
+
+        PARAMETERS
+        ----------
+        separator : str
+            Separator character which separates the attribute values in the data file.
+        fileName : str
+            Name of the data set file.
+        workers : int
+            Number of processes used to parse the data file.
+
+        RETURNS
+        -------
+        ColumnarInstanceList
+            Instances of the data file.
+        """
+        status = os.stat(fileName)
+        source = {"size": status.st_size, "mtime": status.st_mtime_ns, "separator": separator}
+        cacheName = fileName + ".bin"
+        if os.path.exists(cacheName):
+            header = ColumnarInstanceList.readHeader(cacheName)
+            if header is not None and header["source"] == source and header["attributeTypes"] == \
+                    [self.__definition.getAttributeType(i).name for i in range(self.__definition.attributeCount())]:
+                return ColumnarInstanceList.load(cacheName)
+        if workers > 1:
+            instances = ParallelReader(fileName, separator, self.__definition, workers).read()
+        else:
+            instances = ColumnarInstanceList(self.__definition, separator, fileName)
+        instances.save(cacheName, source)
+        return instances
+
+    def save(self, fileName: str):
+        """
+        Writes the data set to a binary file, which can be loaded with the load method without parsing. Discrete
+        values and class labels are stored as integer codes, continuous values as raw floats.
+
+        PARAMETERS
+        ----------
+        fileName : str
+            Name of the binary file.
+        """
+        if isinstance(self.__instances, ColumnarInstanceList):
+            self.__instances.save(fileName)
+        else:
+            instances = ColumnarInstanceList(self.__definition)
+            instances.addAll(self.__instances.getInstances())
+            instances.save(fileName)
+
+    @staticmethod
+    def load(fileName: str) -> DataSet:
+        """
+        Loads a data set from a binary file written by the save method. The columns are memory mapped, so only the
+        header of the file is parsed.
+
+        PARAMETERS
+        ----------
+        fileName : str
+            Name of the binary file.
+
+        RETURNS
+        -------
+        DataSet
+            Data set stored in the file.
+        """
+        instances = ColumnarInstanceList.load(fileName)
+        result = DataSet(instances.getDataDefinition())
+        result.__instances = instances
+        return result
+
     def initWithFile(self, fileName: str):
         """
         Constructor for generating a new DataSet from given File.
@@ -47,9 +141,9 @@ class DataSet(object):
         self.__instances = InstanceList()
         self.__definition = DataDefinition()
         inputFile = open(fileName, 'r', encoding='utf8')
-        lines = inputFile.readlines()
+        sharedValues = []
         i = 0
-        for line in lines:
+        for line in inputFile:
             attributes = line.split(",")
             if i == 0:
                 for j in range(len(attributes) - 1):
@@ -58,6 +152,7 @@ class DataSet(object):
                         self.__definition.addAttribute(AttributeType.CONTINUOUS)
                     except:
                         self.__definition.addAttribute(AttributeType.DISCRETE)
+                    sharedValues.append({})
             else:
                 if len(attributes) != self.__definition.attributeCount() + 1:
                     continue
@@ -70,10 +165,42 @@ class DataSet(object):
                 if self.__definition.getAttributeType(j) is AttributeType.CONTINUOUS:
                     instance.addAttribute(ContinuousAttribute(float(attributes[j])))
                 elif self.__definition.getAttributeType(j) is AttributeType.DISCRETE:
-                    instance.addAttribute(DiscreteAttribute(attributes[j]))
+                    if attributes[j] not in sharedValues[j]:
+                        sharedValues[j][attributes[j]] = DiscreteAttribute(attributes[j])
+                    instance.addAttribute(sharedValues[j][attributes[j]])
             if instance.attributeSize() == self.__definition.attributeCount():
                 self.__instances.add(instance)
             i = i + 1
+        inputFile.close()
+
+    def iterChunks(self, fileName: str, separator: str = ",", memoryBudget: int = 64 * 1024 * 1024, progress=None,
+                   columnar: bool = False):
+        """
+        Streams the given data file in blocks of instances without building the whole instance list. The data
+        definition of this data set is used to parse the lines; if the data set has no definition, the attribute
+        types are determined from the first line of the file. Classifiers that can train incrementally may consume the
+        blocks one by one.
+
+        PARAMETERS
+        ----------
+        fileName : str
+            Name of the data set file.
+        separator : str
+            Separator character which separates the attribute values in the data file.
+        memoryBudget : int
+            Approximate number of bytes that a single block of instances may occupy.
+        progress
+            Function called with the number of bytes read so far and the size of the file.
+        columnar : bool
+            If true, the blocks are ColumnarInstanceLists.
+
+        RETURNS
+        -------
+        generator
+            Blocks of instances as InstanceList or ColumnarInstanceList.
+        """
+        reader = ChunkedReader(fileName, separator, self.__definition, memoryBudget, progress=progress)
+        return reader.chunks(columnar)
 
     def __checkDefinition(self, instance: Instance) -> bool:
         """
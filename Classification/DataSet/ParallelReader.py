@@ -0,0 +1,149 @@
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+from Classification.Attribute.AttributeType import AttributeType
+from Classification.DataSet.DataDefinition import DataDefinition
+from Classification.DataSet.SymbolTable import SymbolTable
+from Classification.InstanceList.ColumnarInstanceList import ColumnarInstanceList
+
+
+class ParallelReader(object):
+
+    __fileName: str
+    __separator: str
+    __definition: DataDefinition
+    __workers: int
+
+    def __init__(self, fileName: str, separator: str, definition: DataDefinition, workers: int = None):
+        """
+        Constructor for a reader that parses a data file with several processes. The file is split at line
+        boundaries into byte ranges, each range is parsed into columns by a separate process, and the blocks are
+        merged in the original order of the file.
+
+        PARAMETERS
+        ----------
+        fileName : str
+            Name of the data set file.
+        separator : str
+            Separator character which separates the attribute values in the data file.
+        definition : DataDefinition
+            Data definition of the data set.
+        workers : int
+            Number of processes. If None, the number of processors is used.
+        """
+        self.__fileName = fileName
+        self.__separator = separator
+        self.__definition = definition
+        if workers is None:
+            workers = os.cpu_count()
+        self.__workers = max(1, workers)
+
+    def byteRanges(self) -> list:
+        """
+        Splits the file into at most workers byte ranges of approximately equal size. Each range except the first
+        starts after a line separator and each range except the last ends after a line separator.
+
+        RETURNS
+        -------
+        list
+            List of (start, end) byte offsets.
+        """
+        size = os.path.getsize(self.__fileName)
+        boundaries = [0]
+        file = open(self.__fileName, 'rb')
+        for i in range(1, self.__workers):
+            position = size * i // self.__workers
+            if position <= boundaries[len(boundaries) - 1]:
+                continue
+            file.seek(position - 1)
+            file.readline()
+            position = file.tell()
+            if boundaries[len(boundaries) - 1] < position < size:
+                boundaries.append(position)
+        file.close()
+        boundaries.append(size)
+        return [(boundaries[i], boundaries[i + 1]) for i in range(len(boundaries) - 1)]
+
+    @staticmethod
+    def parseRange(fileName: str, separator: str, attributeTypes: list, start: int, end: int) -> tuple:
+        """
+        Parses the lines in the given byte range of the file into columns. Discrete values and class labels are coded
+        with symbol tables local to the range, in the order of their first occurrence. Lines whose number of items does
+        not match the attribute types are skipped.
+
+        PARAMETERS
+        ----------
+        fileName : str
+            Name of the data set file.
+        separator : str
+            Separator character which separates the attribute values in the data file.
+        attributeTypes : list
+            Names of the attribute types.
+        start : int
+            Offset of the first byte of the range.
+        end : int
+            Offset after the last byte of the range.
+
+        RETURNS
+        -------
+        tuple
+            Columns, distinct values of the discrete attributes, class labels and the class label codes.
+        """
+        file = open(fileName, 'rb')
+        file.seek(start)
+        text = file.read(end - start).decode('utf8')
+        file.close()
+        types = [AttributeType[name] for name in attributeTypes]
+        columns = []
+        symbols = []
+        for attributeType in types:
+            if attributeType is AttributeType.CONTINUOUS:
+                columns.append(array('d'))
+                symbols.append(None)
+            else:
+                columns.append(array('i'))
+                symbols.append(SymbolTable())
+        classSymbols = SymbolTable()
+        classColumn = array('i')
+        for line in text.split("\n"):
+            values = line.strip().split(separator)
+            if len(values) != len(types) + 1:
+                continue
+            for i in range(len(types)):
+                if types[i] is AttributeType.CONTINUOUS:
+                    columns[i].append(float(values[i]))
+                else:
+                    if types[i] is AttributeType.BINARY:
+                        value = str(values[i] in ["True", "true", "Yes", "yes", "y", "Y"])
+                    else:
+                        value = values[i]
+                    columns[i].append(symbols[i].getCode(value))
+            classColumn.append(classSymbols.getCode(values[len(types)]))
+        attributeValues = [None if symbolTable is None else symbolTable.getSymbols() for symbolTable in symbols]
+        return columns, attributeValues, classSymbols.getSymbols(), classColumn
+
+    def read(self) -> ColumnarInstanceList:
+        """
+        Parses the file in parallel and merges the blocks in the order of the byte ranges. The codes of each block
+        are mapped to the codes of the merged symbol tables, so the result is the same as parsing the file with a
+        single process.
+
+        RETURNS
+        -------
+        ColumnarInstanceList
+            Instances of the data file.
+        """
+        result = ColumnarInstanceList(self.__definition)
+        attributeTypes = [self.__definition.getAttributeType(i).name for i in range(self.__definition.attributeCount())]
+        ranges = self.byteRanges()
+        if len(ranges) == 1:
+            result.addBlock(*ParallelReader.parseRange(self.__fileName, self.__separator, attributeTypes,
+                                                       ranges[0][0], ranges[0][1]))
+            return result
+        with ProcessPoolExecutor(max_workers=len(ranges)) as executor:
+            futures = [executor.submit(ParallelReader.parseRange, self.__fileName, self.__separator, attributeTypes,
+                                       start, end) for start, end in ranges]
+            for future in futures:
+                result.addBlock(*future.result())
+        return result
@@ -0,0 +1,121 @@
+import sys
+
+
+class SymbolTable(object):
+
+    __symbols: list
+    __codes: dict
+
+    def __init__(self, symbols=None):
+        """
+        Constructor for a symbol table, which maps each distinct string, such as a class label or a discrete attribute
+        value, to a small integer code. Codes are given in the order of first occurrence, so the symbols of a table
+        built from a list are in the same order as the distinct items of that list. The stored strings are interned,
+        therefore all instances sharing a value share the same string object.
+
+        PARAMETERS
+        ----------
+        symbols
+            Optional iterable of symbols to be added to the table.
+        """
+        self.__symbols = []
+        self.__codes = {}
+        if symbols is not None:
+            for symbol in symbols:
+                self.getCode(symbol)
+
+    def getCode(self, symbol: str) -> int:
+        """
+        Returns the code of the given symbol. If the symbol is not in the table, it is added with the next code.
+
+        PARAMETERS
+        ----------
+        symbol : str
+            Symbol whose code will be returned.
+
+        RETURNS
+        -------
+        int
+            Code of the symbol.
+        """
+        code = self.__codes.get(symbol)
+        if code is None:
+            code = len(self.__symbols)
+            if isinstance(symbol, str):
+                symbol = sys.intern(symbol)
+            self.__codes[symbol] = code
+            self.__symbols.append(symbol)
+        return code
+
+    def indexOf(self, symbol: str) -> int:
+        """
+        Returns the code of the given symbol without adding it to the table.
+
+        PARAMETERS
+        ----------
+        symbol : str
+            Symbol to search for.
+
+        RETURNS
+        -------
+        int
+            Code of the symbol, -1 if the symbol is not in the table.
+        """
+        return self.__codes.get(symbol, -1)
+
+    def intern(self, symbol: str) -> str:
+        """
+        Returns the string object stored in the table for the given symbol, adding the symbol if it is new.
+
+        PARAMETERS
+        ----------
+        symbol : str
+            Symbol to be interned.
+
+        RETURNS
+        -------
+        str
+            Shared string object equal to the symbol.
+        """
+        return self.__symbols[self.getCode(symbol)]
+
+    def getSymbol(self, code: int) -> str:
+        """
+        Returns the symbol with the given code.
+
+        PARAMETERS
+        ----------
+        code : int
+            Code of the symbol.
+
+        RETURNS
+        -------
+        str
+            Symbol with the given code.
+        """
+        return self.__symbols[code]
+
+    def getSymbols(self) -> list:
+        """
+        Accessor for the symbols in the order of their codes.
+
+        RETURNS
+        -------
+        list
+            Symbols of the table.
+        """
+        return self.__symbols
+
+    def size(self) -> int:
+        """
+        Returns the number of symbols in the table.
+
+        RETURNS
+        -------
+        int
+            Number of symbols.
+        """
+        return len(self.__symbols)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self.__codes
@@ -19,6 +19,17 @@ class MahalanobisDistance(DistanceMetric):
         """
         self.__covarianceInverse = covarianceInverse
 
+    def getCovarianceInverse(self) -> Matrix:
+        """
+        Accessor for the inverse of the covariance matrix.
+
+        RETURNS
+        -------
+        Matrix
+            Inverse of the covariance matrix.
+        """
+        return self.__covarianceInverse
+
     def distance(self, instance1: Instance, instance2: Instance) -> float:
         """
         Calculates Mahalanobis distance between two instances. (x^(1) - x^(2)) S (x^(1) - x^(2))^T
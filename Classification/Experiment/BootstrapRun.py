@@ -1,8 +1,7 @@
 from Classification.Experiment.MultipleRun import MultipleRun
 from Classification.Experiment.Experiment import Experiment
 from Classification.Performance.ExperimentPerformance import ExperimentPerformance
-from Sampling.Bootstrap import Bootstrap
-from Classification.InstanceList.InstanceList import InstanceList
+from Classification.InstanceList.InstanceListView import InstanceListView
 
 
 class BootstrapRun(MultipleRun):
@@ -36,8 +35,8 @@ class BootstrapRun(MultipleRun):
         """
         result = ExperimentPerformance()
         for i in range(self.__numberOfBootstraps):
-            bootstrap = Bootstrap(experiment.getDataSet().getInstances(), i + experiment.getParameter().getSeed())
-            bootstrapSample = InstanceList(bootstrap.getSample())
+            bootstrapSample = InstanceListView.bootstrap(experiment.getDataSet().getInstanceList(),
+                                                         i + experiment.getParameter().getSeed())
             experiment.getClassifier().train(bootstrapSample, experiment.getParameter())
             result.add(experiment.getClassifier().test(experiment.getDataSet().getInstanceList()))
         return result
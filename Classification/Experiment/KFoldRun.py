@@ -1,10 +1,9 @@
 from Sampling.CrossValidation import CrossValidation
-from Sampling.KFoldCrossValidation import KFoldCrossValidation
 
 from Classification.Classifier.Classifier import Classifier
 from Classification.Experiment.Experiment import Experiment
 from Classification.Experiment.MultipleRun import MultipleRun
-from Classification.InstanceList.InstanceList import InstanceList
+from Classification.InstanceList.InstanceListKFoldCrossValidation import InstanceListKFoldCrossValidation
 from Classification.Parameter.Parameter import Parameter
 from Classification.Performance.ExperimentPerformance import ExperimentPerformance
 
@@ -27,8 +26,8 @@ class KFoldRun(MultipleRun):
     def runExperiment(self, classifier: Classifier, parameter: Parameter, experimentPerformance: ExperimentPerformance,
                       crossValidation: CrossValidation):
         for i in range(self.K):
-            trainSet = InstanceList(crossValidation.getTrainFold(i))
-            testSet = InstanceList(crossValidation.getTestFold(i))
+            trainSet = crossValidation.getTrainFold(i)
+            testSet = crossValidation.getTestFold(i)
             classifier.train(trainSet, parameter)
             experimentPerformance.add(classifier.test(testSet))
 
@@ -47,7 +46,7 @@ class KFoldRun(MultipleRun):
             An ExperimentPerformance instance.
         """
         result = ExperimentPerformance()
-        crossValidation = KFoldCrossValidation(experiment.getDataSet().getInstances(), self.K, experiment.getParameter()
-                                               .getSeed())
+        crossValidation = InstanceListKFoldCrossValidation(experiment.getDataSet().getInstanceList(), self.K,
+                                                           experiment.getParameter().getSeed())
         self.runExperiment(experiment.getClassifier(), experiment.getParameter(), result, crossValidation)
         return result
@@ -1,10 +1,10 @@
 from Sampling.CrossValidation import CrossValidation
-from Sampling.KFoldCrossValidation import KFoldCrossValidation
 
 from Classification.Classifier.Classifier import Classifier
 from Classification.Experiment.Experiment import Experiment
 from Classification.Experiment.KFoldRun import KFoldRun
 from Classification.InstanceList.InstanceList import InstanceList
+from Classification.InstanceList.InstanceListKFoldCrossValidation import InstanceListKFoldCrossValidation
 from Classification.InstanceList.Partition import Partition
 from Classification.Parameter.Parameter import Parameter
 from Classification.Performance.ExperimentPerformance import ExperimentPerformance
@@ -26,7 +26,7 @@ class KFoldRunSeparateTest(KFoldRun):
     def runExperiment(self, classifier: Classifier, parameter: Parameter, experimentPerformance: ExperimentPerformance,
                       crossValidation: CrossValidation, testSet: InstanceList):
         for i in range(self.K):
-            trainSet = InstanceList(crossValidation.getTrainFold(i))
+            trainSet = crossValidation.getTrainFold(i)
             classifier.train(trainSet, parameter)
             experimentPerformance.add(classifier.test(testSet))
 
@@ -48,8 +48,7 @@ class KFoldRunSeparateTest(KFoldRun):
         result = ExperimentPerformance()
         instanceList = experiment.getDataSet().getInstanceList()
         partition = Partition(instanceList, 0.25, experiment.getParameter().getSeed(), True)
-        crossValidation = KFoldCrossValidation(partition.get(1).getInstances(), self.K, experiment.getParameter().
-                                               getSeed())
+        crossValidation = InstanceListKFoldCrossValidation(partition.get(1), self.K, experiment.getParameter().getSeed())
         self.runExperiment(experiment.getClassifier(), experiment.getParameter(), result, crossValidation,
                            partition.get(0))
         return result
@@ -1,7 +1,6 @@
-from Sampling.KFoldCrossValidation import KFoldCrossValidation
-
 from Classification.Experiment.Experiment import Experiment
 from Classification.Experiment.KFoldRun import KFoldRun
+from Classification.InstanceList.InstanceListKFoldCrossValidation import InstanceListKFoldCrossValidation
 from Classification.Performance.ExperimentPerformance import ExperimentPerformance
 
 
@@ -40,7 +39,7 @@ class MxKFoldRun(KFoldRun):
         """
         result = ExperimentPerformance()
         for j in range(self.M):
-            crossValidation = KFoldCrossValidation(experiment.getDataSet().getInstances(), self.K,
-                                                   experiment.getParameter().getSeed())
+            crossValidation = InstanceListKFoldCrossValidation(experiment.getDataSet().getInstanceList(), self.K,
+                                                               experiment.getParameter().getSeed())
             self.runExperiment(experiment.getClassifier(), experiment.getParameter(), result, crossValidation)
         return result
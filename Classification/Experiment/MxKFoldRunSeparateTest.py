@@ -1,7 +1,6 @@
-from Sampling.KFoldCrossValidation import KFoldCrossValidation
-
 from Classification.Experiment.Experiment import Experiment
 from Classification.Experiment.KFoldRunSeparateTest import KFoldRunSeparateTest
+from Classification.InstanceList.InstanceListKFoldCrossValidation import InstanceListKFoldCrossValidation
 from Classification.InstanceList.Partition import Partition
 from Classification.Performance.ExperimentPerformance import ExperimentPerformance
 
@@ -44,8 +43,8 @@ class MxKFoldRunSeparateTest(KFoldRunSeparateTest):
         instanceList = experiment.getDataSet().getInstanceList()
         partition = Partition(instanceList, 0.25, experiment.getParameter().getSeed(), True)
         for j in range(self.M):
-            crossValidation = KFoldCrossValidation(partition.get(1).getInstances(), self.K, experiment.getParameter().
-                                                   getSeed())
+            crossValidation = InstanceListKFoldCrossValidation(partition.get(1), self.K,
+                                                               experiment.getParameter().getSeed())
             self.runExperiment(experiment.getClassifier(), experiment.getParameter(), result, crossValidation,
                                partition.get(0))
         return result
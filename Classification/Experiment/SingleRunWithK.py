@@ -1,10 +1,9 @@
 from Sampling.CrossValidation import CrossValidation
-from Sampling.KFoldCrossValidation import KFoldCrossValidation
 
 from Classification.Classifier.Classifier import Classifier
 from Classification.Experiment.Experiment import Experiment
 from Classification.Experiment.SingleRun import SingleRun
-from Classification.InstanceList.InstanceList import InstanceList
+from Classification.InstanceList.InstanceListKFoldCrossValidation import InstanceListKFoldCrossValidation
 from Classification.Parameter.Parameter import Parameter
 from Classification.Performance.Performance import Performance
 
@@ -25,8 +24,8 @@ class SingleRunWithK(SingleRun):
         self.__K = K
 
     def runExperiment(self, classifier: Classifier, parameter: Parameter, crossValidation: CrossValidation):
-        trainSet = InstanceList(crossValidation.getTrainFold(0))
-        testSet = InstanceList(crossValidation.getTestFold(0))
+        trainSet = crossValidation.getTrainFold(0)
+        testSet = crossValidation.getTestFold(0)
         return classifier.singleRun(parameter, trainSet, testSet)
 
     def execute(self, experiment: Experiment) -> Performance:
@@ -44,6 +43,6 @@ class SingleRunWithK(SingleRun):
         Performance
             A Performance instance.
         """
-        crossValidation = KFoldCrossValidation(experiment.getDataSet().getInstances(), self.__K,
-                                               experiment.getParameter().getSeed())
+        crossValidation = InstanceListKFoldCrossValidation(experiment.getDataSet().getInstanceList(), self.__K,
+                                                           experiment.getParameter().getSeed())
         return self.runExperiment(experiment.getClassifier(), experiment.getParameter(), crossValidation)
@@ -1,7 +1,7 @@
-from Sampling.StratifiedKFoldCrossValidation import StratifiedKFoldCrossValidation
-
 from Classification.Experiment.Experiment import Experiment
 from Classification.Experiment.KFoldRun import KFoldRun
+from Classification.InstanceList.InstanceListStratifiedKFoldCrossValidation import \
+    InstanceListStratifiedKFoldCrossValidation
 from Classification.Performance.ExperimentPerformance import ExperimentPerformance
 
 
@@ -34,7 +34,7 @@ class StratifiedKFoldRun(KFoldRun):
             An ExperimentPerformance instance.
         """
         result = ExperimentPerformance()
-        crossValidation = StratifiedKFoldCrossValidation(experiment.getDataSet().getClassInstances(), self.K,
-                                                         experiment.getParameter().getSeed())
+        crossValidation = InstanceListStratifiedKFoldCrossValidation(experiment.getDataSet().getInstanceList(), self.K,
+                                                                     experiment.getParameter().getSeed())
         self.runExperiment(experiment.getClassifier(), experiment.getParameter(), result, crossValidation)
         return result
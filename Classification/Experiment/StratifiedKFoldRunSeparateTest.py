@@ -1,7 +1,7 @@
-from Sampling.StratifiedKFoldCrossValidation import StratifiedKFoldCrossValidation
-
 from Classification.Experiment.Experiment import Experiment
 from Classification.Experiment.KFoldRunSeparateTest import KFoldRunSeparateTest
+from Classification.InstanceList.InstanceListStratifiedKFoldCrossValidation import \
+    InstanceListStratifiedKFoldCrossValidation
 from Classification.InstanceList.Partition import Partition
 from Classification.Performance.ExperimentPerformance import ExperimentPerformance
 
@@ -37,8 +37,8 @@ class StratifiedKFoldRunSeparateTest(KFoldRunSeparateTest):
         result = ExperimentPerformance()
         instanceList = experiment.getDataSet().getInstanceList()
         partition = Partition(instanceList, 0.25, experiment.getParameter().getSeed(), True)
-        crossValidation = StratifiedKFoldCrossValidation(Partition(partition.get(1)).getLists(), self.K,
-                                                         experiment.getParameter().getSeed())
+        crossValidation = InstanceListStratifiedKFoldCrossValidation(partition.get(1), self.K,
+                                                                     experiment.getParameter().getSeed())
         self.runExperiment(experiment.getClassifier(), experiment.getParameter(), result, crossValidation,
                            partition.get(0))
         return result
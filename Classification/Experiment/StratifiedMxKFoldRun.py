@@ -1,7 +1,7 @@
-from Sampling.StratifiedKFoldCrossValidation import StratifiedKFoldCrossValidation
-
 from Classification.Experiment.Experiment import Experiment
 from Classification.Experiment.MxKFoldRun import MxKFoldRun
+from Classification.InstanceList.InstanceListStratifiedKFoldCrossValidation import \
+    InstanceListStratifiedKFoldCrossValidation
 from Classification.Performance.ExperimentPerformance import ExperimentPerformance
 
 
@@ -38,7 +38,7 @@ class StratifiedMxKFoldRun(MxKFoldRun):
         """
         result = ExperimentPerformance()
         for j in range(self.M):
-            crossValidation = StratifiedKFoldCrossValidation(experiment.getDataSet().getClassInstances(), self.K,
-                                                             experiment.getParameter().getSeed())
+            crossValidation = InstanceListStratifiedKFoldCrossValidation(experiment.getDataSet().getInstanceList(), self.K,
+                                                                         experiment.getParameter().getSeed())
             self.runExperiment(experiment.getClassifier(), experiment.getParameter(), result, crossValidation)
         return result
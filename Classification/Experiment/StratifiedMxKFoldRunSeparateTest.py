@@ -1,7 +1,7 @@
-from Sampling.StratifiedKFoldCrossValidation import StratifiedKFoldCrossValidation
-
 from Classification.Experiment.Experiment import Experiment
 from Classification.Experiment.StratifiedKFoldRunSeparateTest import StratifiedKFoldRunSeparateTest
+from Classification.InstanceList.InstanceListStratifiedKFoldCrossValidation import \
+    InstanceListStratifiedKFoldCrossValidation
 from Classification.InstanceList.Partition import Partition
 from Classification.Performance.ExperimentPerformance import ExperimentPerformance
 
@@ -30,8 +30,8 @@ class StratifiedMxKFoldRunSeparateTest(StratifiedKFoldRunSeparateTest):
         for j in range(self.M):
             instanceList = experiment.getDataSet().getInstanceList()
             partition = Partition(instanceList, 0.25, experiment.getParameter().getSeed(), True)
-            crossValidation = StratifiedKFoldCrossValidation(Partition(partition.get(1)).getLists(), self.K,
-                                                             experiment.getParameter().getSeed())
+            crossValidation = InstanceListStratifiedKFoldCrossValidation(partition.get(1), self.K,
+                                                                         experiment.getParameter().getSeed())
             self.runExperiment(experiment.getClassifier(), experiment.getParameter(), result, crossValidation,
                                partition.get(0))
         return result
@@ -1,7 +1,6 @@
-from Sampling.StratifiedKFoldCrossValidation import StratifiedKFoldCrossValidation
-
 from Classification.Experiment.Experiment import Experiment
-from Classification.InstanceList.InstanceList import InstanceList
+from Classification.InstanceList.InstanceListStratifiedKFoldCrossValidation import \
+    InstanceListStratifiedKFoldCrossValidation
 from Classification.Performance.Performance import Performance
 
 
@@ -35,8 +34,8 @@ class StratifiedSingleRunWithK:
         Performance
             A Performance instance.
         """
-        crossValidation = StratifiedKFoldCrossValidation(experiment.getDataSet().getClassInstances(), self.__K,
-                                                         experiment.getParameter().getSeed())
-        trainSet = InstanceList(crossValidation.getTrainFold(0))
-        testSet = InstanceList(crossValidation.getTestFold(0))
+        crossValidation = InstanceListStratifiedKFoldCrossValidation(experiment.getDataSet().getInstanceList(), self.__K,
+                                                                     experiment.getParameter().getSeed())
+        trainSet = crossValidation.getTrainFold(0)
+        testSet = crossValidation.getTestFold(0)
         return experiment.getClassifier().singleRun(experiment.getParameter(), trainSet, testSet)
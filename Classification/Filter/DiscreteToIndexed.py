@@ -6,6 +6,8 @@ from Classification.Instance.Instance import Instance
 
 class DiscreteToIndexed(LaryFilter):
 
+    __indexedAttributes: list
+
     def __init__(self, dataSet: DataSet):
         """
         Constructor for discrete to indexed filter.
@@ -16,10 +18,12 @@ class DiscreteToIndexed(LaryFilter):
             The dataSet whose instances whose discrete attributes will be converted to indexed attributes
         """
         super().__init__(dataSet)
+        self.__indexedAttributes = [{} for _ in range(len(self.attributeDistributions))]
 
     def convertInstance(self, instance: Instance):
         """
-        Converts discrete attributes of a single instance to indexed version.
+        Converts discrete attributes of a single instance to indexed version. Indexed attributes are immutable, so all
+        instances with the same value of an attribute share one DiscreteIndexedAttribute object.
 
         PARAMETERS
         ----------
@@ -29,7 +33,10 @@ class DiscreteToIndexed(LaryFilter):
         size = instance.attributeSize()
         for i in range(size):
             if len(self.attributeDistributions[i]) > 0:
-                index = self.attributeDistributions[i].getIndex(instance.getAttribute(i).__str__())
-                instance.addAttribute(DiscreteIndexedAttribute(instance.getAttribute(i).__str__(), index,
-                                                               len(self.attributeDistributions[i])))
+                value = instance.getAttribute(i).__str__()
+                if value not in self.__indexedAttributes[i]:
+                    index = self.attributeDistributions[i].getIndex(value)
+                    self.__indexedAttributes[i][value] = DiscreteIndexedAttribute(value, index,
+                                                                                  len(self.attributeDistributions[i]))
+                instance.addAttribute(self.__indexedAttributes[i][value])
         self.removeDiscreteAttributesFromInstance(instance, size)
@@ -30,9 +30,10 @@ class FeatureFilter(object):
     def convert(self):
         """
         Feature converter for a list of instances. Using the abstract method convertInstance, each instance in the
-        instance list will be converted.
+        instance list will be converted. The cached statistics of the instance list are invalidated afterwards.
         """
         instances = self.dataSet.getInstances()
         for instance in instances:
             self.convertInstance(instance)
         self.convertDataDefinition()
+        self.dataSet.getInstanceList().invalidateStatistics()
@@ -0,0 +1,177 @@
+from __future__ import annotations
+from Math.Vector import Vector
+
+from Classification.Attribute.Attribute import Attribute
+from Classification.FeatureSelection.FeatureSubSet import FeatureSubSet
+from Classification.Instance.Instance import Instance
+
+
+class ColumnarInstance(Instance):
+
+    __slots__ = ("__data", "row")
+
+    __data: ColumnarInstanceList
+    row: int
+
+    def __init__(self, data, row: int):
+        """
+        Constructor for a lightweight row view of a columnar instance list. The view does not store the attributes or
+        the class label, all accessors read the given row from the columns of the instance list.
+
+        PARAMETERS
+        ----------
+        data : ColumnarInstanceList
+            Columnar instance list that stores the values of the instance.
+        row : int
+            Row of the instance in the columns of the instance list.
+        """
+        self.__data = data
+        self.row = row
+
+    def getInstanceList(self):
+        """
+        Accessor for the columnar instance list that stores the values of the instance.
+
+        RETURNS
+        -------
+        ColumnarInstanceList
+            Instance list of the row view.
+        """
+        return self.__data
+
+    def addAttribute(self, attribute: Attribute):
+        """
+        The attributes of a row view are determined by the columns of its instance list, therefore attributes can
+        not be added to a row view.
+
+        PARAMETERS
+        ----------
+        attribute : Attribute
+            Attribute to be added.
+        """
+        raise TypeError("Attributes can not be added to a columnar instance.")
+
+    def removeAttribute(self, index: int):
+        """
+        The attributes of a row view are determined by the columns of its instance list, therefore attributes can
+        not be removed from a row view.
+
+        PARAMETERS
+        ----------
+        index : int
+            Index of the attribute to be removed.
+        """
+        raise TypeError("Attributes can not be removed from a columnar instance.")
+
+    def removeAllAttributes(self):
+        """
+        The attributes of a row view are determined by the columns of its instance list, therefore attributes can
+        not be removed from a row view.
+        """
+        raise TypeError("Attributes can not be removed from a columnar instance.")
+
+    def getAttribute(self, index: int) -> Attribute:
+        """
+        Accessor for a single attribute. Continuous attributes write their new values back to the column.
+
+        PARAMETERS
+        ----------
+        index : int
+            Index of the attribute to be accessed.
+
+        RETURNS
+        -------
+        Attribute
+            Attribute with index 'index'.
+        """
+        return self.__data.getRowAttribute(self.row, index)
+
+    def attributeSize(self) -> int:
+        """
+        Returns the number of attributes, that is, the number of columns of the instance list.
+
+        RETURNS
+        -------
+        int
+            Number of attributes.
+        """
+        return self.__data.getDataDefinition().attributeCount()
+
+    def continuousAttributeSize(self) -> int:
+        """
+        Returns the number of continuous attributes.
+
+        RETURNS
+        -------
+        int
+            Number of continuous attributes.
+        """
+        return self.__data.getDataDefinition().continuousAttributeCount()
+
+    def continuousAttributes(self) -> list:
+        """
+        Returns the values of the continuous attributes of the row.
+
+        RETURNS
+        -------
+        list
+            Values of the continuous attributes.
+        """
+        return self.__data.getRowContinuousAttributes(self.row)
+
+    def getClassLabel(self) -> str:
+        """
+        Accessor for the class label.
+
+        RETURNS
+        -------
+        str
+            Class label of the instance.
+        """
+        return self.__data.getRowClassLabel(self.row)
+
+    def __str__(self) -> str:
+        """
+        Converts instance to a String.
+
+        RETURNS
+        -------
+        str
+            A string of attributes separated with comma character.
+        """
+        result = ""
+        for i in range(self.attributeSize()):
+            result = result + self.getAttribute(i).__str__() + ","
+        result = result + self.getClassLabel()
+        return result
+
+    def getSubSetOfFeatures(self, featureSubSet: FeatureSubSet) -> Instance:
+        """
+        The getSubSetOfFeatures method takes a FeatureSubSet as an input and returns a new Instance with the class
+        label and the attributes of the given featureSubSet.
+
+        PARAMETERS
+        ----------
+        featureSubSet : FeatureSubSet
+            FeatureSubSet an list of indices.
+
+        RETURNS
+        -------
+        Instance
+            result Instance.
+        """
+        result = Instance(self.getClassLabel())
+        for i in range(featureSubSet.size()):
+            result.addAttribute(self.getAttribute(featureSubSet.get(i)))
+        return result
+
+    def toVector(self) -> Vector:
+        """
+        The toVector method returns a Vector of continuous attributes.
+
+        RETURNS
+        -------
+        Vector
+            Vector of continuous attributes.
+        """
+        return Vector(self.continuousAttributes())
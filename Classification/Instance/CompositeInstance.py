@@ -3,6 +3,8 @@ from Classification.Instance.Instance import Instance
 
 class CompositeInstance(Instance):
 
+    __slots__ = ("__possibleClassLabels",)
+
     __possibleClassLabels: list
 
     def __init__(self, classLabel: str, attributes=None, possibleLabels=None):
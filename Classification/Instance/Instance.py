@@ -9,6 +9,8 @@ from Classification.FeatureSelection.FeatureSubSet import FeatureSubSet
 
 class Instance(object):
 
+    __slots__ = ("__classLabel", "__attributes")
+
     __classLabel: str
     __attributes: list
 
@@ -46,7 +48,7 @@ class Instance(object):
         value : str
             Value of the discrete attribute.
         """
-        self.__attributes.append(DiscreteAttribute(value))
+        self.addAttribute(DiscreteAttribute(value))
 
     def addContinuousAttribute(self, value: float):
         """
@@ -57,7 +59,7 @@ class Instance(object):
         value : float
             Value of the continuous attribute.
         """
-        self.__attributes.append(ContinuousAttribute(value))
+        self.addAttribute(ContinuousAttribute(value))
 
     def addAttribute(self, attribute: Attribute):
         """
@@ -80,7 +82,7 @@ class Instance(object):
             Vector that has the continuous attributes.
         """
         for i in range(vector.size()):
-            self.__attributes.append(ContinuousAttribute(vector.getValue(i)))
+            self.addAttribute(ContinuousAttribute(vector.getValue(i)))
 
     def removeAttribute(self, index: int):
         """
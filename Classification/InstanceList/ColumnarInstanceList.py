@@ -0,0 +1,921 @@
+from __future__ import annotations
+import json
+import math
+import mmap
+import sys
+from array import array
+from collections import Counter
+
+from Math.DiscreteDistribution import DiscreteDistribution
+from Math.Matrix import Matrix
+from Math.Vector import Vector
+
+from Classification.Attribute.Attribute import Attribute
+from Classification.Attribute.AttributeType import AttributeType
+from Classification.Attribute.BinaryAttribute import BinaryAttribute
+from Classification.Attribute.ColumnarContinuousAttribute import ColumnarContinuousAttribute
+from Classification.Attribute.ContinuousAttribute import ContinuousAttribute
+from Classification.Attribute.DiscreteAttribute import DiscreteAttribute
+from Classification.Attribute.DiscreteIndexedAttribute import DiscreteIndexedAttribute
+from Classification.DataSet.DataDefinition import DataDefinition
+from Classification.DataSet.SymbolTable import SymbolTable
+from Classification.Instance.ColumnarInstance import ColumnarInstance
+from Classification.Instance.Instance import Instance
+from Classification.InstanceList.ColumnarRows import ColumnarRows
+from Classification.InstanceList.ContingencyTable import ContingencyTable
+from Classification.InstanceList.Moments import Moments
+from Classification.InstanceList.InstanceList import InstanceList
+
+
+class ColumnarInstanceList(InstanceList):
+
+    __definition: DataDefinition
+    __columns: list
+    __attributeSymbols: list
+    __discreteAttributes: list
+    __classSymbols: SymbolTable
+    __classColumn: array
+    MAGIC = b"CLSCOLS1"
+
+    def __init__(self, definition: DataDefinition, separator: str = None, fileName: str = None):
+        """
+        Constructor for a columnar instance list. Instead of storing an Instance object with its own attribute objects
+        for each line of the data file, the values of each attribute are stored in a single column. Continuous
+        attributes are stored in float arrays, discrete and binary attributes are stored in integer arrays whose
+        items are codes of the values in the symbol table of that column. Class labels are also coded with a symbol
+        table.
+        The instances of the list are lightweight ColumnarInstance views, which read their row from the columns, so
+        the usual get and getInstances methods still work. The views are created only when a row is accessed, the
+        instance list itself stores only the row numbers.
+
+        PARAMETERS
+        ----------
+        definition : DataDefinition
+            Data definition of the data set.
+        separator : str
+            Separator character which separates the attribute values in the data file.
+        fileName : str
+            Name of the data set file.
+        """
+        super().__init__()
+        self.list = ColumnarRows(self)
+        self.__definition = definition
+        self.__columns = []
+        self.__attributeSymbols = []
+        self.__discreteAttributes = []
+        for i in range(definition.attributeCount()):
+            if definition.getAttributeType(i) is AttributeType.CONTINUOUS:
+                self.__columns.append(array('d'))
+                self.__attributeSymbols.append(None)
+            else:
+                self.__columns.append(array('i'))
+                self.__attributeSymbols.append(SymbolTable())
+            self.__discreteAttributes.append([])
+        self.__classSymbols = SymbolTable()
+        self.__classColumn = array('i')
+        if fileName is not None:
+            file = open(fileName, 'r', encoding='utf8')
+            for line in file:
+                values = line.strip().split(separator)
+                if len(values) == definition.attributeCount() + 1:
+                    self.addRow(values)
+            file.close()
+
+    def __valueCode(self, index: int, value: str) -> int:
+        """
+        Returns the code of the given value in the symbol table of the discrete attribute with the given index. If the
+        value is new, it is added with the next code together with its shared attribute object.
+
+        PARAMETERS
+        ----------
+        index : int
+            Index of the discrete attribute.
+        value : str
+            Value of the discrete attribute.
+
+        RETURNS
+        -------
+        int
+            Code of the value.
+        """
+        symbols = self.__attributeSymbols[index]
+        code = symbols.getCode(value)
+        if code == len(self.__discreteAttributes[index]):
+            if self.__definition.getAttributeType(index) is AttributeType.BINARY:
+                self.__discreteAttributes[index].append(BinaryAttribute(value == "True"))
+            else:
+                self.__discreteAttributes[index].append(DiscreteAttribute(symbols.getSymbol(code)))
+        return code
+
+    def addRow(self, values: list):
+        """
+        Adds a new row to the columns and a row view for it to the instance list. The values are the string items of a
+        line of the data file, the last item is the class label.
+
+        PARAMETERS
+        ----------
+        values : list
+            Attribute values and the class label as strings.
+        """
+        if not isinstance(self.__classColumn, array):
+            self.__copyColumns()
+        for i in range(len(values) - 1):
+            attributeType = self.__definition.getAttributeType(i)
+            if attributeType is AttributeType.CONTINUOUS:
+                self.__columns[i].append(float(values[i]))
+            elif attributeType is AttributeType.BINARY:
+                self.__columns[i].append(self.__valueCode(i, str(values[i] in ["True", "true", "Yes", "yes", "y",
+                                                                               "Y"])))
+            else:
+                self.__columns[i].append(self.__valueCode(i, values[i]))
+        self.__classColumn.append(self.__classSymbols.getCode(values[len(values) - 1]))
+        self.list.appendRow(len(self.__classColumn) - 1)
+        self.invalidateStatistics()
+
+    def addBlock(self, columns: list, attributeValues: list, classLabels: list, classColumn: array):
+        """
+        Appends a block of rows parsed separately, for example by another process. The discrete values and the class
+        labels of the block are coded with the symbol tables of the block; they are added to the symbol tables of this
+        list and the codes of the block are mapped to the codes of this list.
+
+        PARAMETERS
+        ----------
+        columns : list
+            Float arrays of the continuous attributes and integer code arrays of the discrete attributes.
+        attributeValues : list
+            Distinct values of each discrete attribute in the order of their codes, None for continuous attributes.
+        classLabels : list
+            Distinct class labels in the order of their codes.
+        classColumn : array
+            Class label codes of the rows.
+        """
+        if not isinstance(self.__classColumn, array):
+            self.__copyColumns()
+        for i in range(len(columns)):
+            if attributeValues[i] is None:
+                self.__columns[i].extend(columns[i])
+            else:
+                codes = [self.__valueCode(i, value) for value in attributeValues[i]]
+                self.__columns[i].extend(array('i', map(codes.__getitem__, columns[i])))
+        codes = [self.__classSymbols.getCode(classLabel) for classLabel in classLabels]
+        start = len(self.__classColumn)
+        self.__classColumn.extend(array('i', map(codes.__getitem__, classColumn)))
+        self.list.extendRows(range(start, len(self.__classColumn)))
+        self.invalidateStatistics()
+
+    def add(self, instance: Instance):
+        """
+        Adds instance to the instance list. If the instance is a row view of a list sharing the columns of this list,
+        only its row is added, otherwise the values of the instance are appended to the columns.
+
+        PARAMETERS
+        ----------
+        instance : Instance
+            Instance to be added.
+        """
+        self.invalidateStatistics()
+        if isinstance(instance, ColumnarInstance) and instance.getInstanceList().__columns is self.__columns:
+            self.list.appendRow(instance.row)
+            return
+        if not isinstance(self.__classColumn, array):
+            self.__copyColumns()
+        for i in range(self.__definition.attributeCount()):
+            if self.__definition.getAttributeType(i) is AttributeType.CONTINUOUS:
+                self.__columns[i].append(instance.getAttribute(i).getValue())
+            else:
+                self.__columns[i].append(self.__valueCode(i, instance.getAttribute(i).getValue()))
+        self.__classColumn.append(self.__classSymbols.getCode(instance.getClassLabel()))
+        self.list.appendRow(len(self.__classColumn) - 1)
+
+    def addAll(self, instanceList: list):
+        """
+        Adds a list of instances to the current instance list.
+
+        PARAMETERS
+        ----------
+        instanceList : list
+            List of instances to be added.
+        """
+        for instance in instanceList:
+            self.add(instance)
+
+    def __copyColumns(self):
+        """
+        Replaces the memory mapped columns of a loaded instance list with arrays, so that new rows can be appended.
+        Sub lists sharing the mapped columns keep reading the mapped columns.
+        """
+        columns = []
+        for i in range(len(self.__columns)):
+            if self.__attributeSymbols[i] is None:
+                columns.append(array('d', self.__columns[i]))
+            else:
+                columns.append(array('i', self.__columns[i]))
+        self.__columns = columns
+        self.__classColumn = array('i', self.__classColumn)
+
+    def save(self, fileName: str, source: dict = None):
+        """
+        Writes the instance list to a binary file. The file starts with a magic string and the length of a json header
+        that stores the data definition, the symbol tables of the discrete attributes and the class labels. The header
+        is followed by the raw columns, each column starting at a multiple of 8 bytes, so that they can be memory
+        mapped without parsing. The rows are written in the order of the instance list.
+
+        PARAMETERS
+        ----------
+        fileName : str
+            Name of the binary file.
+        source : dict
+            Optional information on the text file the instance list is read from, stored in the header.
+        """
+        rows = self.__rows()
+        columns = []
+        for i in range(len(self.__columns)):
+            if self.__attributeSymbols[i] is None:
+                columns.append(array('d', self.__columnValues(i, rows)))
+            else:
+                columns.append(array('i', self.__columnValues(i, rows)))
+        columns.append(array('i', self.__classValues(rows)))
+        offsets = []
+        offset = 0
+        for column in columns:
+            offsets.append(offset)
+            offset += (column.itemsize * len(column) + 7) // 8 * 8
+        header = {"size": len(rows),
+                  "byteOrder": sys.byteorder,
+                  "attributeTypes": [self.__definition.getAttributeType(i).name
+                                     for i in range(self.__definition.attributeCount())],
+                  "attributeValues": [None if symbols is None else symbols.getSymbols()
+                                      for symbols in self.__attributeSymbols],
+                  "classLabels": self.__classSymbols.getSymbols(),
+                  "formats": [column.typecode for column in columns],
+                  "itemSizes": [column.itemsize for column in columns],
+                  "offsets": offsets,
+                  "source": source}
+        headerBytes = json.dumps(header).encode('utf8')
+        headerBytes += b" " * ((8 - len(headerBytes) % 8) % 8)
+        outfile = open(fileName, 'wb')
+        outfile.write(self.MAGIC)
+        outfile.write(len(headerBytes).to_bytes(8, 'little'))
+        outfile.write(headerBytes)
+        for column in columns:
+            data = column.tobytes()
+            outfile.write(data)
+            outfile.write(b"\0" * ((8 - len(data) % 8) % 8))
+        outfile.close()
+
+    @staticmethod
+    def readHeader(fileName: str) -> dict:
+        """
+        Reads the json header of a binary file written by the save method.
+
+        PARAMETERS
+        ----------
+        fileName : str
+            Name of the binary file.
+
+        RETURNS
+        -------
+        dict
+            Header of the file, None if the file is not a binary instance list file.
+        """
+        infile = open(fileName, 'rb')
+        if infile.read(len(ColumnarInstanceList.MAGIC)) != ColumnarInstanceList.MAGIC:
+            infile.close()
+            return None
+        length = int.from_bytes(infile.read(8), 'little')
+        header = json.loads(infile.read(length).decode('utf8'))
+        infile.close()
+        return header
+
+    @staticmethod
+    def load(fileName: str) -> ColumnarInstanceList:
+        """
+        Loads an instance list from a binary file written by the save method. The file is memory mapped and the
+        columns are read directly from the mapped pages, nothing is parsed except the header. The mapping is copy on
+        write, so changing a continuous value does not modify the file. If rows are added, the columns are first
+        copied to memory.
+
+        PARAMETERS
+        ----------
+        fileName : str
+            Name of the binary file.
+
+        RETURNS
+        -------
+        ColumnarInstanceList
+            Instance list stored in the file.
+        """
+        header = ColumnarInstanceList.readHeader(fileName)
+        if header is None:
+            raise ValueError(fileName + " is not a binary instance list file.")
+        definition = DataDefinition([AttributeType[name] for name in header["attributeTypes"]])
+        result = ColumnarInstanceList(definition)
+        size = header["size"]
+        infile = open(fileName, 'rb')
+        buffer = mmap.mmap(infile.fileno(), 0, access=mmap.ACCESS_COPY)
+        infile.close()
+        start = len(ColumnarInstanceList.MAGIC) + 8 + \
+                int.from_bytes(buffer[len(ColumnarInstanceList.MAGIC):len(ColumnarInstanceList.MAGIC) + 8], 'little')
+        view = memoryview(buffer)
+        columns = []
+        for i in range(len(header["formats"])):
+            begin = start + header["offsets"][i]
+            end = begin + header["itemSizes"][i] * size
+            if header["byteOrder"] == sys.byteorder and \
+                    array(header["formats"][i]).itemsize == header["itemSizes"][i]:
+                columns.append(view[begin:end].cast(header["formats"][i]))
+            else:
+                column = array(header["formats"][i])
+                column.frombytes(view[begin:end])
+                if header["byteOrder"] != sys.byteorder:
+                    column.byteswap()
+                columns.append(column)
+        result.__classColumn = columns.pop()
+        result.__columns = columns
+        result.__classSymbols = SymbolTable(header["classLabels"])
+        for i in range(definition.attributeCount()):
+            if header["attributeValues"][i] is not None:
+                for value in header["attributeValues"][i]:
+                    result.__valueCode(i, value)
+        result.list = ColumnarRows(result, range(size))
+        return result
+
+    def subList(self, rows) -> ColumnarInstanceList:
+        """
+        Returns an instance list that shares the columns and the symbol tables of this list and contains the given
+        rows. No values are copied, only the row numbers are stored, so folds and partitions of a memory mapped list
+        reference the mapped pages.
+
+        PARAMETERS
+        ----------
+        rows
+            Range or integer array of row numbers.
+
+        RETURNS
+        -------
+        ColumnarInstanceList
+            Instance list with the given rows.
+        """
+        result = ColumnarInstanceList(self.__definition)
+        result.__columns = self.__columns
+        result.__attributeSymbols = self.__attributeSymbols
+        result.__discreteAttributes = self.__discreteAttributes
+        result.__classSymbols = self.__classSymbols
+        result.__classColumn = self.__classColumn
+        result.list = ColumnarRows(result, rows)
+        return result
+
+    def getDataDefinition(self) -> DataDefinition:
+        """
+        Accessor for the data definition of the columns.
+
+        RETURNS
+        -------
+        DataDefinition
+            Data definition of the columns.
+        """
+        return self.__definition
+
+    def getRowAttribute(self, row: int, index: int) -> Attribute:
+        """
+        Returns the attribute with the given index of the given row. Discrete attributes are shared by all rows having
+        the same value, continuous attributes read and write the column directly.
+
+        PARAMETERS
+        ----------
+        row : int
+            Row in the columns.
+        index : int
+            Index of the attribute.
+
+        RETURNS
+        -------
+        Attribute
+            Attribute with index 'index' of the row.
+        """
+        if self.__attributeSymbols[index] is None:
+            return ColumnarContinuousAttribute(self.__columns[index], row)
+        return self.__discreteAttributes[index][self.__columns[index][row]]
+
+    def getRowContinuousAttributes(self, row: int) -> list:
+        """
+        Returns the values of the continuous attributes of the given row.
+
+        PARAMETERS
+        ----------
+        row : int
+            Row in the columns.
+
+        RETURNS
+        -------
+        list
+            Values of the continuous attributes of the row.
+        """
+        result = []
+        for i in range(len(self.__columns)):
+            if self.__attributeSymbols[i] is None:
+                result.append(self.__columns[i][row])
+        return result
+
+    def getRowClassLabel(self, row: int) -> str:
+        """
+        Returns the class label of the given row.
+
+        PARAMETERS
+        ----------
+        row : int
+            Row in the columns.
+
+        RETURNS
+        -------
+        str
+            Class label of the row.
+        """
+        return self.__classSymbols.getSymbol(self.__classColumn[row])
+
+    def __rows(self) -> list:
+        """
+        Returns the rows of the instances in the order of the instance list.
+
+        RETURNS
+        -------
+        range or array
+            Rows of the instances.
+        """
+        return self.list.getRows()
+
+    def __columnValues(self, index: int, rows: list):
+        """
+        Returns an iterator over the values of the attribute with the given index for the given rows. For discrete
+        attributes the iterator returns the codes of the values.
+
+        PARAMETERS
+        ----------
+        index : int
+            Index of the attribute.
+        rows : list
+            Rows of the instances.
+
+        RETURNS
+        -------
+        iterator
+            Values (or codes) of the attribute.
+        """
+        return self.__values(self.__columns[index], rows)
+
+    def __classValues(self, rows) -> iter:
+        """
+        Returns an iterator over the class label codes of the given rows.
+
+        PARAMETERS
+        ----------
+        rows : list
+            Rows of the instances.
+
+        RETURNS
+        -------
+        iterator
+            Codes of the class labels.
+        """
+        return self.__values(self.__classColumn, rows)
+
+    @staticmethod
+    def __values(column, rows) -> iter:
+        """
+        Returns an iterator over the items of the column for the given rows. A contiguous range of rows is read as a
+        slice of the column, so the pages of a memory mapped column are scanned sequentially.
+
+        PARAMETERS
+        ----------
+        column
+            Array or memory view of a column.
+        rows
+            Range or integer array of row numbers.
+
+        RETURNS
+        -------
+        iterator
+            Items of the column.
+        """
+        if isinstance(rows, range) and rows.step == 1:
+            return iter(column[rows.start:rows.stop])
+        return map(column.__getitem__, rows)
+
+    def __decode(self, index: int, value):
+        """
+        Converts a value read from the column with the given index to the attribute value. Codes of the discrete
+        attributes are converted to their strings, continuous values are returned as they are.
+
+        PARAMETERS
+        ----------
+        index : int
+            Index of the attribute.
+        value
+            Value read from the column.
+
+        RETURNS
+        -------
+        Value of the attribute.
+        """
+        if self.__attributeSymbols[index] is None:
+            return value
+        return self.__attributeSymbols[index].getSymbol(value)
+
+    def sortWrtAttribute(self, attributeIndex: int):
+        """
+        Sorts attribute list according to the attribute with index 'attributeIndex'.
+
+        PARAMETERS
+        ----------
+        attributeIndex : int
+            index of the attribute.
+        """
+        column = self.__columns[attributeIndex]
+        if self.__attributeSymbols[attributeIndex] is None:
+            self.list.sortRows(column.__getitem__)
+        else:
+            values = self.__attributeSymbols[attributeIndex].getSymbols()
+            self.list.sortRows(lambda row: values[column[row]])
+        self.invalidateStatistics()
+
+    def getClassLabels(self) -> list:
+        """
+        Extracts the class labels of each instance in the instance list and returns them in an array of {@link String}.
+
+        RETURNS
+        -------
+        list
+            A list of class labels.
+        """
+        return list(map(self.__classSymbols.getSymbols().__getitem__, self.__classValues(self.__rows())))
+
+    def getDistinctClassLabels(self) -> list:
+        """
+        Extracts the class labels of each instance in the instance list and returns them as a set.
+
+        RETURNS
+        -------
+        list
+            A list of distinct class labels.
+        """
+        return list(self.cachedStatistic("distinctClassLabels", self.__distinctClassLabels))
+
+    def __distinctClassLabels(self) -> list:
+        """
+        Computes the distinct class labels in the order of their first occurrence from the class column.
+
+        RETURNS
+        -------
+        list
+            A list of distinct class labels.
+        """
+        codes = dict.fromkeys(self.__classValues(self.__rows()))
+        return [self.__classSymbols.getSymbol(code) for code in codes]
+
+    def getUnionOfPossibleClassLabels(self) -> list:
+        """
+        Extracts the possible class labels of each instance in the instance list and returns them as a set. Columnar
+        instance lists do not store composite instances, so these are the distinct class labels.
+
+        RETURNS
+        -------
+        list
+            A list of distinct class labels.
+        """
+        return self.getDistinctClassLabels()
+
+    def getAttributeValueList(self, attributeIndex: int) -> list:
+        """
+        Extracts distinct discrete values of a given attribute as an array of strings.
+
+        PARAMETERS
+        ----------
+        attributeIndex : int
+            Index of the discrete attribute.
+
+        RETURNS
+        -------
+        list
+            An list of distinct values of a discrete attribute.
+        """
+        values = dict.fromkeys(self.__columnValues(attributeIndex, self.__rows()))
+        return [self.__decode(attributeIndex, value) for value in values]
+
+    def continuousAttributeAverage(self, index: int) -> list:
+        """
+        Calculates the mean of a single attribute for this instance list (m_i).
+
+        PARAMETERS
+        ----------
+        index : int
+            Index of the attribute.
+
+        RETURNS
+        -------
+        list
+            The mean value of the instances as an attribute.
+        """
+        if self.__attributeSymbols[index] is not None:
+            return None
+        rows = self.__rows()
+        return [sum(self.__columnValues(index, rows)) / len(rows)]
+
+    def continuousAttributeStandardDeviation(self, index: int) -> list:
+        """
+        Calculates the standard deviation of a single continuous attribute for this instance list (m_i).
+
+        PARAMETERS
+        ----------
+        index : int
+            Index of the attribute.
+
+        RETURNS
+        -------
+        list
+            The standard deviation of the instances as an attribute.
+        """
+        if self.__attributeSymbols[index] is not None:
+            return None
+        return [self.__standardDeviation(index, self.__rows())]
+
+    def continuousAverage(self) -> list:
+        """
+        Calculates mean of the continuous attributes of instances, reading each column once.
+
+        RETURNS
+        -------
+        list
+            Mean of the attributes of instances.
+        """
+        return list(self.cachedStatistic("continuousAverage", self.__continuousAverage))
+
+    def __continuousAverage(self) -> list:
+        """
+        Computes the means of the continuous columns.
+
+        RETURNS
+        -------
+        list
+            Mean of the attributes of instances.
+        """
+        rows = self.__rows()
+        return [sum(self.__columnValues(i, rows)) / len(rows) for i in range(len(self.__columns))
+                if self.__attributeSymbols[i] is None]
+
+    def continuousStandardDeviation(self) -> list:
+        """
+        Returns the standard deviation of continuous attributes for instances, using the cached means.
+
+        RETURNS
+        -------
+        list
+            Standard deviation of continuous attributes for instances.
+        """
+        return list(self.cachedStatistic("continuousStandardDeviation", self.__continuousStandardDeviation))
+
+    def __continuousStandardDeviation(self) -> list:
+        """
+        Computes the standard deviations of the continuous columns.
+
+        RETURNS
+        -------
+        list
+            Standard deviation of continuous attributes for instances.
+        """
+        rows = self.__rows()
+        averages = self.cachedStatistic("continuousAverage", self.__continuousAverage)
+        result = []
+        for i in range(len(self.__columns)):
+            if self.__attributeSymbols[i] is None:
+                average = averages[len(result)]
+                total = 0.0
+                for value in self.__columnValues(i, rows):
+                    total += math.pow(value - average, 2)
+                result.append(math.sqrt(total / (len(rows) - 1)))
+        return result
+
+    def __standardDeviation(self, index: int, rows: list) -> float:
+        """
+        Calculates the sample standard deviation of the continuous attribute with the given index.
+
+        PARAMETERS
+        ----------
+        index : int
+            Index of the continuous attribute.
+        rows : list
+            Rows of the instances.
+
+        RETURNS
+        -------
+        float
+            Standard deviation of the attribute.
+        """
+        average = sum(self.__columnValues(index, rows)) / len(rows)
+        total = 0.0
+        for value in self.__columnValues(index, rows):
+            total += math.pow(value - average, 2)
+        return math.sqrt(total / (len(rows) - 1))
+
+    def attributeDistribution(self, index: int) -> DiscreteDistribution:
+        """
+        The attributeDistribution method takes an index as an input and if the attribute at given index is discrete,
+        it returns the distribution of the values of that attribute.
+
+        PARAMETERS
+        ----------
+        index : int
+            Index of the attribute.
+
+        RETURNS
+        -------
+        DiscreteDistribution
+            Distribution of the attribute.
+        """
+        distribution = DiscreteDistribution()
+        symbols = self.__attributeSymbols[index]
+        if symbols is not None:
+            counts = Counter(self.__columnValues(index, self.__rows()))
+            distribution.addDistribution({symbols.getSymbol(code): count for code, count in counts.items()})
+        return distribution
+
+    def attributeClassDistribution(self, attributeIndex: int) -> list:
+        """
+        The attributeClassDistribution method takes an attribute index as an input. It counts the (value, class label)
+        pairs of the instances in a single pass and returns the class distribution of each distinct value of the
+        attribute.
+
+        PARAMETERS
+        ----------
+        attributeIndex : int
+            Index of the attribute.
+
+        RETURNS
+        -------
+        list
+            Distribution of the class labels.
+        """
+        rows = self.__rows()
+        pairs = Counter(zip(self.__columnValues(attributeIndex, rows), self.__classValues(rows)))
+        counts = {}
+        for value, classCode in pairs:
+            if value not in counts:
+                counts[value] = {}
+            counts[value][self.__classSymbols.getSymbol(classCode)] = pairs[(value, classCode)]
+        distributions = []
+        for value in counts:
+            distribution = DiscreteDistribution()
+            distribution.addDistribution(counts[value])
+            distributions.append(distribution)
+        return distributions
+
+    def contingencyTable(self, attributeIndices: list = None, classLabels: list = None,
+                         indexed: bool = False) -> ContingencyTable:
+        """
+        Counts the (value, class label) pairs of the given discrete attributes. The pairs of the codes of each attribute
+        column and the class column are counted, and only the distinct pairs are added to the table.
+
+        PARAMETERS
+        ----------
+        attributeIndices : list
+            Indexes of the discrete attributes. If None, all discrete attributes are counted.
+        classLabels : list
+            Optional class labels, which take the first class codes of the table in the given order.
+        indexed : bool
+            If true, discrete indexed attributes are counted by the indexes of their values instead of the values.
+
+        RETURNS
+        -------
+        ContingencyTable
+            Contingency table of the attributes.
+        """
+        if attributeIndices is None:
+            attributeIndices = [i for i in range(len(self.__columns)) if self.__attributeSymbols[i] is not None]
+        table = ContingencyTable(attributeIndices, classLabels)
+        rows = self.__rows()
+        for attributeIndex in attributeIndices:
+            pairs = Counter(zip(self.__columnValues(attributeIndex, rows), self.__classValues(rows)))
+            attributes = self.__discreteAttributes[attributeIndex]
+            for (code, classCode), count in pairs.items():
+                if indexed and isinstance(attributes[code], DiscreteIndexedAttribute):
+                    value = attributes[code].getIndex()
+                else:
+                    value = self.__attributeSymbols[attributeIndex].getSymbol(code)
+                table.addCount(attributeIndex, value, self.__classSymbols.getSymbol(classCode), count)
+        return table
+
+    def classDistribution(self) -> DiscreteDistribution:
+        """
+        The classDistribution method returns the distribution of all the class labels of instances.
+
+        RETURNS
+        -------
+        DiscreteDistribution
+            Distribution of the class labels.
+        """
+        distribution = DiscreteDistribution()
+        distribution.addDistribution(self.cachedStatistic("classDistribution", self.__classDistribution))
+        return distribution
+
+    def __classDistribution(self) -> DiscreteDistribution:
+        """
+        Computes the distribution of the class labels by counting the codes of the class column.
+
+        RETURNS
+        -------
+        DiscreteDistribution
+            Distribution of the class labels.
+        """
+        distribution = DiscreteDistribution()
+        counts = Counter(self.__classValues(self.__rows()))
+        distribution.addDistribution({self.__classSymbols.getSymbol(code): count for code, count in counts.items()})
+        return distribution
+
+    def average(self) -> Instance:
+        """
+        Returns the mean of all the attributes for instances in the list. For discrete attributes the maximum occurring
+        value is returned.
+
+        RETURNS
+        -------
+        Instance
+            Mean of all the attributes for instances in the list.
+        """
+        rows = self.__rows()
+        result = Instance(self.getRowClassLabel(rows[0]))
+        for i in range(len(self.__columns)):
+            if self.__attributeSymbols[i] is None:
+                result.addAttribute(ContinuousAttribute(sum(self.__columnValues(i, rows)) / len(rows)))
+            else:
+                counts = Counter(self.__columnValues(i, rows))
+                maxCode = None
+                for code in counts:
+                    if maxCode is None or counts[code] > counts[maxCode]:
+                        maxCode = code
+                result.addAttribute(DiscreteAttribute(self.__attributeSymbols[i].getSymbol(maxCode)))
+        return result
+
+    def standardDeviation(self) -> Instance:
+        """
+        Returns the standard deviation of attributes for instances. Discrete attributes have no standard deviation.
+
+        RETURNS
+        -------
+        Instance
+            Standard deviation of attributes for instances.
+        """
+        rows = self.__rows()
+        result = Instance(self.getRowClassLabel(rows[0]))
+        for i in range(len(self.__columns)):
+            if self.__attributeSymbols[i] is None:
+                result.addAttribute(ContinuousAttribute(self.__standardDeviation(i, rows)))
+            else:
+                result.addAttribute(None)
+        return result
+
+    def covariance(self, average: Vector) -> Matrix:
+        """
+        Calculates a covariance Matrix of the continuous columns by using an average Vector. The covariance is obtained
+        from the cached moments of the columns.
+
+        PARAMETERS
+        ----------
+        average : Vector
+            Vector input.
+
+        RETURNS
+        -------
+        Matrix
+            Covariance Matrix.
+        """
+        return self.cachedStatistic("moments", self.__moments).getCovariance(average)
+
+    def moments(self) -> Moments:
+        """
+        Returns the moments of the continuous columns, which are computed in a single pass over the columns and cached.
+
+        RETURNS
+        -------
+        Moments
+            Count, mean and comoment matrix of the continuous columns.
+        """
+        moments = self.cachedStatistic("moments", self.__moments)
+        result = Moments(moments.dimension())
+        result.merge(moments)
+        return result
+
+    def __moments(self) -> Moments:
+        """
+        Computes the moments of the continuous columns, reading the columns in blocks of rows.
+
+        RETURNS
+        -------
+        Moments
+            Count, mean and comoment matrix of the continuous columns.
+        """
+        columns = [self.__columns[i] for i in range(len(self.__columns)) if self.__attributeSymbols[i] is None]
+        result = Moments(len(columns))
+        rows = self.__rows()
+        for start in range(0, len(rows), Moments.BLOCK_SIZE):
+            block = rows[start:start + Moments.BLOCK_SIZE]
+            result.addColumns([list(self.__values(column, block)) for column in columns])
+        return result
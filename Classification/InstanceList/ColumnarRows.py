@@ -0,0 +1,141 @@
+from __future__ import annotations
+from array import array
+
+from Classification.Instance.ColumnarInstance import ColumnarInstance
+
+
+class ColumnarRows(object):
+
+    __data: object
+    __rows: object
+
+    def __init__(self, data, rows=None):
+        """
+        Constructor for the row sequence of a columnar instance list. Only the row numbers are stored; the
+        ColumnarInstance views are created when the rows are accessed, so a memory mapped instance list does not
+        allocate an object per row. A range of rows is kept as a range until the sequence is modified.
+
+        PARAMETERS
+        ----------
+        data : ColumnarInstanceList
+            Columnar instance list whose rows are referenced.
+        rows
+            Range or integer array of row numbers. If None, the sequence is empty.
+        """
+        self.__data = data
+        if rows is None:
+            self.__rows = array('q')
+        else:
+            self.__rows = rows
+
+    def getRows(self):
+        """
+        Accessor for the row numbers.
+
+        RETURNS
+        -------
+        range or array
+            Row numbers of the sequence.
+        """
+        return self.__rows
+
+    def __writableRows(self) -> array:
+        """
+        Converts a range of rows to an integer array before the sequence is modified.
+
+        RETURNS
+        -------
+        array
+            Row numbers of the sequence.
+        """
+        if not isinstance(self.__rows, array):
+            self.__rows = array('q', self.__rows)
+        return self.__rows
+
+    def __len__(self) -> int:
+        return len(self.__rows)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ColumnarRows(self.__data, self.__rows[index])
+        return ColumnarInstance(self.__data, self.__rows[index])
+
+    def __setitem__(self, index: int, instance: ColumnarInstance):
+        self.__writableRows()[index] = instance.row
+
+    def __iter__(self):
+        data = self.__data
+        for row in self.__rows:
+            yield ColumnarInstance(data, row)
+
+    def append(self, instance: ColumnarInstance):
+        """
+        Appends the row of the given view to the sequence.
+
+        PARAMETERS
+        ----------
+        instance : ColumnarInstance
+            Row view of the columnar instance list.
+        """
+        self.__writableRows().append(instance.row)
+
+    def appendRow(self, row: int):
+        """
+        Appends the given row number to the sequence.
+
+        PARAMETERS
+        ----------
+        row : int
+            Row number.
+        """
+        self.__writableRows().append(row)
+
+    def extendRows(self, rows):
+        """
+        Appends the given row numbers to the sequence.
+
+        PARAMETERS
+        ----------
+        rows
+            Range or integer array of row numbers.
+        """
+        self.__writableRows().extend(rows)
+
+    def extend(self, instances):
+        """
+        Appends the rows of the given views to the sequence.
+
+        PARAMETERS
+        ----------
+        instances
+            Row views of the columnar instance list.
+        """
+        rows = self.__writableRows()
+        for instance in instances:
+            rows.append(instance.row)
+
+    def sortRows(self, key):
+        """
+        Sorts the row numbers with the given key function of a row number.
+
+        PARAMETERS
+        ----------
+        key
+            Function that maps a row number to its sort key.
+        """
+        self.__rows = array('q', sorted(self.__rows, key=key))
+
+    def sort(self, key=None):
+        """
+        Sorts the sequence with the given key function of a row view.
+
+        PARAMETERS
+        ----------
+        key
+            Function that maps a row view to its sort key.
+        """
+        data = self.__data
+        if key is None:
+            self.__rows = array('q', sorted(self.__rows, key=lambda row: ColumnarInstance(data, row)))
+        else:
+            self.__rows = array('q', sorted(self.__rows, key=lambda row: key(ColumnarInstance(data, row))))
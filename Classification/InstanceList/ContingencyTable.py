@@ -0,0 +1,214 @@
+from Math.DiscreteDistribution import DiscreteDistribution
+
+from Classification.DataSet.SymbolTable import SymbolTable
+
+
+class ContingencyTable(object):
+
+    __attributeIndices: list
+    __positions: dict
+    __classLabels: SymbolTable
+    __values: list
+    __counts: list
+
+    def __init__(self, attributeIndices: list, classLabels: list = None):
+        """
+        Constructor for a contingency table, which holds the number of instances for each (value, class label) pair of
+        one or more discrete attributes. The table is filled in a single pass over the instances, after which the
+        class distributions of the values, the value distributions of the classes and the value distribution of an
+        attribute are read from the counts. Values and class labels are kept in the order of first occurrence.
+
+        PARAMETERS
+        ----------
+        attributeIndices : list
+            Indexes of the attributes in the table.
+        classLabels : list
+            Optional class labels, which take the first class codes in the given order.
+        """
+        self.__attributeIndices = list(attributeIndices)
+        self.__positions = {attributeIndex: position for position, attributeIndex in enumerate(attributeIndices)}
+        self.__classLabels = SymbolTable(classLabels)
+        self.__values = [SymbolTable() for _ in attributeIndices]
+        self.__counts = [[] for _ in attributeIndices]
+
+    def add(self, values: list, classLabel: str):
+        """
+        Adds an instance to the table.
+
+        PARAMETERS
+        ----------
+        values : list
+            Values of the attributes of the instance, in the order of the attribute indexes of the table.
+        classLabel : str
+            Class label of the instance.
+        """
+        classCode = self.__classLabels.getCode(classLabel)
+        for position in range(len(values)):
+            self.__addCount(position, values[position], classCode, 1)
+
+    def addCount(self, attributeIndex: int, value, classLabel: str, count: int):
+        """
+        Adds the given number of instances with the given value and class label to the table.
+
+        PARAMETERS
+        ----------
+        attributeIndex : int
+            Index of the attribute.
+        value
+            Value of the attribute.
+        classLabel : str
+            Class label of the instances.
+        count : int
+            Number of instances.
+        """
+        self.__addCount(self.__positions[attributeIndex], value, self.__classLabels.getCode(classLabel), count)
+
+    def __addCount(self, position: int, value, classCode: int, count: int):
+        """
+        Adds the given number of instances to the cell of the given value and class code.
+
+        PARAMETERS
+        ----------
+        position : int
+            Position of the attribute in the table.
+        value
+            Value of the attribute.
+        classCode : int
+            Code of the class label.
+        count : int
+            Number of instances.
+        """
+        valueCode = self.__values[position].getCode(value)
+        counts = self.__counts[position]
+        if valueCode == len(counts):
+            counts.append([0] * (classCode + 1))
+        row = counts[valueCode]
+        if classCode >= len(row):
+            row.extend([0] * (classCode + 1 - len(row)))
+        row[classCode] += count
+
+    def getAttributeIndices(self) -> list:
+        """
+        Accessor for the indexes of the attributes in the table.
+
+        RETURNS
+        -------
+        list
+            Indexes of the attributes.
+        """
+        return list(self.__attributeIndices)
+
+    def getClassLabels(self) -> list:
+        """
+        Accessor for the class labels in the order of their codes.
+
+        RETURNS
+        -------
+        list
+            Class labels.
+        """
+        return self.__classLabels.getSymbols()
+
+    def getValues(self, attributeIndex: int) -> list:
+        """
+        Returns the distinct values of the given attribute in the order of first occurrence.
+
+        PARAMETERS
+        ----------
+        attributeIndex : int
+            Index of the attribute.
+
+        RETURNS
+        -------
+        list
+            Distinct values of the attribute.
+        """
+        return self.__values[self.__positions[attributeIndex]].getSymbols()
+
+    def getCounts(self, attributeIndex: int) -> list:
+        """
+        Returns the class counts of each value of the given attribute. The counts of a value are indexed by the class
+        codes, that is, by the positions of the class labels in getClassLabels.
+
+        PARAMETERS
+        ----------
+        attributeIndex : int
+            Index of the attribute.
+
+        RETURNS
+        -------
+        list
+            Class counts of the values, in the order of getValues.
+        """
+        classCount = self.__classLabels.size()
+        return [row + [0] * (classCount - len(row)) for row in self.__counts[self.__positions[attributeIndex]]]
+
+    def attributeDistribution(self, attributeIndex: int) -> DiscreteDistribution:
+        """
+        Returns the distribution of the values of the given attribute. If the attribute is not in the table, the
+        distribution is empty.
+
+        PARAMETERS
+        ----------
+        attributeIndex : int
+            Index of the attribute.
+
+        RETURNS
+        -------
+        DiscreteDistribution
+            Distribution of the values.
+        """
+        distribution = DiscreteDistribution()
+        if attributeIndex in self.__positions:
+            position = self.__positions[attributeIndex]
+            distribution.addDistribution({value: sum(row) for value, row in
+                                          zip(self.__values[position].getSymbols(), self.__counts[position])})
+        return distribution
+
+    def attributeClassDistribution(self, attributeIndex: int) -> list:
+        """
+        Returns the class distribution of each value of the given attribute.
+
+        PARAMETERS
+        ----------
+        attributeIndex : int
+            Index of the attribute.
+
+        RETURNS
+        -------
+        list
+            Distributions of the class labels, in the order of getValues.
+        """
+        classLabels = self.__classLabels.getSymbols()
+        distributions = []
+        for row in self.__counts[self.__positions[attributeIndex]]:
+            distribution = DiscreteDistribution()
+            distribution.addDistribution({classLabels[code]: count for code, count in enumerate(row) if count > 0})
+            distributions.append(distribution)
+        return distributions
+
+    def classAttributeDistribution(self, attributeIndex: int, classLabel: str) -> DiscreteDistribution:
+        """
+        Returns the distribution of the values of the given attribute among the instances of the given class. If the
+        attribute is not in the table, the distribution is empty.
+
+        PARAMETERS
+        ----------
+        attributeIndex : int
+            Index of the attribute.
+        classLabel : str
+            Class label.
+
+        RETURNS
+        -------
+        DiscreteDistribution
+            Distribution of the values for the class.
+        """
+        distribution = DiscreteDistribution()
+        if attributeIndex in self.__positions and classLabel in self.__classLabels:
+            position = self.__positions[attributeIndex]
+            classCode = self.__classLabels.indexOf(classLabel)
+            distribution.addDistribution({value: row[classCode] for value, row in
+                                          zip(self.__values[position].getSymbols(), self.__counts[position])
+                                          if classCode < len(row) and row[classCode] > 0})
+        return distribution
@@ -0,0 +1,118 @@
+from __future__ import annotations
+import random
+from array import array
+
+
+class IndexedList(object):
+
+    __items: list
+    __indices: object
+
+    def __init__(self, items, indices):
+        """
+        Constructor for a list of the items of another list selected by an index array. The items are not copied;
+        reading, sorting and shuffling only touch the indices. The first modification that can not be expressed with
+        the indices (append, extend or item assignment) copies the selected items to an own list, after which the
+        IndexedList behaves as an ordinary list.
+
+        PARAMETERS
+        ----------
+        items
+            List whose items are selected.
+        indices
+            Range or integer array of the indices of the selected items.
+        """
+        self.__items = items
+        self.__indices = indices
+
+    def getItems(self):
+        """
+        Accessor for the underlying list.
+
+        RETURNS
+        -------
+        list
+            The list whose items are selected, or the own list after a copy.
+        """
+        return self.__items
+
+    def getIndices(self):
+        """
+        Accessor for the indices of the selected items.
+
+        RETURNS
+        -------
+        range or array
+            Indices of the selected items, None if the items are already copied to an own list.
+        """
+        return self.__indices
+
+    def __copy(self) -> list:
+        """
+        Copies the selected items to an own list before a modification.
+
+        RETURNS
+        -------
+        list
+            Own list of the items.
+        """
+        if self.__indices is not None:
+            self.__items = list(map(self.__items.__getitem__, self.__indices))
+            self.__indices = None
+        return self.__items
+
+    def __len__(self) -> int:
+        if self.__indices is None:
+            return len(self.__items)
+        return len(self.__indices)
+
+    def __getitem__(self, index):
+        if self.__indices is None:
+            return self.__items[index]
+        if isinstance(index, slice):
+            return list(map(self.__items.__getitem__, self.__indices[index]))
+        return self.__items[self.__indices[index]]
+
+    def __setitem__(self, index, item):
+        self.__copy()[index] = item
+
+    def __iter__(self):
+        if self.__indices is None:
+            return iter(self.__items)
+        return map(self.__items.__getitem__, self.__indices)
+
+    def append(self, item):
+        self.__copy().append(item)
+
+    def extend(self, items):
+        self.__copy().extend(items)
+
+    def sort(self, key=None):
+        """
+        Sorts the items with the given key function. If the items are not copied, the indices are sorted.
+
+        PARAMETERS
+        ----------
+        key
+            Function that maps an item to its sort key.
+        """
+        if self.__indices is None:
+            self.__items.sort(key=key)
+        else:
+            items = self.__items
+            if key is None:
+                self.__indices = array('i', sorted(self.__indices, key=items.__getitem__))
+            else:
+                self.__indices = array('i', sorted(self.__indices, key=lambda index: key(items[index])))
+
+    def shuffle(self):
+        """
+        Shuffles the items with the current state of the random number generator. If the items are not copied, the
+        indices are shuffled, which produces the same order as shuffling the items.
+        """
+        if self.__indices is None:
+            random.shuffle(self.__items)
+        else:
+            if not isinstance(self.__indices, array):
+                self.__indices = array('i', self.__indices)
+            random.shuffle(self.__indices)
@@ -1,9 +1,10 @@
 from __future__ import annotations
 import random
+import sys
 import math
-from functools import cmp_to_key
 
 from Classification.DataSet.DataDefinition import DataDefinition
+from Classification.DataSet.SymbolTable import SymbolTable
 from Classification.Instance.Instance import Instance
 from Classification.Attribute.AttributeType import AttributeType
 from Classification.Attribute.DiscreteAttribute import DiscreteAttribute
@@ -13,6 +14,8 @@ from Sampling.Bootstrap import Bootstrap
 from Classification.Instance.CompositeInstance import CompositeInstance
 from Classification.Attribute.Attribute import Attribute
 from Classification.Attribute.DiscreteIndexedAttribute import DiscreteIndexedAttribute
+from Classification.InstanceList.ContingencyTable import ContingencyTable
+from Classification.InstanceList.Moments import Moments
 from Math.DiscreteDistribution import DiscreteDistribution
 from Math.Vector import Vector
 from Math.Matrix import Matrix
@@ -23,6 +26,9 @@ from Classification.Model.Model import Model
 class InstanceList(object):
 
     list: list
+    __version: int
+    __statistics: dict
+    __statisticsVersion: int
 
     def __init__(self, listOrDefinition = None, separator: str = None, fileName: str = None):
         """
@@ -48,29 +54,90 @@ class InstanceList(object):
         fileName : str
             Name of the data set file.
         """
+        self.__version = 0
+        self.__statistics = {}
+        self.__statisticsVersion = 0
         if listOrDefinition is None:
             self.list = []
         else:
-            if separator is None and isinstance(listOrDefinition, list):
+            if separator is None and not isinstance(listOrDefinition, DataDefinition):
                 self.list = listOrDefinition
             else:
                 if isinstance(listOrDefinition, DataDefinition):
                     self.list = []
+                    sharedValues = [{} for _ in range(listOrDefinition.attributeCount() + 1)]
                     file = open(fileName, 'r', encoding='utf8')
-                    lines = file.readlines()
-                    for line in lines:
+                    for line in file:
                         attributeList = line.strip().split(separator)
                         if len(attributeList) == listOrDefinition.attributeCount() + 1:
-                            current = Instance(attributeList[len(attributeList) - 1])
-                            for i in range(len(attributeList) - 1):
-                                if listOrDefinition.getAttributeType(i) is AttributeType.DISCRETE:
-                                    current.addAttribute(DiscreteAttribute(attributeList[i]))
-                                elif listOrDefinition.getAttributeType(i) is AttributeType.BINARY:
-                                    current.addAttribute(
-                                        BinaryAttribute(attributeList[i] in ["True", "true", "Yes", "yes", "y", "Y"]))
-                                elif listOrDefinition.getAttributeType(i) is AttributeType.CONTINUOUS:
-                                    current.addAttribute(ContinuousAttribute(float(attributeList[i])))
-                            self.list.append(current)
+                            self.list.append(InstanceList.parseInstance(listOrDefinition, attributeList, sharedValues))
+                    file.close()
+
+    @staticmethod
+    def parseInstance(definition: DataDefinition, attributeList: list, sharedValues: list = None) -> Instance:
+        """
+        Creates a new instance from the items of a single line of a data file. Depending on the data definition, that
+        is, type of the attributes, discrete, binary and continuous attributes are added to the instance. The last item
+        is the class label. If shared values are given, discrete and binary attributes are immutable flyweights shared
+        by all instances with the same value, and equal class labels share a single interned string.
+
+        PARAMETERS
+        ----------
+        definition : DataDefinition
+            Data definition of the data set.
+        attributeList : list
+            Items of the line as strings.
+        sharedValues : list
+            For each attribute a dictionary from values to shared attributes, followed by a dictionary from class
+            labels to interned class labels. New values are added to the dictionaries.
+
+        RETURNS
+        -------
+        Instance
+            Instance created from the items.
+        """
+        classLabel = attributeList[len(attributeList) - 1]
+        if sharedValues is None:
+            current = Instance(classLabel)
+        else:
+            current = Instance(sharedValues[len(attributeList) - 1].setdefault(classLabel, sys.intern(classLabel)))
+        for i in range(len(attributeList) - 1):
+            attributeType = definition.getAttributeType(i)
+            if sharedValues is None or attributeType is AttributeType.CONTINUOUS:
+                attribute = InstanceList.__createAttribute(attributeType, attributeList[i])
+            else:
+                attribute = sharedValues[i].get(attributeList[i])
+                if attribute is None:
+                    attribute = InstanceList.__createAttribute(attributeType, attributeList[i])
+                    sharedValues[i][attributeList[i]] = attribute
+            if attribute is not None:
+                current.addAttribute(attribute)
+        return current
+
+    @staticmethod
+    def __createAttribute(attributeType: AttributeType, value: str) -> Attribute:
+        """
+        Creates a new attribute of the given type from its string value in a data file.
+
+        PARAMETERS
+        ----------
+        attributeType : AttributeType
+            Type of the attribute.
+        value : str
+            Value of the attribute as a string.
+
+        RETURNS
+        -------
+        Attribute
+            Attribute created from the value, None if the type can not be read from a data file.
+        """
+        if attributeType is AttributeType.DISCRETE:
+            return DiscreteAttribute(sys.intern(value))
+        elif attributeType is AttributeType.BINARY:
+            return BinaryAttribute(value in ["True", "true", "Yes", "yes", "y", "Y"])
+        elif attributeType is AttributeType.CONTINUOUS:
+            return ContinuousAttribute(float(value))
+        return None
 
     def add(self, instance: Instance):
         """
@@ -82,6 +149,7 @@ class InstanceList(object):
             Instance to be added.
         """
         self.list.append(instance)
+        self.__version += 1
 
     def addAll(self, instanceList: list):
         """
@@ -93,6 +161,50 @@ class InstanceList(object):
             List of instances to be added.
         """
         self.list.extend(instanceList)
+        self.__version += 1
+
+    def getVersion(self) -> int:
+        """
+        Accessor for the version of the instance list. The version is increased by every modification of the list, so
+        a result computed from the instances is valid as long as the version does not change.
+
+        RETURNS
+        -------
+        int
+            Version of the instance list.
+        """
+        return self.__version
+
+    def invalidateStatistics(self):
+        """
+        Increases the version of the instance list, so that the cached statistics are computed again. The methods
+        modifying the list call it; it must also be called after the attributes of the instances are modified in
+        place, as the filters do.
+        """
+        self.__version += 1
+
+    def cachedStatistic(self, name: str, compute):
+        """
+        Returns the statistic with the given name from the statistics cache. If the statistic is not cached for the
+        current version of the list, it is computed with the given function and cached.
+
+        PARAMETERS
+        ----------
+        name : str
+            Name of the statistic.
+        compute
+            Function without arguments that computes the statistic.
+
+        RETURNS
+        -------
+        Value of the statistic. It is shared by the callers, so it must not be modified.
+        """
+        if self.__statisticsVersion != self.__version:
+            self.__statistics = {}
+            self.__statisticsVersion = self.__version
+        if name not in self.__statistics:
+            self.__statistics[name] = compute()
+        return self.__statistics[name]
 
     def size(self) -> int:
         """
@@ -142,13 +254,15 @@ class InstanceList(object):
         attributeIndex : int
             index of the attribute.
         """
-        self.list.sort(key=cmp_to_key(self.makeComparator(attributeIndex)))
+        self.list.sort(key=lambda instance: instance.getAttribute(attributeIndex).getValue())
+        self.__version += 1
 
     def sort(self):
         """
         Sorts attributes list.
         """
         self.list.sort()
+        self.__version += 1
 
     def shuffle(self, seed: int):
         """
@@ -161,6 +275,7 @@ class InstanceList(object):
         """
         random.seed(seed)
         random.shuffle(self.list)
+        self.__version += 1
 
     def bootstrap(self, seed: int) -> Bootstrap:
         """
@@ -201,11 +316,21 @@ class InstanceList(object):
         list
             A list of distinct class labels.
         """
-        classLabels = []
+        return list(self.cachedStatistic("distinctClassLabels", self.__distinctClassLabels))
+
+    def __distinctClassLabels(self) -> list:
+        """
+        Computes the distinct class labels in the order of their first occurrence.
+
+        RETURNS
+        -------
+        list
+            A list of distinct class labels.
+        """
+        classLabels = SymbolTable()
         for instance in self.list:
-            if not instance.getClassLabel() in classLabels:
-                classLabels.append(instance.getClassLabel())
-        return classLabels
+            classLabels.getCode(instance.getClassLabel())
+        return classLabels.getSymbols()
 
     def getUnionOfPossibleClassLabels(self) -> list:
         """
@@ -216,16 +341,25 @@ class InstanceList(object):
         list
             A list of distinct class labels.
         """
-        possibleClassLabels = []
+        return list(self.cachedStatistic("unionOfPossibleClassLabels", self.__unionOfPossibleClassLabels))
+
+    def __unionOfPossibleClassLabels(self) -> list:
+        """
+        Computes the union of the possible class labels of the instances in the order of their first occurrence.
+
+        RETURNS
+        -------
+        list
+            A list of distinct class labels.
+        """
+        possibleClassLabels = SymbolTable()
         for instance in self.list:
             if isinstance(instance, CompositeInstance):
                 for possibleClassLabel in instance.getPossibleClassLabels():
-                    if possibleClassLabel not in possibleClassLabels:
-                        possibleClassLabels.append(possibleClassLabel)
+                    possibleClassLabels.getCode(possibleClassLabel)
             else:
-                if not instance.getClassLabel() in possibleClassLabels:
-                    possibleClassLabels.append(instance.getClassLabel())
-        return possibleClassLabels
+                possibleClassLabels.getCode(instance.getClassLabel())
+        return possibleClassLabels.getSymbols()
 
     def getAttributeValueList(self, attributeIndex: int) -> list:
         """
@@ -241,11 +375,10 @@ class InstanceList(object):
         list
             An list of distinct values of a discrete attribute.
         """
-        valueList = []
+        valueList = SymbolTable()
         for instance in self.list:
-            if not instance.getAttribute(attributeIndex).getValue() in valueList:
-                valueList.append(instance.getAttribute(attributeIndex).getValue())
-        return valueList
+            valueList.getCode(instance.getAttribute(attributeIndex).getValue())
+        return valueList.getSymbols()
 
     def __attributeAverage(self, index: int) -> Attribute:
         """
@@ -373,6 +506,7 @@ class InstanceList(object):
             for instance in self.list:
                 total += instance.getAttribute(index).getValue()
             average = total / len(self.list)
+            total = 0.0
             for instance in self.list:
                 total += math.pow(instance.getAttribute(index).getValue() - average, 2)
             return [math.sqrt(total / (len(self.list) - 1))]
@@ -417,12 +551,12 @@ class InstanceList(object):
             Distribution of the class labels.
         """
         distributions = []
-        valueList = self.getAttributeValueList(attributeIndex)
-        for _ in valueList:
-            distributions.append(DiscreteDistribution())
+        valueList = SymbolTable()
         for instance in self.list:
-            distributions[valueList.index(instance.getAttribute(attributeIndex).getValue())].addItem(instance.
-                                                                                                     getClassLabel())
+            code = valueList.getCode(instance.getAttribute(attributeIndex).getValue())
+            if code == len(distributions):
+                distributions.append(DiscreteDistribution())
+            distributions[code].addItem(instance.getClassLabel())
         return distributions
 
     def discreteIndexedAttributeClassDistribution(self, attributeIndex: int, attributeValue: int) -> \
@@ -454,6 +588,19 @@ class InstanceList(object):
         """
         The classDistribution method returns the distribution of all the class labels of instances.
 
+        RETURNS
+        -------
+        DiscreteDistribution
+            Distribution of the class labels.
+        """
+        distribution = DiscreteDistribution()
+        distribution.addDistribution(self.cachedStatistic("classDistribution", self.__classDistribution))
+        return distribution
+
+    def __classDistribution(self) -> DiscreteDistribution:
+        """
+        Computes the distribution of the class labels in a single pass.
+
         RETURNS
         -------
         DiscreteDistribution
@@ -466,18 +613,51 @@ class InstanceList(object):
 
     def allAttributesDistribution(self) -> list:
         """
-        The allAttributesDistribution method returns the distributions of all the attributes of instances.
+        The allAttributesDistribution method returns the distributions of all the attributes of instances. The
+        distributions of the discrete attributes are read from a contingency table filled in a single pass, the
+        distributions of the other attributes are empty.
 
         RETURNS
         -------
         list
             Distributions of all the attributes of instances.
         """
+        table = self.contingencyTable()
         distributions = []
         for i in range(self.list[0].attributeSize()):
-            distributions.append(self.attributeDistribution(i))
+            distributions.append(table.attributeDistribution(i))
         return distributions
 
+    def contingencyTable(self, attributeIndices: list = None, classLabels: list = None,
+                         indexed: bool = False) -> ContingencyTable:
+        """
+        Counts the (value, class label) pairs of the given discrete attributes in a single pass over the instances.
+
+        PARAMETERS
+        ----------
+        attributeIndices : list
+            Indexes of the discrete attributes. If None, all discrete attributes are counted.
+        classLabels : list
+            Optional class labels, which take the first class codes of the table in the given order.
+        indexed : bool
+            If true, discrete indexed attributes are counted by the indexes of their values instead of the values.
+
+        RETURNS
+        -------
+        ContingencyTable
+            Contingency table of the attributes.
+        """
+        if attributeIndices is None:
+            attributeIndices = [i for i in range(self.list[0].attributeSize())
+                                if isinstance(self.list[0].getAttribute(i), DiscreteAttribute)]
+        table = ContingencyTable(attributeIndices, classLabels)
+        byIndex = [indexed and isinstance(self.list[0].getAttribute(i), DiscreteIndexedAttribute)
+                   for i in attributeIndices]
+        for instance in self.list:
+            table.add([instance.getAttribute(i).getIndex() if index else instance.getAttribute(i).getValue()
+                       for i, index in zip(attributeIndices, byIndex)], instance.getClassLabel())
+        return table
+
     def average(self) -> Instance:
         """
         Returns the mean of all the attributes for instances in the list.
@@ -501,9 +681,51 @@ class InstanceList(object):
         list
             Mean of the attributes of instances.
         """
-        result = []
+        return list(self.cachedStatistic("continuousAverage", self.__continuousAverage))
+
+    def __continuousAttributeOffsets(self) -> tuple:
+        """
+        Finds the positions of the continuous and discrete indexed attributes in the continuous representation of the
+        instances, where a continuous attribute takes one position and a discrete indexed attribute takes one
+        position for each of its values.
+
+        RETURNS
+        -------
+        tuple
+            List of (attribute index, position) pairs of the continuous attributes, list of (attribute index, position,
+            number of values) triples of the discrete indexed attributes and the number of positions.
+        """
+        continuous = []
+        indexed = []
+        size = 0
         for i in range(self.list[0].attributeSize()):
-            result.extend(self.continuousAttributeAverage(i))
+            attribute = self.list[0].getAttribute(i)
+            if isinstance(attribute, DiscreteIndexedAttribute):
+                indexed.append((i, size, attribute.getMaxIndex()))
+                size += attribute.getMaxIndex()
+            elif isinstance(attribute, ContinuousAttribute):
+                continuous.append((i, size))
+                size += 1
+        return continuous, indexed, size
+
+    def __continuousAverage(self) -> list:
+        """
+        Computes the means of the continuous and discrete indexed attributes in a single pass over the instances.
+
+        RETURNS
+        -------
+        list
+            Mean of the attributes of instances.
+        """
+        continuous, indexed, size = self.__continuousAttributeOffsets()
+        result = [0.0] * size
+        for instance in self.list:
+            for index, position in continuous:
+                result[position] += instance.getAttribute(index).getValue()
+            for index, position, _ in indexed:
+                result[position + instance.getAttribute(index).getIndex()] += 1
+        for i in range(size):
+            result[i] = result[i] / len(self.list)
         return result
 
     def standardDeviation(self) -> Instance:
@@ -529,14 +751,72 @@ class InstanceList(object):
         list
             Standard deviation of continuous attributes for instances.
         """
-        result = []
-        for i in range(self.list[0].attributeSize()):
-            result.extend(self.continuousAttributeStandardDeviation(i))
+        return list(self.cachedStatistic("continuousStandardDeviation", self.__continuousStandardDeviation))
+
+    def __continuousStandardDeviation(self) -> list:
+        """
+        Computes the standard deviations of the continuous and discrete indexed attributes in a single pass over the
+        instances, using the cached means.
+
+        RETURNS
+        -------
+        list
+            Standard deviation of continuous attributes for instances.
+        """
+        averages = self.cachedStatistic("continuousAverage", self.__continuousAverage)
+        continuous, indexed, size = self.__continuousAttributeOffsets()
+        result = [0.0] * size
+        for instance in self.list:
+            for index, position in continuous:
+                result[position] += math.pow(instance.getAttribute(index).getValue() - averages[position], 2)
+            for index, position, maxIndex in indexed:
+                valueIndex = instance.getAttribute(index).getIndex()
+                for i in range(maxIndex):
+                    if i == valueIndex:
+                        result[position + i] += math.pow(1 - averages[position + i], 2)
+                    else:
+                        result[position + i] += math.pow(averages[position + i], 2)
+        for i in range(size):
+            result[i] = math.sqrt(result[i] / (len(self.list) - 1))
+        return result
+
+    def moments(self) -> Moments:
+        """
+        Returns the moments of the continuous attributes of the instances, which are computed in a single pass over the
+        instances and cached.
+
+        RETURNS
+        -------
+        Moments
+            Count, mean and comoment matrix of the continuous attributes.
+        """
+        result = Moments(self.list[0].continuousAttributeSize())
+        result.merge(self.cachedStatistic("moments", self.__moments))
+        return result
+
+    def __moments(self) -> Moments:
+        """
+        Computes the moments of the continuous attributes, adding the instances to the moments in blocks.
+
+        RETURNS
+        -------
+        Moments
+            Count, mean and comoment matrix of the continuous attributes.
+        """
+        result = Moments(self.list[0].continuousAttributeSize())
+        rows = []
+        for instance in self.list:
+            rows.append(instance.continuousAttributes())
+            if len(rows) == Moments.BLOCK_SIZE:
+                result.addRows(rows)
+                rows = []
+        result.addRows(rows)
         return result
 
     def covariance(self, average: Vector) -> Matrix:
         """
-        Calculates a covariance Matrix by using an average Vector.
+        Calculates a covariance Matrix by using an average Vector. The covariance is obtained from the cached moments
+        of the instance list.
 
         PARAMETERS
         ----------
@@ -548,18 +828,7 @@ class InstanceList(object):
         Matrix
             Covariance Matrix.
         """
-        result = Matrix(self.list[0].continuousAttributeSize(), self.list[0].continuousAttributeSize())
-        for instance in self.list:
-            continuousAttributes = instance.continuousAttributes()
-            for i in range(instance.continuousAttributeSize()):
-                xi = continuousAttributes[i]
-                mi = average.getValue(i)
-                for j in range(instance.continuousAttributeSize()):
-                    xj = continuousAttributes[j]
-                    mj = average.getValue(j)
-                    result.addValue(i, j, (xi - mi) * (xj - mj))
-        result.divideByConstant(len(self.list) - 1)
-        return result
+        return self.cachedStatistic("moments", self.__moments).getCovariance(average)
 
     def getInstances(self) -> list:
         """
@@ -0,0 +1,67 @@
+from array import array
+
+from Sampling.CrossValidation import CrossValidation
+
+from Classification.InstanceList.InstanceList import InstanceList
+from Classification.InstanceList.InstanceListView import InstanceListView
+
+
+class InstanceListKFoldCrossValidation(CrossValidation):
+
+    __instanceList: InstanceList
+    __N: int
+
+    def __init__(self, instanceList: InstanceList, K: int, seed: int):
+        """
+        Constructor for K-fold cross-validation on an instance list. The instance list is shuffled in place with the
+        given seed as in KFoldCrossValidation, but the folds are views of the instance list, so the instances are not
+        copied into a new list for each fold.
+
+        PARAMETERS
+        ----------
+        instanceList : InstanceList
+            Instance list to be divided into folds.
+        K : int
+            K in K-fold cross-validation.
+        seed : int
+            Seed is used for random number generation.
+        """
+        self.__instanceList = instanceList
+        instanceList.shuffle(seed)
+        self.__N = instanceList.size()
+        self.K = K
+
+    def getTrainFold(self, k: int) -> InstanceList:
+        """
+        Returns the k'th train fold in K-fold cross-validation.
+
+        PARAMETERS
+        ----------
+        k : int
+            Index of the fold.
+
+        RETURNS
+        -------
+        InstanceList
+            View of the training instances.
+        """
+        indices = array('i', range((k * self.__N) // self.K))
+        indices.extend(range(((k + 1) * self.__N) // self.K, self.__N))
+        return InstanceListView.select(self.__instanceList, indices)
+
+    def getTestFold(self, k: int) -> InstanceList:
+        """
+        Returns the k'th test fold in K-fold cross-validation.
+
+        PARAMETERS
+        ----------
+        k : int
+            Index of the fold.
+
+        RETURNS
+        -------
+        InstanceList
+            View of the test instances.
+        """
+        return InstanceListView.select(self.__instanceList,
+                                       range((k * self.__N) // self.K, ((k + 1) * self.__N) // self.K))
@@ -5,7 +5,7 @@ class InstanceListOfSameClass(InstanceList):
 
     __classLabel: str
 
-    def __init__(self, classLabel: str):
+    def __init__(self, classLabel: str, instances=None):
         """
         Constructor for creating a new instance list with the same class labels.
 
@@ -13,8 +13,10 @@ class InstanceListOfSameClass(InstanceList):
         ----------
         classLabel : str
             Class labels of instance list.
+        instances
+            Optional list of the instances, which is used without copying.
         """
-        super().__init__()
+        super().__init__(instances)
         self.__classLabel = classLabel
 
     def getClassLabel(self) -> str:
@@ -0,0 +1,81 @@
+import random
+from array import array
+
+from Sampling.CrossValidation import CrossValidation
+
+from Classification.DataSet.SymbolTable import SymbolTable
+from Classification.InstanceList.InstanceList import InstanceList
+from Classification.InstanceList.InstanceListView import InstanceListView
+
+
+class InstanceListStratifiedKFoldCrossValidation(CrossValidation):
+
+    __instanceList: InstanceList
+    __classIndices: list
+
+    def __init__(self, instanceList: InstanceList, K: int, seed: int):
+        """
+        Constructor for stratified K-fold cross-validation on an instance list. The indices of the instances of each
+        class are shuffled with the given seed as in StratifiedKFoldCrossValidation, so the folds contain the same
+        instances in the same order. The folds are views of the instance list and the instance list itself is not
+        modified.
+
+        PARAMETERS
+        ----------
+        instanceList : InstanceList
+            Instance list to be divided into folds.
+        K : int
+            K in K-fold cross-validation.
+        seed : int
+            Seed is used for random number generation.
+        """
+        self.__instanceList = instanceList
+        classLabels = SymbolTable(instanceList.getDistinctClassLabels())
+        self.__classIndices = [array('i') for _ in range(classLabels.size())]
+        for i, instance in enumerate(instanceList.getInstances()):
+            self.__classIndices[classLabels.getCode(instance.getClassLabel())].append(i)
+        for indices in self.__classIndices:
+            random.seed(seed)
+            random.shuffle(indices)
+        self.K = K
+
+    def getTrainFold(self, k: int) -> InstanceList:
+        """
+        Returns the k'th train fold in stratified K-fold cross-validation.
+
+        PARAMETERS
+        ----------
+        k : int
+            Index of the fold.
+
+        RETURNS
+        -------
+        InstanceList
+            View of the training instances.
+        """
+        trainIndices = array('i')
+        for indices in self.__classIndices:
+            N = len(indices)
+            trainIndices.extend(indices[:(k * N) // self.K])
+            trainIndices.extend(indices[((k + 1) * N) // self.K:])
+        return InstanceListView.select(self.__instanceList, trainIndices)
+
+    def getTestFold(self, k: int) -> InstanceList:
+        """
+        Returns the k'th test fold in stratified K-fold cross-validation.
+
+        PARAMETERS
+        ----------
+        k : int
+            Index of the fold.
+
+        RETURNS
+        -------
+        InstanceList
+            View of the test instances.
+        """
+        testIndices = array('i')
+        for indices in self.__classIndices:
+            N = len(indices)
+            testIndices.extend(indices[(k * N) // self.K:((k + 1) * N) // self.K])
+        return InstanceListView.select(self.__instanceList, testIndices)
@@ -0,0 +1,137 @@
+from __future__ import annotations
+import random
+from array import array
+
+from Classification.InstanceList.ColumnarInstanceList import ColumnarInstanceList
+from Classification.InstanceList.IndexedList import IndexedList
+from Classification.InstanceList.InstanceList import InstanceList
+
+
+class InstanceListView(InstanceList):
+
+    def __init__(self, instanceList: InstanceList, indices):
+        """
+        Constructor for an instance list that is a view of another instance list. The view stores only the indices of
+        its instances in the parent list, so creating a partition, a fold or a bootstrap sample does not copy the
+        instances. A view of a view refers directly to the list of the outermost parent. All statistics methods of
+        InstanceList work on the view; adding instances copies the selected instances to an own list first.
+
+        The parent list must not be reordered while the view is in use, since the view refers to the positions of
+        the instances in the parent list.
+
+        PARAMETERS
+        ----------
+        instanceList : InstanceList
+            Parent instance list.
+        indices
+            Range or integer array of the indices of the instances in the parent list.
+        """
+        super().__init__()
+        items = instanceList.getInstances()
+        if isinstance(items, IndexedList) and items.getIndices() is not None:
+            parentIndices = items.getIndices()
+            indices = array('i', map(parentIndices.__getitem__, indices))
+            items = items.getItems()
+        self.list = IndexedList(items, indices)
+
+    def shuffle(self, seed: int):
+        """
+        Shuffles the instance list by shuffling the indices of the view.
+
+        PARAMETERS
+        ----------
+        seed : int
+            Seed is used for random number generation.
+        """
+        random.seed(seed)
+        self.list.shuffle()
+        self.invalidateStatistics()
+
+    @staticmethod
+    def select(instanceList: InstanceList, indices) -> InstanceList:
+        """
+        Returns an instance list with the instances of the given list at the given indices, without copying the
+        instances. For a columnar instance list, the result is a columnar list sharing its columns; otherwise it is an
+        InstanceListView.
+
+        PARAMETERS
+        ----------
+        instanceList : InstanceList
+            Instance list whose instances are selected.
+        indices
+            Range or integer array of the indices of the selected instances.
+
+        RETURNS
+        -------
+        InstanceList
+            Instance list of the selected instances.
+        """
+        if isinstance(instanceList, ColumnarInstanceList):
+            rows = instanceList.getInstances().getRows()
+            return instanceList.subList(array('q', map(rows.__getitem__, indices)))
+        return InstanceListView(instanceList, indices)
+
+    @staticmethod
+    def bootstrapIndices(size: int, seed: int) -> array:
+        """
+        Draws the indices of a bootstrap sample with the same random numbers as Bootstrap.
+
+        PARAMETERS
+        ----------
+        size : int
+            Size of the sampled list.
+        seed : int
+            Seed is used for random number generation.
+
+        RETURNS
+        -------
+        array
+            Indices of the sampled instances in the order they are drawn.
+        """
+        random.seed(seed)
+        indices = array('i')
+        for _ in range(size):
+            indices.append(random.randint(0, size - 1))
+        return indices
+
+    @staticmethod
+    def outOfBagIndices(size: int, seed: int) -> array:
+        """
+        Returns the indices that are not drawn in the bootstrap sample with the given seed.
+
+        PARAMETERS
+        ----------
+        size : int
+            Size of the sampled list.
+        seed : int
+            Seed is used for random number generation.
+
+        RETURNS
+        -------
+        array
+            Indices of the instances left out of the bootstrap sample, in increasing order.
+        """
+        drawn = bytearray(size)
+        for index in InstanceListView.bootstrapIndices(size, seed):
+            drawn[index] = 1
+        return array('i', [index for index in range(size) if not drawn[index]])
+
+    @staticmethod
+    def bootstrap(instanceList: InstanceList, seed: int) -> InstanceList:
+        """
+        Returns a bootstrap sample of the given instance list as a view. The sample is drawn with the same random
+        numbers as Bootstrap, so it contains the same instances in the same order, but only their indices are stored.
+
+        PARAMETERS
+        ----------
+        instanceList : InstanceList
+            Instance list to be sampled.
+        seed : int
+            Seed is used for random number generation.
+
+        RETURNS
+        -------
+        InstanceList
+            Bootstrap sample.
+        """
+        return InstanceListView.select(instanceList, InstanceListView.bootstrapIndices(instanceList.size(), seed))
@@ -0,0 +1,194 @@
+from __future__ import annotations
+import math
+from operator import mul
+
+from Math.Matrix import Matrix
+from Math.Vector import Vector
+
+
+class Moments(object):
+
+    __count: int
+    __mean: list
+    __comoment: list
+    BLOCK_SIZE = 4096
+
+    def __init__(self, dimension: int):
+        """
+        Constructor for the first and second moments of a set of vectors: the number of vectors, their mean and the
+        comoment matrix, that is, the sum of the outer products of the differences from the mean. Vectors can be added
+        one at a time with Welford's update or as blocks, and the moments of separate parts of the data can be merged
+        with Chan's formula, so the mean, the variances and the covariance matrix are computed in a single, numerically
+        stable pass.
+
+        PARAMETERS
+        ----------
+        dimension : int
+            Dimension of the vectors.
+        """
+        self.__count = 0
+        self.__mean = [0.0] * dimension
+        self.__comoment = [[0.0] * dimension for _ in range(dimension)]
+
+    def dimension(self) -> int:
+        """
+        Returns the dimension of the vectors.
+
+        RETURNS
+        -------
+        int
+            Dimension of the vectors.
+        """
+        return len(self.__mean)
+
+    def add(self, values: list):
+        """
+        Adds a single vector with Welford's update.
+
+        PARAMETERS
+        ----------
+        values : list
+            Values of the vector.
+        """
+        self.__count += 1
+        differences = [value - mean for value, mean in zip(values, self.__mean)]
+        self.__mean = [mean + difference / self.__count for mean, difference in zip(self.__mean, differences)]
+        newDifferences = [value - mean for value, mean in zip(values, self.__mean)]
+        for i in range(len(differences)):
+            di = differences[i]
+            self.__comoment[i] = [current + di * dj for current, dj in zip(self.__comoment[i], newDifferences)]
+
+    def addColumns(self, columns: list):
+        """
+        Adds a block of vectors given as columns, one sequence of values for each dimension. The moments of the block
+        are computed with two passes over the columns in memory and merged to the current moments.
+
+        PARAMETERS
+        ----------
+        columns : list
+            Columns of the block.
+        """
+        if len(columns) == 0 or len(columns[0]) == 0:
+            return
+        block = Moments(len(columns))
+        count = len(columns[0])
+        block.__count = count
+        block.__mean = [sum(column) / count for column in columns]
+        differences = [[value - mean for value in column] for column, mean in zip(columns, block.__mean)]
+        for i in range(len(differences)):
+            for j in range(i, len(differences)):
+                total = sum(map(mul, differences[i], differences[j]))
+                block.__comoment[i][j] = total
+                block.__comoment[j][i] = total
+        self.merge(block)
+
+    def addRows(self, rows: list):
+        """
+        Adds a block of vectors given as rows.
+
+        PARAMETERS
+        ----------
+        rows : list
+            Vectors of the block.
+        """
+        if len(rows) > 0:
+            self.addColumns(list(zip(*rows)))
+
+    def merge(self, moments: Moments):
+        """
+        Merges the moments of another part of the data with Chan's formula.
+
+        PARAMETERS
+        ----------
+        moments : Moments
+            Moments of the other part.
+        """
+        if moments.__count == 0:
+            return
+        if self.__count == 0:
+            self.__count = moments.__count
+            self.__mean = list(moments.__mean)
+            self.__comoment = [list(row) for row in moments.__comoment]
+            return
+        count = self.__count + moments.__count
+        differences = [mean - current for mean, current in zip(moments.__mean, self.__mean)]
+        factor = self.__count * moments.__count / count
+        self.__mean = [current + difference * moments.__count / count
+                       for current, difference in zip(self.__mean, differences)]
+        for i in range(len(differences)):
+            di = differences[i] * factor
+            self.__comoment[i] = [current + other + di * dj for current, other, dj in
+                                  zip(self.__comoment[i], moments.__comoment[i], differences)]
+        self.__count = count
+
+    def getCount(self) -> int:
+        """
+        Accessor for the number of vectors.
+
+        RETURNS
+        -------
+        int
+            Number of vectors.
+        """
+        return self.__count
+
+    def getMean(self) -> list:
+        """
+        Accessor for the mean of the vectors.
+
+        RETURNS
+        -------
+        list
+            Mean of the vectors.
+        """
+        return list(self.__mean)
+
+    def getVariance(self) -> list:
+        """
+        Returns the sample variance of each dimension.
+
+        RETURNS
+        -------
+        list
+            Variances of the dimensions.
+        """
+        return [self.__comoment[i][i] / (self.__count - 1) for i in range(len(self.__mean))]
+
+    def getStandardDeviation(self) -> list:
+        """
+        Returns the sample standard deviation of each dimension.
+
+        RETURNS
+        -------
+        list
+            Standard deviations of the dimensions.
+        """
+        return [math.sqrt(variance) for variance in self.getVariance()]
+
+    def getCovariance(self, average: Vector = None) -> Matrix:
+        """
+        Returns the sample covariance matrix. If an average is given, the differences are taken from the average
+        instead of the mean of the vectors.
+
+        PARAMETERS
+        ----------
+        average : Vector
+            Optional average vector.
+
+        RETURNS
+        -------
+        Matrix
+            Covariance matrix.
+        """
+        size = len(self.__mean)
+        result = Matrix(size, size)
+        if average is not None:
+            shifts = [self.__mean[i] - average.getValue(i) for i in range(size)]
+        else:
+            shifts = [0.0] * size
+        for i in range(size):
+            row = self.__comoment[i]
+            shift = shifts[i] * self.__count
+            for j in range(size):
+                result.setValue(i, j, (row[j] + shift * shifts[j]) / (self.__count - 1))
+        return result
@@ -1,7 +1,10 @@
 import random
+from array import array
 
+from Classification.DataSet.SymbolTable import SymbolTable
 from Classification.InstanceList.InstanceList import InstanceList
 from Classification.InstanceList.InstanceListOfSameClass import InstanceListOfSameClass
+from Classification.InstanceList.InstanceListView import InstanceListView
 
 
 class Partition(object):
@@ -11,7 +14,8 @@ class Partition(object):
     def __init__(self, instanceList: InstanceList = None, ratio=None, seed=None, stratified: bool = None):
         """
         Divides the instances in the instance list into partitions so that all instances of a class are grouped in a
-        single partition.
+        single partition. The partitions are views of the instance list, which store only the indices of their
+        instances.
         PARAMETERS
         ----------
         ratio
@@ -23,15 +27,16 @@ class Partition(object):
         self.__multilist = []
         if instanceList is not None:
             if ratio is None:
-                classLabels = instanceList.getDistinctClassLabels()
-                for classLabel in classLabels:
-                    self.add(InstanceListOfSameClass(classLabel))
-                for instance in instanceList.getInstances():
-                    self.get(classLabels.index(instance.getClassLabel())).add(instance)
+                classLabels = SymbolTable(instanceList.getDistinctClassLabels())
+                indices = [array('i') for _ in range(classLabels.size())]
+                for i, instance in enumerate(instanceList.getInstances()):
+                    indices[classLabels.getCode(instance.getClassLabel())].append(i)
+                for i in range(classLabels.size()):
+                    self.add(InstanceListOfSameClass(classLabels.getSymbol(i),
+                                                     InstanceListView.select(instanceList, indices[i]).getInstances()))
             else:
                 if isinstance(ratio, float):
-                    self.add(InstanceList())
-                    self.add(InstanceList())
+                    indices = [array('i'), array('i')]
                     if stratified:
                         distribution = instanceList.classDistribution()
                         counts = [0] * len(distribution)
@@ -43,44 +48,58 @@ class Partition(object):
                             classIndex = distribution.getIndex(instance.getClassLabel())
                             if counts[classIndex] < instanceList.size() * ratio * \
                                     distribution.getProbability(instance.getClassLabel()):
-                                self.get(0).add(instance)
+                                indices[0].append(randomArray[i])
                             else:
-                                self.get(1).add(instance)
+                                indices[1].append(randomArray[i])
                             counts[classIndex] = counts[classIndex] + 1
                     else:
                         instanceList.shuffle(seed)
-                        for i in range(self.size()):
-                            instance = instanceList.get(i)
+                        for i in range(instanceList.size()):
                             if i < instanceList.size() * ratio:
-                                self.get(0).add(instance)
+                                indices[0].append(i)
                             else:
-                                self.get(1).add(instance)
+                                indices[1].append(i)
+                    self.__addViews(instanceList, indices)
                 elif isinstance(ratio, int):
                     attributeIndex = ratio
                     if seed is None:
-                        valueList = instanceList.getAttributeValueList(attributeIndex)
-                        for _ in valueList:
-                            self.add(InstanceList())
-                        for instance in instanceList.getInstances():
-                            self.get(valueList.index(instance.getAttribute(attributeIndex).getValue())).add(instance)
+                        valueList = SymbolTable(instanceList.getAttributeValueList(attributeIndex))
+                        indices = [array('i') for _ in range(valueList.size())]
+                        for i, instance in enumerate(instanceList.getInstances()):
+                            indices[valueList.getCode(instance.getAttribute(attributeIndex).getValue())].append(i)
+                        self.__addViews(instanceList, indices)
                     elif isinstance(seed, int):
                         attributeValue = seed
-                        self.add(InstanceList())
-                        self.add(InstanceList())
-                        for instance in instanceList.getInstances():
+                        indices = [array('i'), array('i')]
+                        for i, instance in enumerate(instanceList.getInstances()):
                             if instance.getAttribute(attributeIndex).getIndex() == attributeValue:
-                                self.get(0).add(instance)
+                                indices[0].append(i)
                             else:
-                                self.get(1).add(instance)
+                                indices[1].append(i)
+                        self.__addViews(instanceList, indices)
                     elif isinstance(seed, float):
                         splitValue = seed
-                        self.add(InstanceList())
-                        self.add(InstanceList())
-                        for instance in instanceList.getInstances():
+                        indices = [array('i'), array('i')]
+                        for i, instance in enumerate(instanceList.getInstances()):
                             if instance.getAttribute(attributeIndex).getValue() < splitValue:
-                                self.get(0).add(instance)
+                                indices[0].append(i)
                             else:
-                                self.get(1).add(instance)
+                                indices[1].append(i)
+                        self.__addViews(instanceList, indices)
+
+    def __addViews(self, instanceList: InstanceList, indices: list):
+        """
+        Adds a view of the given instance list for each index array as a new partition. The instances are not copied.
+
+        PARAMETERS
+        ----------
+        instanceList : InstanceList
+            Instance list to be partitioned.
+        indices : list
+            Index arrays of the partitions.
+        """
+        for partitionIndices in indices:
+            self.add(InstanceListView.select(instanceList, partitionIndices))
 
     def add(self, _list: InstanceList):
         """
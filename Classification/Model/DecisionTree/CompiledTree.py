@@ -0,0 +1,277 @@
+from array import array
+
+from Classification.Attribute.ContinuousAttribute import ContinuousAttribute
+from Classification.Attribute.DiscreteIndexedAttribute import DiscreteIndexedAttribute
+from Classification.DataSet.SymbolTable import SymbolTable
+from Classification.Instance.CompositeInstance import CompositeInstance
+from Classification.Instance.Instance import Instance
+from Classification.Model.DecisionTree.DecisionNode import DecisionNode
+
+
+class CompiledTree(object):
+
+    __attributeIndex: array
+    __splitType: array
+    __splitValue: array
+    __firstChild: array
+    __childCount: array
+    __childOfValue: list
+    __classCode: array
+    __classLabels: SymbolTable
+    __classCounts: array
+    LEAF = 0
+    CONTINUOUS = 1
+    DISCRETE = 2
+    DISCRETE_INDEXED = 3
+
+    def __init__(self, root: DecisionNode):
+        """
+        Constructor that compiles a trained decision tree into flat arrays. The nodes are numbered in breadth first
+        order, so the children of a node are consecutive. For each node, the index of the tested attribute, the type
+        and value of the split, the number of the first child, the number of children and the code of the class label
+        are stored; for discrete splits a map from the values to the children is stored. The class distributions of
+        the nodes are stored as rows of class counts in a single array for the prediction of composite instances, so
+        the compiled tree holds no instances. Prediction walks the arrays instead of the linked nodes and gives the
+        same result as the predict method of the nodes.
+
+        PARAMETERS
+        ----------
+        root : DecisionNode
+            Root of the trained decision tree.
+        """
+        self.__attributeIndex = array('i')
+        self.__splitType = array('b')
+        self.__splitValue = array('d')
+        self.__firstChild = array('i')
+        self.__childCount = array('i')
+        self.__childOfValue = []
+        self.__classCode = array('i')
+        self.__classLabels = SymbolTable(list(root.classDistribution().keys()))
+        self.__classCounts = array('i')
+        nodes = [root]
+        current = 0
+        while current < len(nodes):
+            node = nodes[current]
+            self.__classCode.append(self.__classLabels.getCode(node.getClassLabel()))
+            distribution = node.classDistribution()
+            self.__classCounts.extend([int(distribution.get(classLabel, 0))
+                                       for classLabel in self.__classLabels.getSymbols()])
+            self.__firstChild.append(len(nodes))
+            if node.leaf or len(node.children) == 0:
+                self.__attributeIndex.append(-1)
+                self.__splitType.append(self.LEAF)
+                self.__splitValue.append(0.0)
+                self.__childCount.append(0)
+                self.__childOfValue.append(None)
+            else:
+                condition = node.children[0].getCondition()
+                value = condition.getValue()
+                self.__attributeIndex.append(condition.getAttributeIndex())
+                self.__childCount.append(len(node.children))
+                if isinstance(value, DiscreteIndexedAttribute):
+                    self.__splitType.append(self.DISCRETE_INDEXED)
+                    self.__splitValue.append(value.getIndex())
+                    self.__childOfValue.append(None)
+                elif isinstance(value, ContinuousAttribute):
+                    self.__splitType.append(self.CONTINUOUS)
+                    self.__splitValue.append(value.getValue())
+                    self.__childOfValue.append(None)
+                else:
+                    self.__splitType.append(self.DISCRETE)
+                    self.__splitValue.append(0.0)
+                    childOfValue = {}
+                    for i in range(len(node.children)):
+                        childValue = node.children[i].getCondition().getValue().getValue()
+                        if childValue not in childOfValue:
+                            childOfValue[childValue] = len(nodes) + i
+                    self.__childOfValue.append(childOfValue)
+                nodes.extend(node.children)
+            current += 1
+
+    def size(self) -> int:
+        """
+        Returns the number of nodes.
+
+        RETURNS
+        -------
+        int
+            Number of nodes.
+        """
+        return len(self.__attributeIndex)
+
+    def __child(self, node: int, instance: Instance) -> int:
+        """
+        Finds the child of the given internal node whose condition the instance satisfies.
+
+        PARAMETERS
+        ----------
+        node : int
+            Number of the node.
+        instance : Instance
+            Instance to route.
+
+        RETURNS
+        -------
+        int
+            Number of the child, -1 if the instance satisfies no condition.
+        """
+        splitType = self.__splitType[node]
+        attribute = instance.getAttribute(self.__attributeIndex[node])
+        if splitType == self.CONTINUOUS:
+            value = attribute.getValue()
+            if value <= self.__splitValue[node]:
+                return self.__firstChild[node]
+            if value > self.__splitValue[node]:
+                return self.__firstChild[node] + 1
+            return -1
+        if splitType == self.DISCRETE_INDEXED:
+            if attribute.getIndex() == self.__splitValue[node]:
+                return self.__firstChild[node]
+            return self.__firstChild[node] + 1
+        return self.__childOfValue[node].get(attribute.getValue(), -1)
+
+    def predict(self, instance: Instance) -> str:
+        """
+        Predicts the class label of an instance by walking the arrays from the root to a leaf. For a composite
+        instance, the prediction is the most occurring possible class label in the class distribution of the deepest
+        node on the path that has one.
+
+        PARAMETERS
+        ----------
+        instance : Instance
+            Instance to make prediction.
+
+        RETURNS
+        -------
+        str
+            The prediction for given instance.
+        """
+        if isinstance(instance, CompositeInstance):
+            return self.__predictComposite(instance)
+        splitTypes = self.__splitType
+        attributeIndexes = self.__attributeIndex
+        splitValues = self.__splitValue
+        firstChildren = self.__firstChild
+        node = 0
+        splitType = splitTypes[0]
+        while splitType != self.LEAF:
+            attribute = instance.getAttribute(attributeIndexes[node])
+            if splitType == self.CONTINUOUS:
+                value = attribute.getValue()
+                if value <= splitValues[node]:
+                    node = firstChildren[node]
+                elif value > splitValues[node]:
+                    node = firstChildren[node] + 1
+                else:
+                    break
+            elif splitType == self.DISCRETE_INDEXED:
+                node = firstChildren[node] if attribute.getIndex() == splitValues[node] else firstChildren[node] + 1
+            else:
+                child = self.__childOfValue[node].get(attribute.getValue(), -1)
+                if child == -1:
+                    break
+                node = child
+            splitType = splitTypes[node]
+        return self.__classLabels.getSymbol(self.__classCode[node])
+
+    def __predictComposite(self, instance: CompositeInstance) -> str:
+        """
+        Predicts the class label of a composite instance using the class counts of the nodes on its path. At each node,
+        the most occurring possible class label is found as in the getMaxItemIncludeTheseOnly method of the class
+        distribution: the possible class labels are scanned in order and a later label wins only with a larger count.
+
+        PARAMETERS
+        ----------
+        instance : CompositeInstance
+            Instance to make prediction.
+
+        RETURNS
+        -------
+        str
+            The prediction for given instance.
+        """
+        possibleClassLabels = instance.getPossibleClassLabels()
+        codes = [self.__classLabels.indexOf(classLabel) for classLabel in possibleClassLabels]
+        classCount = self.__classLabels.size()
+        predictedClass = None
+        node = 0
+        while node != -1:
+            base = node * classCount
+            maxValue = -1
+            predictedClass = ""
+            for classLabel, code in zip(possibleClassLabels, codes):
+                frequency = self.__classCounts[base + code] if code != -1 else 0
+                if frequency > maxValue:
+                    maxValue = frequency
+                    predictedClass = classLabel
+            if self.__splitType[node] == self.LEAF:
+                break
+            node = self.__child(node, instance)
+        return predictedClass
+
+    def predictBatch(self, instances: list) -> list:
+        """
+        Predicts the class labels of a list of instances. The instances are routed together level by level: the
+        instances reaching a node are divided among its children with a single test each, and all instances reaching
+        a leaf get its class label. Composite instances are predicted one by one.
+
+        PARAMETERS
+        ----------
+        instances : list
+            Instances to make prediction.
+
+        RETURNS
+        -------
+        list
+            Predictions in the order of the instances.
+        """
+        predictions = [None] * len(instances)
+        rows = []
+        for i in range(len(instances)):
+            if isinstance(instances[i], CompositeInstance):
+                predictions[i] = self.__predictComposite(instances[i])
+            else:
+                rows.append(i)
+        stack = [(0, rows)]
+        while len(stack) > 0:
+            node, rows = stack.pop()
+            if self.__splitType[node] == self.LEAF:
+                label = self.__classLabels.getSymbol(self.__classCode[node])
+                for i in rows:
+                    predictions[i] = label
+                continue
+            attributeIndex = self.__attributeIndex[node]
+            splitType = self.__splitType[node]
+            groups = [[] for _ in range(self.__childCount[node])]
+            unmatched = []
+            if splitType == self.CONTINUOUS:
+                splitValue = self.__splitValue[node]
+                left, right = groups[0], groups[1]
+                for i in rows:
+                    value = instances[i].getAttribute(attributeIndex).getValue()
+                    if value <= splitValue:
+                        left.append(i)
+                    elif value > splitValue:
+                        right.append(i)
+                    else:
+                        unmatched.append(i)
+            elif splitType == self.DISCRETE_INDEXED:
+                splitValue = self.__splitValue[node]
+                for i in rows:
+                    groups[0 if instances[i].getAttribute(attributeIndex).getIndex() == splitValue else 1].append(i)
+            else:
+                childOfValue = self.__childOfValue[node]
+                firstChild = self.__firstChild[node]
+                for i in rows:
+                    child = childOfValue.get(instances[i].getAttribute(attributeIndex).getValue(), -1)
+                    if child == -1:
+                        unmatched.append(i)
+                    else:
+                        groups[child - firstChild].append(i)
+            label = self.__classLabels.getSymbol(self.__classCode[node])
+            for i in unmatched:
+                predictions[i] = label
+            for child in range(len(groups)):
+                if len(groups[child]) > 0:
+                    stack.append((self.__firstChild[node] + child, groups[child]))
+        return predictions
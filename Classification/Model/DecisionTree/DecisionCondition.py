@@ -27,6 +27,39 @@ class DecisionCondition(object):
         self.__comparison = comparison
         self.__value = value
 
+    def getAttributeIndex(self) -> int:
+        """
+        Accessor for the attributeIndex.
+
+        RETURNS
+        -------
+        int
+            Index of the attribute.
+        """
+        return self.__attributeIndex
+
+    def getValue(self) -> Attribute:
+        """
+        Accessor for the value.
+
+        RETURNS
+        -------
+        Attribute
+            Value of the condition.
+        """
+        return self.__value
+
+    def getComparison(self) -> str:
+        """
+        Accessor for the comparison character.
+
+        RETURNS
+        -------
+        str
+            Comparison character of the condition.
+        """
+        return self.__comparison
+
     def satisfy(self, instance: Instance):
         """
         The satisfy method takes an Instance as an input.
@@ -1,14 +1,21 @@
+import heapq
+from array import array
+
 from Math.DiscreteDistribution import DiscreteDistribution
 
 from Classification.Attribute.ContinuousAttribute import ContinuousAttribute
 from Classification.Attribute.DiscreteAttribute import DiscreteAttribute
 from Classification.Attribute.DiscreteIndexedAttribute import DiscreteIndexedAttribute
+from Classification.DataSet.SymbolTable import SymbolTable
 from Classification.Instance.CompositeInstance import CompositeInstance
 from Classification.Instance.Instance import Instance
 from Classification.InstanceList.InstanceList import InstanceList
 from Classification.InstanceList.Partition import Partition
 from Classification.Model.DecisionTree.DecisionCondition import DecisionCondition
+from Classification.Model.DecisionTree.EntropyKernel import EntropyKernel
+from Classification.Model.DecisionTree.Histogram import Histogram
 from Classification.Model.Model import Model
+from Classification.Parameter.DecisionTreeParameter import DecisionTreeParameter
 from Classification.Parameter.RandomForestParameter import RandomForestParameter
 import random
 
@@ -17,32 +24,49 @@ class DecisionNode(object):
 
     children: list
     __data: InstanceList
+    __distribution: DiscreteDistribution
     __classLabel: str
     leaf: bool
     __condition: DecisionCondition
+    __depth: int
+    __split: tuple
+    __gain: float
     EPSILON = 0.0000000001
 
-    def __init__(self, data: InstanceList, condition=None, parameter=None, isStump=False):
+    def __init__(self, data: InstanceList, condition=None, parameter=None, isStump=False, sortedIndices=None,
+                 histogram=None, depth=0, grow=True):
         """
         The DecisionNode method takes InstanceList data as input and then it sets the class label parameter by finding
         the most occurred class label of given data, it then gets distinct class labels as class labels ArrayList.
-        Later, it adds ordered indices to the indexList and shuffles them randomly. Then, it gets the class distribution
-        of given data and finds the best entropy value of these class distribution.
+        Later, it adds ordered indices to the indexList and shuffles them randomly. Then, it codes the class labels of
+        the given data as integers and finds the entropy of the class counts. The candidate splits are scored by an
+        EntropyKernel on class count arrays.
 
-        If an attribute of given data is DiscreteIndexedAttribute, it creates a Distribution according to discrete
-        indexed attribute class distribution and finds the entropy. If it is better than the last best entropy it
-        reassigns the best entropy, best attribute and best split value according to the newly founded best entropy's
-        index. At the end, it also add new distribution to the class distribution.
+        The class counts of the values of the discrete attributes are found in a single pass as a contingency table.
+        If an attribute of given data is DiscreteIndexedAttribute, each index is scored against the rest. If the entropy is better than the last best entropy it reassigns the
+        best entropy, best attribute and best split value.
 
         If an attribute of given data is DiscreteAttribute, it directly finds the entropy. If it is better than the last
-        best entropy it reassigns the best entropy, best attribute and best split value according to the newly founded
-        best entropy's index.
+        best entropy it reassigns the best entropy and best attribute.
+
+        If an attribute of given data is ContinuousAttribute, the data is sorted with respect to the attribute, the
+        class counts of the two sides are updated while scanning the sorted instances, and each split between
+        consecutive distinct values is scored. If it is better than the last best entropy it reassigns the best entropy,
+        best attribute and best split value.
+
+        If the parameter requests presorting, the data is not sorted at every node. Instead, the positions of the
+        instances are sorted with respect to each continuous attribute once at the root, and the sorted positions are
+        partitioned stably into the children, so the split search over a continuous attribute is a linear scan. If the
+        parameter requests histogram splits, the continuous attributes are binned once at the root and the splits are
+        searched over the bin edges from the class counts of the bins. If the parameter requests a lean tree, the node
+        releases its data once its children are built and keeps only its class distribution.
 
-        If an attribute of given data is ContinuousAttribute, it creates two distributions; left and right according
-        to class distribution and discrete distribution respectively, and finds the entropy. If it is better than the
-        last best entropy it reassigns the best entropy, best attribute and best split value according to the newly
-        founded best entropy's index. At the end, it also add new distribution to the right distribution and removes
-        from left distribution.
+        The stopping controls of the parameter are enforced at each node: a node at the maximum depth or with fewer
+        instances than the minimum split size is not split, splits giving a child smaller than the minimum leaf size
+        are not considered, and a split is made only if its information gain is larger than the minimum gain. If the
+        parameter limits the number of leaves, the root grows the tree best first: the children are created without
+        being split, and the leaf whose split decreases the total entropy most is split next, until the limit is
+        reached.
 
         PARAMETERS
         ----------
@@ -50,10 +74,20 @@ class DecisionNode(object):
             InstanceList input.
         condition : DecisionCondition
             DecisionCondition to check.
-        parameter : RandomForestParameter
-            RandomForestParameter like seed, ensembleSize, attributeSubsetSize.
+        parameter : DecisionTreeParameter
+            DecisionTreeParameter like seed, presort; for random forests also ensembleSize, attributeSubsetSize.
         isStump : bool
             Refers to decision trees with only 1 splitting rule.
+        sortedIndices : list
+            For each attribute, the positions of the instances in the data sorted with respect to the attribute if it
+            is continuous, None otherwise. Given by the parent node in presort mode.
+        histogram : Histogram
+            Class histograms of the continuous attributes. Given by the parent node in histogram mode.
+        depth : int
+            Depth of the node, 0 for the root.
+        grow : bool
+            If true, the node creates its subtree. If false, the node only finds its best split, which is made later
+            in best first growth.
         """
         bestAttribute = -1
         bestSplitValue = 0
@@ -62,89 +96,299 @@ class DecisionNode(object):
         self.__classLabel = Model.getMaximum(self.__data.getClassLabels())
         self.leaf = True
         self.children = []
+        self.__distribution = None
+        self.__depth = depth
+        self.__split = None
+        self.__gain = 0.0
+        controlled = isinstance(parameter, DecisionTreeParameter)
+        lean = controlled and parameter.isLean()
+        minLeafSize = parameter.getMinLeafSize() if controlled else 1
         classLabels = self.__data.getDistinctClassLabels()
-        if len(classLabels) == 1:
-            return
-        if isStump and condition is not None:
+        if len(classLabels) == 1 or (isStump and condition is not None) or \
+                (controlled and (0 < parameter.getMaxDepth() <= depth or data.size() < parameter.getMinSplitSize())):
+            if lean:
+                self.__release()
             return
         indexList = [i for i in range(data.get(0).attributeSize())]
-        if parameter is not None and parameter.getAttributeSubsetSize() < data.get(0).attributeSize():
+        if isinstance(parameter, RandomForestParameter) and parameter.getAttributeSubsetSize() < data.get(0).attributeSize():
             random.seed(parameter.getSeed())
             random.shuffle(indexList)
             size = parameter.getAttributeSubsetSize()
         else:
             size = data.get(0).attributeSize()
-        classDistribution = data.classDistribution()
-        bestEntropy = data.classDistribution().entropy()
+        instances = None
+        if sortedIndices is None and histogram is None and isinstance(parameter, DecisionTreeParameter):
+            if parameter.getHistogramBins() > 0:
+                instances = list(data.getInstances())
+                histogram = Histogram(instances, parameter.getHistogramBins())
+            elif parameter.isPresort():
+                instances = list(data.getInstances())
+                sortedIndices = self.__sortAttributes(instances)
+        elif sortedIndices is not None or histogram is not None:
+            instances = list(data.getInstances())
+        kernel = EntropyKernel(classLabels, data.size())
+        classCodes = kernel.classCodes(data.getInstances())
+        classCounts = kernel.counts(classCodes)
+        nodeEntropy = kernel.entropy(classCounts, data.size())
+        bestEntropy = nodeEntropy - parameter.getMinGain() if controlled else nodeEntropy
+        table = data.contingencyTable([index for index in indexList[:size]
+                                       if isinstance(data.get(0).getAttribute(index), DiscreteAttribute)],
+                                      classLabels, True)
         for j in range(size):
             index = indexList[j]
             if isinstance(data.get(0).getAttribute(index), DiscreteIndexedAttribute):
-                for k in range(data.get(0).getAttribute(index).getMaxIndex()):
-                    distribution = data.discreteIndexedAttributeClassDistribution(index, k)
-                    if distribution.getSum() > 0:
-                        classDistribution.removeDistribution(distribution)
-                        entropy = (classDistribution.entropy() * classDistribution.getSum() + distribution.entropy() * distribution.getSum()) / data.size()
-                        if entropy + self.EPSILON < bestEntropy:
-                            bestEntropy = entropy
-                            bestAttribute = index
-                            bestSplitValue = k
-                        classDistribution.addDistribution(distribution)
+                entropy, splitIndex = kernel.indexedSplit(table.getValues(index), table.getCounts(index),
+                                                          data.get(0).getAttribute(index).getMaxIndex(), classCounts,
+                                                          bestEntropy, self.EPSILON, minLeafSize)
+                if splitIndex is not None:
+                    bestEntropy = entropy
+                    bestAttribute = index
+                    bestSplitValue = splitIndex
             elif isinstance(data.get(0).getAttribute(index), DiscreteAttribute):
-                entropy = self.__entropyForDiscreteAttribute(index)
-                if entropy + self.EPSILON < bestEntropy:
+                branchCounts = table.getCounts(index)
+                entropy = kernel.discreteSplit(branchCounts, data.size())
+                if entropy + self.EPSILON < bestEntropy and min(map(sum, branchCounts)) >= minLeafSize:
                     bestEntropy = entropy
                     bestAttribute = index
+            elif isinstance(data.get(0).getAttribute(index), ContinuousAttribute) and histogram is not None:
+                entropy, splitValue = histogram.bestSplit(index, bestEntropy, self.EPSILON, minLeafSize)
+                if splitValue is not None:
+                    bestEntropy = entropy
+                    bestSplitValue = splitValue
+                    bestAttribute = index
             elif isinstance(data.get(0).getAttribute(index), ContinuousAttribute):
-                data.sortWrtAttribute(index)
-                previousValue = -100000000
-                leftDistribution = data.classDistribution()
-                rightDistribution = DiscreteDistribution()
-                for k in range(data.size()):
-                    instance = data.get(k)
-                    if k == 0:
-                        previousValue = instance.getAttribute(index).getValue()
-                    elif instance.getAttribute(index).getValue() != previousValue:
-                        splitValue = (previousValue + instance.getAttribute(index).getValue()) / 2
-                        previousValue = instance.getAttribute(index).getValue()
-                        entropy = (leftDistribution.getSum() / data.size()) * leftDistribution.entropy() + (rightDistribution.getSum() / data.size()) * rightDistribution.entropy()
-                        if entropy + self.EPSILON < bestEntropy:
-                            bestEntropy = entropy
-                            bestSplitValue = splitValue
-                            bestAttribute = index
-                    leftDistribution.removeItem(instance.getClassLabel())
-                    rightDistribution.addItem(instance.getClassLabel())
+                if sortedIndices is None:
+                    data.sortWrtAttribute(index)
+                    sortedInstances = data.getInstances()
+                    classCodes = kernel.classCodes(sortedInstances)
+                    sortedCodes = classCodes
+                else:
+                    sortedInstances = list(map(instances.__getitem__, sortedIndices[index]))
+                    sortedCodes = list(map(classCodes.__getitem__, sortedIndices[index]))
+                entropy, splitValue = kernel.continuousSplit([instance.getAttribute(index).getValue()
+                                                              for instance in sortedInstances], sortedCodes,
+                                                             bestEntropy, self.EPSILON, minLeafSize)
+                if splitValue is not None:
+                    bestEntropy = entropy
+                    bestSplitValue = splitValue
+                    bestAttribute = index
         if bestAttribute != -1:
-            self.leaf = False
-            if isinstance(data.get(0).getAttribute(bestAttribute), DiscreteIndexedAttribute):
-                self.__createChildrenForDiscreteIndexed(bestAttribute, bestSplitValue, parameter, isStump)
-            elif isinstance(data.get(0).getAttribute(bestAttribute), DiscreteAttribute):
-                self.__createChildrenForDiscrete(bestAttribute, parameter, isStump)
-            elif isinstance(data.get(0).getAttribute(bestAttribute), ContinuousAttribute):
-                self.__createChildrenForContinuous(bestAttribute, bestSplitValue, parameter, isStump)
+            if histogram is not None and isinstance(data.get(0).getAttribute(bestAttribute), ContinuousAttribute):
+                bestSplitValue = self.__midpoint(instances, bestAttribute, bestSplitValue)
+            self.__split = (bestAttribute, bestSplitValue, instances, sortedIndices, histogram)
+            self.__gain = data.size() * (nodeEntropy - bestEntropy)
+        if not grow:
+            return
+        if controlled and parameter.getMaxLeafCount() > 0:
+            self.__growBestFirst(parameter, isStump)
+        else:
+            if self.__split is not None:
+                self.__expand(parameter, isStump, True)
+            if lean:
+                self.__release()
 
-    def __entropyForDiscreteAttribute(self, attributeIndex: int):
+    def __expand(self, parameter: DecisionTreeParameter, isStump: bool, grow: bool):
         """
-        The entropyForDiscreteAttribute method takes an attributeIndex and creates an ArrayList of DiscreteDistribution.
-        Then loops through the distributions and calculates the total entropy.
+        Makes the best split of the node by creating its children.
 
         PARAMETERS
         ----------
+        parameter : DecisionTreeParameter
+            DecisionTreeParameter like seed, presort.
+        isStump : bool
+            Refers to decision trees with only 1 splitting rule.
+        grow : bool
+            If true, the children create their subtrees, otherwise they only find their best splits.
+        """
+        attributeIndex, splitValue, instances, sortedIndices, histogram = self.__split
+        self.__split = None
+        self.leaf = False
+        attribute = self.__data.get(0).getAttribute(attributeIndex)
+        if isinstance(attribute, DiscreteIndexedAttribute):
+            self.__createChildrenForDiscreteIndexed(attributeIndex, splitValue, parameter, isStump, instances,
+                                                    sortedIndices, histogram, grow)
+        elif isinstance(attribute, DiscreteAttribute):
+            self.__createChildrenForDiscrete(attributeIndex, parameter, isStump, instances, sortedIndices, histogram,
+                                             grow)
+        elif isinstance(attribute, ContinuousAttribute):
+            self.__createChildrenForContinuous(attributeIndex, splitValue, parameter, isStump, instances,
+                                               sortedIndices, histogram, grow)
+
+    def __splitSize(self) -> int:
+        """
+        Returns the number of children the best split of the node creates.
+
+        RETURNS
+        -------
+        int
+            Number of children of the split.
+        """
+        attribute = self.__data.get(0).getAttribute(self.__split[0])
+        if isinstance(attribute, DiscreteAttribute) and not isinstance(attribute, DiscreteIndexedAttribute):
+            return len(self.__data.getAttributeValueList(self.__split[0]))
+        return 2
+
+    def __growBestFirst(self, parameter: DecisionTreeParameter, isStump: bool):
+        """
+        Grows the tree rooted at this node best first. The leaves with a split are kept in a priority queue ordered by
+        the decrease in the total entropy of their splits, ties broken by creation order, and the best leaf is split
+        as long as the number of leaves stays within the limit. A leaf whose split would exceed the limit is skipped.
+        Finally, the remaining leaves drop their splits and, in lean mode, release their data.
+
+        PARAMETERS
+        ----------
+        parameter : DecisionTreeParameter
+            DecisionTreeParameter with the maximum number of leaves.
+        isStump : bool
+            Refers to decision trees with only 1 splitting rule.
+        """
+        leafCount = 1
+        candidates = []
+        order = 0
+        if self.__split is not None:
+            candidates.append((-self.__gain, order, self))
+        while len(candidates) > 0:
+            _, _, node = heapq.heappop(candidates)
+            childCount = node.__splitSize()
+            if leafCount + childCount - 1 > parameter.getMaxLeafCount():
+                continue
+            node.__expand(parameter, isStump, False)
+            leafCount += childCount - 1
+            if parameter.isLean():
+                node.__release()
+            for child in node.children:
+                if child.__split is not None:
+                    order += 1
+                    heapq.heappush(candidates, (-child.__gain, order, child))
+        nodes = [self]
+        while len(nodes) > 0:
+            node = nodes.pop()
+            node.__split = None
+            if parameter.isLean() and node.__data is not None:
+                node.__release()
+            nodes.extend(node.children)
+
+    def __release(self):
+        """
+        Replaces the data of the node with its class distribution, which is all that prediction and pruning need.
+        """
+        self.__distribution = self.__data.classDistribution()
+        self.__data = None
+
+    @staticmethod
+    def __midpoint(instances: list, attributeIndex: int, edge: float) -> float:
+        """
+        Moves a split value found on a bin edge to the midpoint between the largest value below the edge and the
+        smallest value above the edge, as the exact split search does.
+
+        PARAMETERS
+        ----------
+        instances : list
+            Instances of the node.
         attributeIndex : int
-            Index of the attribute.
+            Index of the continuous attribute.
+        edge : float
+            Bin edge of the split.
 
         RETURNS
         -------
         float
-            Total entropy for the discrete attribute.
+            Split value.
+        """
+        values = [instance.getAttribute(attributeIndex).getValue() for instance in instances]
+        return (max(value for value in values if value < edge) + min(value for value in values if value >= edge)) / 2
+
+    @staticmethod
+    def __sortAttributes(instances: list) -> list:
+        """
+        Sorts the positions of the instances with respect to each continuous attribute. The sort is stable, so
+        instances with equal values keep the order of the data.
+
+        PARAMETERS
+        ----------
+        instances : list
+            Instances of the root node.
+
+        RETURNS
+        -------
+        list
+            For each attribute, the sorted positions if the attribute is continuous, None otherwise.
+        """
+        sortedIndices = []
+        for index in range(instances[0].attributeSize()):
+            if isinstance(instances[0].getAttribute(index), ContinuousAttribute):
+                sortedIndices.append(array('i', sorted(range(len(instances)),
+                                                       key=lambda position: instances[position].getAttribute(index)
+                                                       .getValue())))
+            else:
+                sortedIndices.append(None)
+        return sortedIndices
+
+    @staticmethod
+    def __childSortedIndices(sortedIndices: list, childOf: list, childCount: int) -> list:
+        """
+        Partitions the sorted positions of a node into its children. The positions in a child are the ranks of the
+        instances among the instances of that child, which are in the order of the data of the node, as in Partition.
+
+        PARAMETERS
+        ----------
+        sortedIndices : list
+            Sorted positions of the node for each attribute.
+        childOf : list
+            Child of each instance of the node.
+        childCount : int
+            Number of children.
+
+        RETURNS
+        -------
+        list
+            Sorted positions of each child for each attribute.
+        """
+        counts = [0] * childCount
+        ranks = array('i', bytes(4 * len(childOf)))
+        for position in range(len(childOf)):
+            ranks[position] = counts[childOf[position]]
+            counts[childOf[position]] += 1
+        result = [[] for _ in range(childCount)]
+        for order in sortedIndices:
+            if order is None:
+                for childIndices in result:
+                    childIndices.append(None)
+            else:
+                childOrders = [array('i') for _ in range(childCount)]
+                for position in order:
+                    childOrders[childOf[position]].append(ranks[position])
+                for child in range(childCount):
+                    result[child].append(childOrders[child])
+        return result
+
+    def __childStates(self, childOf: list, childCount: int, sortedIndices: list, histogram: Histogram) -> list:
         """
-        total = 0.0
-        distributions = self.__data.attributeClassDistribution(attributeIndex)
-        for distribution in distributions:
-            total += (distribution.getSum() / self.__data.size()) * distribution.entropy()
-        return total
+        Derives the sorted positions and the histograms of the children from those of the node.
+
+        PARAMETERS
+        ----------
+        childOf : list
+            Child of each instance of the node.
+        childCount : int
+            Number of children.
+        sortedIndices : list
+            Sorted positions of the node in presort mode, None otherwise.
+        histogram : Histogram
+            Class histograms of the node in histogram mode, None otherwise.
+
+        RETURNS
+        -------
+        list
+            Sorted positions and histogram of each child.
+        """
+        if histogram is not None:
+            return [(None, childHistogram) for childHistogram in histogram.split(childOf, childCount)]
+        return [(childIndices, None) for childIndices in self.__childSortedIndices(sortedIndices, childOf, childCount)]
 
     def __createChildrenForDiscreteIndexed(self, attributeIndex: int, attributeValue: int,
-                                           parameter: RandomForestParameter, isStump: bool):
+                                           parameter: DecisionTreeParameter, isStump: bool, instances: list,
+                                           sortedIndices: list, histogram: Histogram, grow: bool):
         """
         The createChildrenForDiscreteIndexed method creates an list of DecisionNodes as children and a partition with
         respect to indexed attribute.
@@ -155,22 +399,38 @@ class DecisionNode(object):
             Index of the attribute.
         attributeValue : int
             Value of the attribute.
-        parameter : RandomForestParameter
-            RandomForestParameter like seed, ensembleSize, attributeSubsetSize.
+        parameter : DecisionTreeParameter
+            DecisionTreeParameter like seed, presort.
         isStump : bool
             Refers to decision trees with only 1 splitting rule.
+        instances : list
+            Instances of the node in presort or histogram mode, None otherwise.
+        sortedIndices : list
+            Sorted positions of the node in presort mode, None otherwise.
+        histogram : Histogram
+            Class histograms of the node in histogram mode, None otherwise.
+        grow : bool
+            If true, the children create their subtrees.
         """
         childrenData = Partition(self.__data, attributeIndex, attributeValue)
+        childStates = [(None, None), (None, None)]
+        if instances is not None:
+            childOf = [0 if instance.getAttribute(attributeIndex).getIndex() == attributeValue else 1
+                       for instance in instances]
+            childStates = self.__childStates(childOf, 2, sortedIndices, histogram)
         self.children.append(
             DecisionNode(childrenData.get(0),
                          DecisionCondition(attributeIndex,
-                                           DiscreteIndexedAttribute("", attributeValue, self.__data.get(0).getAttribute(attributeIndex).getMaxIndex())), parameter, isStump))
+                                           DiscreteIndexedAttribute("", attributeValue, self.__data.get(0).getAttribute(attributeIndex).getMaxIndex())), parameter, isStump,
+                         childStates[0][0], childStates[0][1], self.__depth + 1, grow))
         self.children.append(
             DecisionNode(childrenData.get(1),
                          DecisionCondition(attributeIndex,
-                                           DiscreteIndexedAttribute("", -1, self.__data.get(0).getAttribute(attributeIndex).getMaxIndex())), parameter, isStump))
+                                           DiscreteIndexedAttribute("", -1, self.__data.get(0).getAttribute(attributeIndex).getMaxIndex())), parameter, isStump,
+                         childStates[1][0], childStates[1][1], self.__depth + 1, grow))
 
-    def __createChildrenForDiscrete(self, attributeIndex: int, parameter: RandomForestParameter, isStump: bool):
+    def __createChildrenForDiscrete(self, attributeIndex: int, parameter: DecisionTreeParameter, isStump: bool,
+                                    instances: list, sortedIndices: list, histogram: Histogram, grow: bool):
         """
         The createChildrenForDiscrete method creates an ArrayList of values, a partition with respect to attributes and
         a list of DecisionNodes as children.
@@ -179,20 +439,35 @@ class DecisionNode(object):
         ----------
         attributeIndex : int
             Index of the attribute.
-        parameter : RandomForestParameter
-            RandomForestParameter like seed, ensembleSize, attributeSubsetSize.
+        parameter : DecisionTreeParameter
+            DecisionTreeParameter like seed, presort.
         isStump : bool
             Refers to decision trees with only 1 splitting rule.
+        instances : list
+            Instances of the node in presort or histogram mode, None otherwise.
+        sortedIndices : list
+            Sorted positions of the node in presort mode, None otherwise.
+        histogram : Histogram
+            Class histograms of the node in histogram mode, None otherwise.
+        grow : bool
+            If true, the children create their subtrees.
         """
         valueList = self.__data.getAttributeValueList(attributeIndex)
         childrenData = Partition(self.__data, attributeIndex)
+        childStates = [(None, None)] * len(valueList)
+        if instances is not None:
+            values = SymbolTable(valueList)
+            childOf = [values.indexOf(instance.getAttribute(attributeIndex).getValue()) for instance in instances]
+            childStates = self.__childStates(childOf, len(valueList), sortedIndices, histogram)
         for i in range(len(valueList)):
             self.children.append(DecisionNode(childrenData.get(i),
                                               DecisionCondition(attributeIndex, DiscreteAttribute(valueList[i])),
-                                              parameter, isStump))
+                                              parameter, isStump, childStates[i][0], childStates[i][1],
+                                              self.__depth + 1, grow))
 
-    def __createChildrenForContinuous(self, attributeIndex: int, splitValue: float, parameter: RandomForestParameter,
-                                      isStump: bool):
+    def __createChildrenForContinuous(self, attributeIndex: int, splitValue: float, parameter: DecisionTreeParameter,
+                                      isStump: bool, instances: list, sortedIndices: list, histogram: Histogram,
+                                      grow: bool):
         """
         The createChildrenForContinuous method creates a list of DecisionNodes as children and a partition with respect
         to continuous attribute and the given split value.
@@ -201,20 +476,70 @@ class DecisionNode(object):
         ----------
         attributeIndex : int
             Index of the attribute.
-        parameter : RandomForestParameter
-            RandomForestParameter like seed, ensembleSize, attributeSubsetSize.
+        parameter : DecisionTreeParameter
+            DecisionTreeParameter like seed, presort.
         isStump : bool
             Refers to decision trees with only 1 splitting rule.
         splitValue : float
             Split value is used for partitioning.
+        instances : list
+            Instances of the node in presort or histogram mode, None otherwise.
+        sortedIndices : list
+            Sorted positions of the node in presort mode, None otherwise.
+        histogram : Histogram
+            Class histograms of the node in histogram mode, None otherwise.
+        grow : bool
+            If true, the children create their subtrees.
         """
         childrenData = Partition(self.__data, attributeIndex, splitValue)
+        childStates = [(None, None), (None, None)]
+        if instances is not None:
+            childOf = [0 if instance.getAttribute(attributeIndex).getValue() < splitValue else 1
+                       for instance in instances]
+            childStates = self.__childStates(childOf, 2, sortedIndices, histogram)
         self.children.append(DecisionNode(childrenData.get(0),
                                           DecisionCondition(attributeIndex, ContinuousAttribute(splitValue), "<"),
-                                          parameter, isStump))
+                                          parameter, isStump, childStates[0][0], childStates[0][1],
+                                          self.__depth + 1, grow))
         self.children.append(DecisionNode(childrenData.get(1),
                                           DecisionCondition(attributeIndex, ContinuousAttribute(splitValue), ">"),
-                                          parameter, isStump))
+                                          parameter, isStump, childStates[1][0], childStates[1][1],
+                                          self.__depth + 1, grow))
+
+    def getCondition(self) -> DecisionCondition:
+        """
+        Accessor for the condition of the node.
+
+        RETURNS
+        -------
+        DecisionCondition
+            Condition that an instance satisfies to reach the node, None for the root.
+        """
+        return self.__condition
+
+    def getClassLabel(self) -> str:
+        """
+        Accessor for the class label of the node.
+
+        RETURNS
+        -------
+        str
+            Most occurring class label of the data of the node.
+        """
+        return self.__classLabel
+
+    def classDistribution(self) -> DiscreteDistribution:
+        """
+        Returns the class distribution of the data of the node. A lean node returns its stored distribution.
+
+        RETURNS
+        -------
+        DiscreteDistribution
+            Distribution of the class labels of the node.
+        """
+        if self.__data is None:
+            return self.__distribution
+        return self.__data.classDistribution()
 
     def predict(self, instance: Instance) -> str:
         """
@@ -233,7 +558,7 @@ class DecisionNode(object):
         """
         if isinstance(instance, CompositeInstance):
             possibleClassLabels = instance.getPossibleClassLabels()
-            distribution = self.__data.classDistribution()
+            distribution = self.classDistribution()
             predictedClass = distribution.getMaxItemIncludeTheseOnly(possibleClassLabels)
             if self.leaf:
                 return predictedClass
@@ -1,6 +1,7 @@
 from Classification.Instance.CompositeInstance import CompositeInstance
 from Classification.Instance.Instance import Instance
 from Classification.InstanceList.InstanceList import InstanceList
+from Classification.Model.DecisionTree.CompiledTree import CompiledTree
 from Classification.Model.DecisionTree.DecisionNode import DecisionNode
 from Classification.Model.ValidatedModel import ValidatedModel
 
@@ -8,17 +9,40 @@ from Classification.Model.ValidatedModel import ValidatedModel
 class DecisionTree(ValidatedModel):
 
     __root: DecisionNode
+    __compiled: CompiledTree
 
-    def __init__(self, root: DecisionNode):
+    def __init__(self, root: DecisionNode, compiled: CompiledTree = None):
         """
-        Constructor that sets root node of the decision tree.
+        Constructor that sets root node of the decision tree. A tree trained in another process may be given only in
+        its compiled form, with a None root; such a tree can predict but can not be pruned.
 
         PARAMETERS
         ----------
         root : DecisionNode
             DecisionNode type input.
+        compiled : CompiledTree
+            Optional compiled form of the tree.
         """
         self.__root = root
+        self.__compiled = compiled
+
+    def compile(self):
+        """
+        Compiles the tree into flat arrays, which are used for prediction afterwards. The tree should be compiled after
+        training and pruning are finished.
+        """
+        self.__compiled = CompiledTree(self.__root)
+
+    def getCompiled(self) -> CompiledTree:
+        """
+        Accessor for the compiled tree.
+
+        RETURNS
+        -------
+        CompiledTree
+            Compiled tree, None if the tree is not compiled.
+        """
+        return self.__compiled
 
     def predict(self, instance: Instance) -> str:
         """
@@ -35,17 +59,131 @@ class DecisionTree(ValidatedModel):
         str
             Possible class labels.
         """
-        predictedClass = self.__root.predict(instance)
+        if self.__compiled is not None:
+            predictedClass = self.__compiled.predict(instance)
+        else:
+            predictedClass = self.__root.predict(instance)
         if predictedClass is None and isinstance(instance, CompositeInstance):
             predictedClass = instance.getPossibleClassLabels()
         return predictedClass
 
+    def predictBatch(self, instances: list) -> list:
+        """
+        Predicts the class labels of a list of instances. If the tree is compiled, the instances are routed together
+        through the compiled tree.
+
+        PARAMETERS
+        ----------
+        instances : list
+            Instances to make prediction.
+
+        RETURNS
+        -------
+        list
+            Predictions in the order of the instances.
+        """
+        if self.__compiled is None:
+            return super().predictBatch(instances)
+        predictions = self.__compiled.predictBatch(instances)
+        for i in range(len(instances)):
+            if predictions[i] is None and isinstance(instances[i], CompositeInstance):
+                predictions[i] = instances[i].getPossibleClassLabels()
+        return predictions
+
+    @staticmethod
+    def __leafPrediction(node: DecisionNode, instance: Instance) -> str:
+        """
+        Returns the prediction of the given node for an instance when the node is a leaf.
+
+        PARAMETERS
+        ----------
+        node : DecisionNode
+            Node of the tree.
+        instance : Instance
+            Instance to make prediction.
+
+        RETURNS
+        -------
+        str
+            Class label of the node, or for a composite instance, the most occurring possible class label of the node.
+        """
+        if isinstance(instance, CompositeInstance):
+            return node.classDistribution().getMaxItemIncludeTheseOnly(instance.getPossibleClassLabels())
+        return node.getClassLabel()
+
+    def __pruneCounts(self, pruneSet: InstanceList) -> tuple:
+        """
+        Routes every instance of the prune set once from the root to the node where its prediction is made. For every
+        node on the path, it counts whether the instance is classified correctly by the node as a leaf and by the
+        tree as it is, which is also the prediction of the subtree of the node since the ancestors of the node are not
+        leaves.
+
+        PARAMETERS
+        ----------
+        pruneSet : InstanceList
+            InstanceList to perform pruning.
+
+        RETURNS
+        -------
+        tuple
+            Number of correctly classified instances of each node as a leaf and as a subtree.
+        """
+        leafCorrect = {}
+        subtreeCorrect = {}
+        for instance in pruneSet.getInstances():
+            classLabel = instance.getClassLabel()
+            path = []
+            node = self.__root
+            while node is not None:
+                path.append(node)
+                if node.leaf:
+                    break
+                nextNode = None
+                for child in node.children:
+                    if child.getCondition().satisfy(instance):
+                        nextNode = child
+                        break
+                node = nextNode
+            correct = 1 if self.__leafPrediction(path[-1], instance) == classLabel else 0
+            for node in path:
+                leafCorrect[node] = leafCorrect.get(node, 0) + \
+                    (1 if self.__leafPrediction(node, instance) == classLabel else 0)
+                subtreeCorrect[node] = subtreeCorrect.get(node, 0) + correct
+        return leafCorrect, subtreeCorrect
+
+    def __pruneWithCounts(self, node: DecisionNode, leafCorrect: dict, subtreeCorrect: dict):
+        """
+        Makes the given node a leaf if the node as a leaf classifies at least as many instances of the prune set
+        correctly as its subtree, otherwise decides for its children in the same way.
+
+        PARAMETERS
+        ----------
+        node : DecisionNode
+            DecisionNode that will be pruned if conditions hold.
+        leafCorrect : dict
+            Number of correctly classified prune instances of each node as a leaf.
+        subtreeCorrect : dict
+            Number of correctly classified prune instances of each node as a subtree.
+        """
+        if node.leaf:
+            return
+        if leafCorrect.get(node, 0) < subtreeCorrect.get(node, 0):
+            for child in node.children:
+                self.__pruneWithCounts(child, leafCorrect, subtreeCorrect)
+        else:
+            node.leaf = True
+
     def pruneNode(self, node: DecisionNode, pruneSet: InstanceList):
         """
         The prune method takes a DecisionNode and an InstanceList as inputs. It checks the classification performance
         of given InstanceList before pruning, i.e making a node leaf, and after pruning. If the after performance is
         better than the before performance it prune the given InstanceList from the tree.
 
+        Making a node leaf changes only the predictions of the prune instances reaching the node, and the nodes are
+        visited before their descendants, so the comparison of the accuracies on the prune set is the comparison of
+        the correct counts of the node as a leaf and as a subtree. The prune set is therefore routed through the tree
+        once to find these counts, and the decisions are made from the counts in a single traversal.
+
         PARAMETERS
         ----------
         node : DecisionNode
@@ -53,15 +191,8 @@ class DecisionTree(ValidatedModel):
         pruneSet : InstanceList
             Small subset of tree that will be removed from tree.
         """
-        if node.leaf:
-            return
-        before = self.testClassifier(pruneSet)
-        node.leaf = True
-        after = self.testClassifier(pruneSet)
-        if after.getAccuracy() < before.getAccuracy():
-            node.leaf = False
-            for child in node.children:
-                self.pruneNode(child, pruneSet)
+        leafCorrect, subtreeCorrect = self.__pruneCounts(pruneSet)
+        self.__pruneWithCounts(node, leafCorrect, subtreeCorrect)
 
     def prune(self, pruneSet: InstanceList):
         """
@@ -72,4 +203,5 @@ class DecisionTree(ValidatedModel):
         pruneSet : InstanceList
             InstanceList to perform pruning.
         """
+        self.__compiled = None
         self.pruneNode(self.__root, pruneSet)
@@ -0,0 +1,243 @@
+import math
+
+
+class EntropyKernel(object):
+
+    __codes: dict
+    __table: list
+    __sharedTable = [0.0]
+
+    def __init__(self, classLabels: list, size: int):
+        """
+        Constructor for the split scoring kernel of a decision tree node. The class labels are mapped to integer codes,
+        class distributions are kept as count arrays indexed by the codes, and the entropy of a count array with total
+        n is computed as (n log n - sum of c log c) / n from a cached table of c log c values, so that scoring a
+        candidate split needs only table lookups.
+
+        PARAMETERS
+        ----------
+        classLabels : list
+            Distinct class labels of the node.
+        size : int
+            Number of instances of the node.
+        """
+        self.__codes = {classLabel: code for code, classLabel in enumerate(classLabels)}
+        self.__table = EntropyKernel.nLogNTable(size)
+
+    @staticmethod
+    def nLogNTable(size: int) -> list:
+        """
+        Returns the table of c log c values for c from 0 to at least size. The table is shared by all kernels and
+        extended when a larger size is requested.
+
+        PARAMETERS
+        ----------
+        size : int
+            Largest count to be looked up.
+
+        RETURNS
+        -------
+        list
+            Table of c log c values, the logarithm is in base 2.
+        """
+        table = EntropyKernel.__sharedTable
+        if len(table) <= size:
+            table.extend([count * math.log2(count) for count in range(len(table), size + 1)])
+        return table
+
+    def classCount(self) -> int:
+        """
+        Returns the number of classes.
+
+        RETURNS
+        -------
+        int
+            Number of classes.
+        """
+        return len(self.__codes)
+
+    def classCodes(self, instances) -> list:
+        """
+        Returns the class codes of the given instances.
+
+        PARAMETERS
+        ----------
+        instances
+            Instances whose class labels are coded.
+
+        RETURNS
+        -------
+        list
+            Class code of each instance.
+        """
+        codes = self.__codes
+        return [codes[instance.getClassLabel()] for instance in instances]
+
+    def counts(self, classCodes: list) -> list:
+        """
+        Counts the class codes.
+
+        PARAMETERS
+        ----------
+        classCodes : list
+            Class codes of the instances.
+
+        RETURNS
+        -------
+        list
+            Number of instances of each class.
+        """
+        counts = [0] * len(self.__codes)
+        for code in classCodes:
+            counts[code] += 1
+        return counts
+
+    def weightedEntropy(self, counts: list, total: int) -> float:
+        """
+        Returns total times the entropy of a count array, that is, n log n minus the sum of c log c.
+
+        PARAMETERS
+        ----------
+        counts : list
+            Class counts.
+        total : int
+            Sum of the counts.
+
+        RETURNS
+        -------
+        float
+            Entropy of the counts multiplied by their sum.
+        """
+        return self.__table[total] - sum(map(self.__table.__getitem__, counts))
+
+    def entropy(self, counts: list, total: int) -> float:
+        """
+        Returns the entropy of a count array.
+
+        PARAMETERS
+        ----------
+        counts : list
+            Class counts.
+        total : int
+            Sum of the counts.
+
+        RETURNS
+        -------
+        float
+            Entropy of the counts.
+        """
+        if total == 0:
+            return 0.0
+        return self.weightedEntropy(counts, total) / total
+
+    def continuousSplit(self, values: list, classCodes: list, bestEntropy: float, epsilon: float,
+                        minLeafSize: int = 1) -> tuple:
+        """
+        Finds the best binary split of a continuous attribute. The values are scanned in sorted order while the class
+        counts of the two sides are updated by one for each instance, and the split between each pair of consecutive
+        distinct values is scored. A split replaces the best split so far only if its entropy is smaller by more than
+        epsilon.
+
+        PARAMETERS
+        ----------
+        values : list
+            Sorted values of the attribute.
+        classCodes : list
+            Class codes of the instances in the same order.
+        bestEntropy : float
+            Entropy of the best split found so far.
+        epsilon : float
+            Minimum decrease in the entropy to replace the best split.
+        minLeafSize : int
+            Minimum number of instances on each side of a split.
+
+        RETURNS
+        -------
+        tuple
+            Entropy of the best split and its split value. If no split of the attribute is better, the given entropy
+            and None.
+        """
+        size = len(values)
+        left = [0] * len(self.__codes)
+        right = self.counts(classCodes)
+        bestSplitValue = None
+        previousValue = values[0]
+        for k in range(1, size):
+            code = classCodes[k - 1]
+            left[code] += 1
+            right[code] -= 1
+            value = values[k]
+            if value != previousValue:
+                if minLeafSize <= k <= size - minLeafSize:
+                    entropy = (self.weightedEntropy(left, k) + self.weightedEntropy(right, size - k)) / size
+                    if entropy + epsilon < bestEntropy:
+                        bestEntropy = entropy
+                        bestSplitValue = (previousValue + value) / 2
+                previousValue = value
+        return bestEntropy, bestSplitValue
+
+    def discreteSplit(self, branchCounts: list, size: int) -> float:
+        """
+        Returns the entropy of the split of a discrete attribute into one branch for each value.
+
+        PARAMETERS
+        ----------
+        branchCounts : list
+            Class counts of each value of the attribute.
+        size : int
+            Number of instances.
+
+        RETURNS
+        -------
+        float
+            Weighted entropy of the branches.
+        """
+        total = 0.0
+        for counts in branchCounts:
+            total += self.weightedEntropy(counts, sum(counts))
+        return total / size
+
+    def indexedSplit(self, indices: list, branchCounts: list, maxIndex: int, totals: list, bestEntropy: float,
+                     epsilon: float, minLeafSize: int = 1) -> tuple:
+        """
+        Finds the best binary split of a discrete indexed attribute, where one branch has the instances with a given
+        index and the other branch has the rest.
+
+        PARAMETERS
+        ----------
+        indices : list
+            Distinct indexes of the attribute values.
+        branchCounts : list
+            Class counts of each index, in the order of indices.
+        maxIndex : int
+            Number of possible indexes.
+        totals : list
+            Class counts of the node.
+        bestEntropy : float
+            Entropy of the best split found so far.
+        epsilon : float
+            Minimum decrease in the entropy to replace the best split.
+        minLeafSize : int
+            Minimum number of instances in each branch.
+
+        RETURNS
+        -------
+        tuple
+            Entropy of the best split and its index. If no split of the attribute is better, the given entropy and
+            None.
+        """
+        size = sum(totals)
+        countsOfIndex = dict(zip(indices, branchCounts))
+        bestIndex = None
+        for index in range(maxIndex):
+            inside = countsOfIndex.get(index)
+            if inside is not None:
+                insideSum = sum(inside)
+                if minLeafSize <= insideSum <= size - minLeafSize:
+                    outside = [total - count for total, count in zip(totals, inside)]
+                    entropy = (self.weightedEntropy(outside, size - insideSum) +
+                               self.weightedEntropy(inside, insideSum)) / size
+                    if entropy + epsilon < bestEntropy:
+                        bestEntropy = entropy
+                        bestIndex = index
+        return bestEntropy, bestIndex
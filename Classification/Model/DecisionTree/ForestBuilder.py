@@ -0,0 +1,172 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from Math.DiscreteDistribution import DiscreteDistribution
+
+from Classification.InstanceList.InstanceList import InstanceList
+from Classification.InstanceList.InstanceListView import InstanceListView
+from Classification.Model.DecisionTree.CompiledTree import CompiledTree
+from Classification.Model.DecisionTree.DecisionNode import DecisionNode
+from Classification.Model.DecisionTree.DecisionTree import DecisionTree
+from Classification.Parameter.BaggingParameter import BaggingParameter
+from Classification.Performance.ConfusionMatrix import ConfusionMatrix
+from Classification.Performance.DetailedClassificationPerformance import DetailedClassificationPerformance
+
+
+class ForestBuilder(object):
+
+    __trainSet: InstanceList
+    __parameters: BaggingParameter
+    __outOfBagIndices: list
+    workerTrainSet = None
+    workerParameters = None
+
+    def __init__(self, trainSet: InstanceList, parameters: BaggingParameter):
+        """
+        Constructor for the builder of the trees of a bagged forest or a random forest. The i'th tree is trained on
+        the bootstrap sample with seed i, so the trees are independent of each other and can be trained in separate
+        processes.
+
+        PARAMETERS
+        ----------
+        trainSet : InstanceList
+            Training data of the forest.
+        parameters : BaggingParameter
+            Parameters of the forest. ensembleSize is the number of trees, workers is the number of processes.
+        """
+        self.__trainSet = trainSet
+        self.__parameters = parameters
+        self.__outOfBagIndices = []
+
+    @staticmethod
+    def buildTree(trainSet: InstanceList, parameters: BaggingParameter, index: int) -> DecisionTree:
+        """
+        Trains and compiles the tree with the given index on its bootstrap sample. If the parameters request lean
+        trees, only the compiled form of the tree is kept.
+
+        PARAMETERS
+        ----------
+        trainSet : InstanceList
+            Training data of the forest.
+        parameters : BaggingParameter
+            Parameters of the forest.
+        index : int
+            Index of the tree, which is the seed of its bootstrap sample.
+
+        RETURNS
+        -------
+        DecisionTree
+            Trained tree.
+        """
+        tree = DecisionTree(DecisionNode(InstanceListView.bootstrap(trainSet, index), None, parameters))
+        tree.compile()
+        if parameters.isLean():
+            return DecisionTree(None, tree.getCompiled())
+        return tree
+
+    @staticmethod
+    def initializeWorker(trainSet: InstanceList, parameters: BaggingParameter):
+        """
+        Stores the training data and the parameters in a worker process. With the fork start method, the data is
+        inherited from the parent process without being copied or serialized.
+
+        PARAMETERS
+        ----------
+        trainSet : InstanceList
+            Training data of the forest.
+        parameters : BaggingParameter
+            Parameters of the forest.
+        """
+        ForestBuilder.workerTrainSet = trainSet
+        ForestBuilder.workerParameters = parameters
+
+    @staticmethod
+    def buildCompiledTree(index: int) -> CompiledTree:
+        """
+        Trains the tree with the given index in a worker process and returns its compiled form, which is small
+        compared to the linked nodes holding the training data.
+
+        PARAMETERS
+        ----------
+        index : int
+            Index of the tree.
+
+        RETURNS
+        -------
+        CompiledTree
+            Compiled form of the trained tree.
+        """
+        return ForestBuilder.buildTree(ForestBuilder.workerTrainSet, ForestBuilder.workerParameters, index).getCompiled()
+
+    def build(self) -> list:
+        """
+        Trains the trees of the forest. If more than one worker is requested, the trees are trained in a pool of
+        processes sharing the training data, and the trees are returned in their compiled form. Since every tree
+        depends only on its index, the trees are the same as the trees trained one after another. The indices of the
+        instances left out of the bootstrap sample of each tree are recorded for out-of-bag evaluation.
+
+        RETURNS
+        -------
+        list
+            Trained trees in the order of their indexes.
+        """
+        forestSize = self.__parameters.getEnsembleSize()
+        self.__outOfBagIndices = [InstanceListView.outOfBagIndices(self.__trainSet.size(), i)
+                                  for i in range(forestSize)]
+        workers = min(self.__parameters.getWorkers(), forestSize)
+        if workers <= 1:
+            return [ForestBuilder.buildTree(self.__trainSet, self.__parameters, i) for i in range(forestSize)]
+        if "fork" in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context("fork")
+        else:
+            context = multiprocessing.get_context()
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=ForestBuilder.initializeWorker,
+                                 initargs=(self.__trainSet, self.__parameters)) as executor:
+            compiledTrees = list(executor.map(ForestBuilder.buildCompiledTree, range(forestSize)))
+        return [DecisionTree(None, compiledTree) for compiledTree in compiledTrees]
+
+    def getOutOfBagIndices(self) -> list:
+        """
+        Accessor for the out-of-bag indices of the trees.
+
+        RETURNS
+        -------
+        list
+            For each tree, the indices of the training instances left out of its bootstrap sample.
+        """
+        return self.__outOfBagIndices
+
+    def outOfBagPerformance(self, forest: list) -> DetailedClassificationPerformance:
+        """
+        Evaluates the forest on the training data without extra training. Each tree predicts only the instances left
+        out of its bootstrap sample, and each instance is classified by the majority vote of the trees that did not
+        see it, counted in the order of the trees as in TreeEnsembleModel. Instances that are in every bootstrap sample
+        are not evaluated.
+
+        PARAMETERS
+        ----------
+        forest : list
+            Trees returned by build.
+
+        RETURNS
+        -------
+        DetailedClassificationPerformance
+            Out-of-bag performance of the forest, None if every instance is in every bootstrap sample.
+        """
+        instances = list(self.__trainSet.getInstances())
+        votes = [None] * len(instances)
+        for tree, indices in zip(forest, self.__outOfBagIndices):
+            predictions = tree.predictBatch(list(map(instances.__getitem__, indices)))
+            for index, prediction in zip(indices, predictions):
+                if votes[index] is None:
+                    votes[index] = DiscreteDistribution()
+                votes[index].addItem(prediction)
+        confusion = ConfusionMatrix(self.__trainSet.getUnionOfPossibleClassLabels())
+        evaluated = 0
+        for instance, distribution in zip(instances, votes):
+            if distribution is not None:
+                confusion.classify(instance.getClassLabel(), distribution.getMaxItem())
+                evaluated += 1
+        if evaluated == 0:
+            return None
+        return DetailedClassificationPerformance(confusion)
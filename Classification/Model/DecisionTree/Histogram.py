@@ -0,0 +1,218 @@
+from __future__ import annotations
+from array import array
+from bisect import bisect_right
+from itertools import compress
+
+from Classification.Attribute.ContinuousAttribute import ContinuousAttribute
+from Classification.DataSet.SymbolTable import SymbolTable
+from Classification.Model.DecisionTree.EntropyKernel import EntropyKernel
+
+
+class Histogram(object):
+
+    __size: int
+    __classCount: int
+    __classCodes: array
+    __totals: list
+    __edges: list
+    __bins: list
+    __counts: list
+
+    def __init__(self, instances: list = None, binCount: int = 0):
+        """
+        Constructor for the class histograms of the continuous attributes of the instances of a decision tree node.
+        Each continuous attribute is quantile binned once at the root into at most binCount bins, whose edges are the
+        midpoints between consecutive distinct values. For each attribute, the bin of every instance and the class
+        counts of every bin are stored, so that the best split of a node is found from the bin counts and the
+        histograms of the children are derived from the histogram of the node.
+
+        PARAMETERS
+        ----------
+        instances : list
+            Instances of the root node. If None, an empty histogram is created to be filled by split.
+        binCount : int
+            Maximum number of bins of a continuous attribute.
+        """
+        self.__edges = []
+        self.__bins = []
+        self.__counts = []
+        if instances is None:
+            return
+        classLabels = SymbolTable()
+        self.__size = len(instances)
+        self.__classCodes = array('i', [classLabels.getCode(instance.getClassLabel()) for instance in instances])
+        self.__classCount = classLabels.size()
+        self.__totals = self.__binCounts(array('i', bytes(4 * self.__size)), self.__classCodes, 1)
+        for index in range(instances[0].attributeSize()):
+            if isinstance(instances[0].getAttribute(index), ContinuousAttribute):
+                values = [instance.getAttribute(index).getValue() for instance in instances]
+                edges = self.__quantileEdges(values, binCount)
+                bins = array('i', [bisect_right(edges, value) for value in values])
+                self.__edges.append(edges)
+                self.__bins.append(bins)
+                self.__counts.append(self.__binCounts(bins, self.__classCodes, len(edges) + 1))
+            else:
+                self.__edges.append(None)
+                self.__bins.append(None)
+                self.__counts.append(None)
+
+    @staticmethod
+    def __quantileEdges(values: list, binCount: int) -> list:
+        """
+        Finds the edges of the quantile bins of the given values. If there are at most binCount distinct values, every
+        midpoint between consecutive distinct values is an edge, otherwise the edges are the midpoints around the
+        quantiles of the values.
+
+        PARAMETERS
+        ----------
+        values : list
+            Values of a continuous attribute.
+        binCount : int
+            Maximum number of bins.
+
+        RETURNS
+        -------
+        list
+            Sorted edges of the bins.
+        """
+        distinct = sorted(set(values))
+        if len(distinct) <= binCount:
+            return [(distinct[i - 1] + distinct[i]) / 2 for i in range(1, len(distinct))]
+        sortedValues = sorted(values)
+        edges = []
+        for i in range(1, binCount):
+            position = bisect_right(distinct, sortedValues[i * len(sortedValues) // binCount]) - 1
+            if position > 0:
+                edge = (distinct[position - 1] + distinct[position]) / 2
+                if len(edges) == 0 or edges[-1] < edge:
+                    edges.append(edge)
+        return edges
+
+    def __binCounts(self, bins: array, classCodes: array, binCount: int) -> list:
+        """
+        Counts the instances of each class in each bin.
+
+        PARAMETERS
+        ----------
+        bins : array
+            Bin of each instance.
+        classCodes : array
+            Class code of each instance.
+        binCount : int
+            Number of bins.
+
+        RETURNS
+        -------
+        list
+            Class counts of the bins, the counts of bin b are at positions b * classCount to (b + 1) * classCount.
+        """
+        classCount = self.__classCount
+        counts = [0] * (binCount * classCount)
+        for b, code in zip(bins, classCodes):
+            counts[b * classCount + code] += 1
+        return counts
+
+    def bestSplit(self, attributeIndex: int, bestEntropy: float, epsilon: float, minLeafSize: int = 1) -> tuple:
+        """
+        Finds the best split of a continuous attribute over the bin edges. The bins are scanned in order while the
+        class counts of the left side are accumulated, and the weighted entropy of the two sides is computed after
+        each non-empty bin from the table of c log c values. As in the exact split search, a split replaces the best split
+        so far only if its entropy is smaller by more than epsilon.
+
+        PARAMETERS
+        ----------
+        attributeIndex : int
+            Index of the continuous attribute.
+        bestEntropy : float
+            Entropy of the best split found so far.
+        epsilon : float
+            Minimum decrease in the entropy to replace the best split.
+        minLeafSize : int
+            Minimum number of instances on each side of a split.
+
+        RETURNS
+        -------
+        tuple
+            Weighted entropy of the best split and its split value. If no split of the attribute is better, the given
+            entropy and None.
+        """
+        classCount = self.__classCount
+        counts = self.__counts[attributeIndex]
+        edges = self.__edges[attributeIndex]
+        left = [0] * classCount
+        right = list(self.__totals)
+        leftSum = 0
+        table = EntropyKernel.nLogNTable(self.__size)
+        bestSplitValue = None
+        for b in range(len(edges)):
+            base = b * classCount
+            binSum = 0
+            for c in range(classCount):
+                count = counts[base + c]
+                left[c] += count
+                right[c] -= count
+                binSum += count
+            if binSum == 0:
+                continue
+            leftSum += binSum
+            if leftSum == self.__size:
+                break
+            rightSum = self.__size - leftSum
+            if leftSum < minLeafSize or rightSum < minLeafSize:
+                continue
+            entropy = (table[leftSum] - sum(map(table.__getitem__, left)) + table[rightSum] -
+                       sum(map(table.__getitem__, right))) / self.__size
+            if entropy + epsilon < bestEntropy:
+                bestEntropy = entropy
+                bestSplitValue = edges[b]
+        return bestEntropy, bestSplitValue
+
+    def split(self, childOf: list, childCount: int) -> list:
+        """
+        Derives the histograms of the children of the node. The instances of a child keep the order of the instances
+        of the node, as in Partition. The class counts are counted for all children except the largest one, whose
+        counts are found by subtracting the counts of its siblings from the counts of the node.
+
+        PARAMETERS
+        ----------
+        childOf : list
+            Child of each instance of the node.
+        childCount : int
+            Number of children.
+
+        RETURNS
+        -------
+        list
+            Histograms of the children.
+        """
+        masks = [[child == c for child in childOf] for c in range(childCount)]
+        children = []
+        for c in range(childCount):
+            histogram = Histogram()
+            histogram.__classCount = self.__classCount
+            histogram.__classCodes = array('i', compress(self.__classCodes, masks[c]))
+            histogram.__size = len(histogram.__classCodes)
+            histogram.__totals = self.__binCounts(array('i', bytes(4 * histogram.__size)), histogram.__classCodes, 1)
+            children.append(histogram)
+        largest = max(range(childCount), key=lambda c: children[c].__size)
+        for index in range(len(self.__bins)):
+            if self.__bins[index] is None:
+                for histogram in children:
+                    histogram.__edges.append(None)
+                    histogram.__bins.append(None)
+                    histogram.__counts.append(None)
+                continue
+            binCount = len(self.__edges[index]) + 1
+            remaining = list(self.__counts[index])
+            for c in range(childCount):
+                histogram = children[c]
+                histogram.__edges.append(self.__edges[index])
+                histogram.__bins.append(array('i', compress(self.__bins[index], masks[c])))
+                if c != largest:
+                    counts = self.__binCounts(histogram.__bins[index], histogram.__classCodes, binCount)
+                    remaining = [total - count for total, count in zip(remaining, counts)]
+                    histogram.__counts.append(counts)
+                else:
+                    histogram.__counts.append(None)
+            children[largest].__counts[index] = remaining
+        return children
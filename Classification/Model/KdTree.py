@@ -0,0 +1,184 @@
+import heapq
+from array import array
+
+
+class KdTree(object):
+
+    __points: list
+    __order: array
+    __splitDimension: array
+    __splitValue: array
+    __left: array
+    __right: array
+    __start: array
+    __end: array
+    __scale: float
+    LEAF_SIZE = 8
+    TOLERANCE = 0.000000001
+
+    def __init__(self, points: list):
+        """
+        Constructor that builds a KD-tree over the given points. A node covering more than LEAF_SIZE points is split
+        at the median of the dimension with the largest spread, so that the points on the left have coordinates not
+        larger and the points on the right have coordinates not smaller than the split value. The nodes are stored in
+        flat arrays, and the points of a node are a range of the order array.
+
+        PARAMETERS
+        ----------
+        points : list
+            Coordinates of the points, all of the same dimension. A point is referred to by its position in the list.
+        """
+        self.__points = points
+        self.__order = array('i', range(len(points)))
+        self.__splitDimension = array('i')
+        self.__splitValue = array('d')
+        self.__left = array('i')
+        self.__right = array('i')
+        self.__start = array('i')
+        self.__end = array('i')
+        self.__scale = max([sum(value * value for value in point) for point in points], default=0.0)
+        if len(points) > 0:
+            self.__build(0, len(points))
+
+    def __build(self, start: int, end: int) -> int:
+        """
+        Builds the subtree of the points in the given range of the order array.
+
+        PARAMETERS
+        ----------
+        start : int
+            Start of the range.
+        end : int
+            End of the range, exclusive.
+
+        RETURNS
+        -------
+        int
+            Number of the root node of the subtree.
+        """
+        node = len(self.__start)
+        self.__start.append(start)
+        self.__end.append(end)
+        self.__splitDimension.append(-1)
+        self.__splitValue.append(0.0)
+        self.__left.append(-1)
+        self.__right.append(-1)
+        if end - start <= self.LEAF_SIZE:
+            return node
+        rows = self.__order[start:end]
+        bestDimension = -1
+        bestSpread = 0.0
+        for dimension in range(len(self.__points[rows[0]])):
+            values = [self.__points[row][dimension] for row in rows]
+            spread = max(values) - min(values)
+            if spread > bestSpread:
+                bestSpread = spread
+                bestDimension = dimension
+        if bestDimension == -1:
+            return node
+        rows = sorted(rows, key=lambda row: self.__points[row][bestDimension])
+        self.__order[start:end] = array('i', rows)
+        middle = start + len(rows) // 2
+        self.__splitDimension[node] = bestDimension
+        self.__splitValue[node] = self.__points[self.__order[middle]][bestDimension]
+        left = self.__build(start, middle)
+        self.__left[node] = left
+        right = self.__build(middle, end)
+        self.__right[node] = right
+        return node
+
+    def size(self) -> int:
+        """
+        Returns the number of nodes.
+
+        RETURNS
+        -------
+        int
+            Number of nodes.
+        """
+        return len(self.__start)
+
+    def nearest(self, query: list, k: int, distance, accept=None) -> list:
+        """
+        Finds the k nearest points to the query. The distances of the candidate points are computed by the given
+        function, and the squared Euclidean distance of the query to the cell of a node, found incrementally from the
+        offsets in each dimension, is used as a lower bound to skip the nodes that can not contain a nearer point.
+        The bound is reduced by a small tolerance relative to the magnitude of the coordinates, so that rounding
+        errors never skip a point; therefore the distance function must be the squared Euclidean distance between
+        the coordinates up to such rounding errors plus non-negative terms. The points are ordered by distance and
+        ties are broken by position, as in a stable sort of all points.
+
+        PARAMETERS
+        ----------
+        query : list
+            Coordinates of the query.
+        k : int
+            Number of neighbors.
+        distance
+            Function giving the distance of the point at a position to the query.
+        accept
+            Optional function telling whether the point at a position can be a neighbor.
+
+        RETURNS
+        -------
+        list
+            Positions of the nearest points.
+        """
+        heap = []
+        if len(self.__start) > 0 and k > 0:
+            tolerance = self.TOLERANCE * (self.__scale + sum(value * value for value in query))
+            self.__search(0, query, 0.0, [0.0] * len(query), k, distance, accept, heap, tolerance)
+        return [-negativeRow for _, negativeRow in sorted(heap, reverse=True)]
+
+    def __search(self, node: int, query: list, bound: float, offsets: list, k: int, distance, accept, heap: list,
+                 tolerance: float):
+        """
+        Searches the subtree of the given node. The heap holds the k best points found so far as (-distance,
+        -position) pairs, so that its first item is the worst of them.
+
+        PARAMETERS
+        ----------
+        node : int
+            Number of the node.
+        query : list
+            Coordinates of the query.
+        bound : float
+            Squared distance of the query to the cell of the node.
+        offsets : list
+            Squared offsets of the query to the cell of the node in each dimension.
+        k : int
+            Number of neighbors.
+        distance
+            Function giving the distance of the point at a position to the query.
+        accept
+            Optional function telling whether the point at a position can be a neighbor.
+        heap : list
+            Best points found so far.
+        tolerance : float
+            Allowed rounding error of the bound.
+        """
+        dimension = self.__splitDimension[node]
+        if dimension == -1:
+            for position in range(self.__start[node], self.__end[node]):
+                row = self.__order[position]
+                if accept is not None and not accept(row):
+                    continue
+                item = (-distance(row), -row)
+                if len(heap) < k:
+                    heapq.heappush(heap, item)
+                elif item > heap[0]:
+                    heapq.heapreplace(heap, item)
+            return
+        difference = query[dimension] - self.__splitValue[node]
+        if difference < 0:
+            near, far = self.__left[node], self.__right[node]
+        else:
+            near, far = self.__right[node], self.__left[node]
+        self.__search(near, query, bound, offsets, k, distance, accept, heap, tolerance)
+        offset = difference * difference
+        farBound = bound - offsets[dimension] + offset
+        if len(heap) < k or farBound - tolerance <= -heap[0][0]:
+            previous = offsets[dimension]
+            offsets[dimension] = offset
+            self.__search(far, query, farBound, offsets, k, distance, accept, heap, tolerance)
+            offsets[dimension] = previous
@@ -0,0 +1,210 @@
+import heapq
+import math
+from array import array
+from itertools import repeat
+from operator import add, mul, sub
+
+from Classification.Attribute.ContinuousAttribute import ContinuousAttribute
+from Classification.Attribute.DiscreteAttribute import DiscreteAttribute
+from Classification.DistanceMetric.DistanceMetric import DistanceMetric
+from Classification.DistanceMetric.EuclidianDistance import EuclidianDistance
+from Classification.DistanceMetric.MahalanobisDistance import MahalanobisDistance
+from Classification.Instance.Instance import Instance
+
+
+class KnnMatrix(object):
+
+    __size: int
+    __attributeSize: int
+    __columns: list
+    __continuous: list
+    __covarianceInverse: list
+    DISCRETE = 0
+    CONTINUOUS = 1
+
+    def __init__(self, instances: list, distanceMetric: DistanceMetric):
+        """
+        Constructor for the exhaustive nearest neighbor search over a matrix of the training instances. The values of
+        the training instances are stored column by column, and the distances of a query to all training instances
+        are computed a column at a time with element wise operations over the columns. The operations are the ones of
+        the distance metric in the same order, so the distances are exactly the distances given by the metric.
+
+        For EuclidianDistance, a column holds the values of an attribute, which must be continuous for all instances
+        or discrete for all instances. For MahalanobisDistance, the columns are the elements of the vectors of the
+        instances. For other metrics or other data, the matrix is not built.
+
+        PARAMETERS
+        ----------
+        instances : list
+            Training instances.
+        distanceMetric : DistanceMetric
+            Distance metric of the nearest neighbor search.
+        """
+        self.__size = len(instances)
+        self.__attributeSize = 0
+        self.__columns = None
+        self.__continuous = None
+        self.__covarianceInverse = None
+        if self.__size == 0:
+            return
+        if isinstance(distanceMetric, EuclidianDistance):
+            self.__buildAttributeColumns(instances)
+        elif isinstance(distanceMetric, MahalanobisDistance):
+            self.__buildVectorColumns(instances, distanceMetric)
+
+    def __buildAttributeColumns(self, instances: list):
+        """
+        Stores the values of each attribute as a column, continuous columns as arrays of floats.
+
+        PARAMETERS
+        ----------
+        instances : list
+            Training instances.
+        """
+        attributeSize = instances[0].attributeSize()
+        if any(instance.attributeSize() != attributeSize for instance in instances):
+            return
+        columns = []
+        continuous = []
+        for i in range(attributeSize):
+            attributes = [instance.getAttribute(i) for instance in instances]
+            if all(isinstance(attribute, ContinuousAttribute) and attribute.getValue() is not None
+                   for attribute in attributes):
+                columns.append(array('d', [attribute.getValue() for attribute in attributes]))
+                continuous.append(self.CONTINUOUS)
+            elif all(isinstance(attribute, DiscreteAttribute) for attribute in attributes):
+                columns.append([attribute.getValue() for attribute in attributes])
+                continuous.append(self.DISCRETE)
+            else:
+                return
+        self.__attributeSize = attributeSize
+        self.__columns = columns
+        self.__continuous = continuous
+
+    def __buildVectorColumns(self, instances: list, distanceMetric: MahalanobisDistance):
+        """
+        Stores each element of the vectors of the instances as a column, together with the inverse covariance matrix.
+
+        PARAMETERS
+        ----------
+        instances : list
+            Training instances.
+        distanceMetric : MahalanobisDistance
+            Mahalanobis distance with the inverse covariance matrix.
+        """
+        vectors = [instance.toVector() for instance in instances]
+        size = vectors[0].size()
+        covarianceInverse = distanceMetric.getCovarianceInverse()
+        if any(vector.size() != size for vector in vectors) or covarianceInverse.getRow() != size or \
+                covarianceInverse.getColumn() != size:
+            return
+        self.__columns = [array('d', [vector.getValue(j) for vector in vectors]) for j in range(size)]
+        self.__covarianceInverse = [[covarianceInverse.getValue(i, j) for j in range(size)] for i in range(size)]
+
+    def distances(self, instance: Instance) -> list:
+        """
+        Computes the distances of the given instance to all training instances.
+
+        PARAMETERS
+        ----------
+        instance : Instance
+            Query instance.
+
+        RETURNS
+        -------
+        list
+            Distance to each training instance, None if the matrix is not built or the instance does not fit it.
+        """
+        if self.__columns is None:
+            return None
+        if self.__covarianceInverse is not None:
+            return self.__mahalanobisDistances(instance)
+        return self.__euclidianDistances(instance)
+
+    def __euclidianDistances(self, instance: Instance) -> list:
+        """
+        Computes the Euclidean distances of the given instance as EuclidianDistance does: a discrete attribute adds one
+        if the value of the training instance is not None and differs, a continuous attribute adds the square of the
+        difference, and attributes of different types add nothing.
+
+        PARAMETERS
+        ----------
+        instance : Instance
+            Query instance.
+
+        RETURNS
+        -------
+        list
+            Distance to each training instance, None if the instance has fewer attributes.
+        """
+        if instance.attributeSize() < self.__attributeSize:
+            return None
+        result = [0] * self.__size
+        for i in range(self.__attributeSize):
+            attribute = instance.getAttribute(i)
+            column = self.__columns[i]
+            if self.__continuous[i] == self.DISCRETE:
+                if isinstance(attribute, DiscreteAttribute):
+                    value = attribute.getValue()
+                    result = [total + 1 if other is not None and other != value else total
+                              for total, other in zip(result, column)]
+            elif isinstance(attribute, ContinuousAttribute):
+                result = list(map(add, result, map(math.pow, map(sub, column, repeat(attribute.getValue())),
+                                                   repeat(2))))
+        return result
+
+    def __mahalanobisDistances(self, instance: Instance) -> list:
+        """
+        Computes the Mahalanobis distances of the given instance as MahalanobisDistance does: the difference vector v
+        of the training instance and the query is multiplied from the left with the inverse covariance matrix, and the
+        product is multiplied with v.
+
+        PARAMETERS
+        ----------
+        instance : Instance
+            Query instance.
+
+        RETURNS
+        -------
+        list
+            Distance to each training instance, None if the vector of the instance has a different size.
+        """
+        vector = instance.toVector()
+        size = len(self.__columns)
+        if vector.size() != size:
+            return None
+        differences = [list(map(sub, self.__columns[j], repeat(vector.getValue(j)))) for j in range(size)]
+        result = [0] * self.__size
+        for i in range(size):
+            product = [0.0] * self.__size
+            for j in range(size):
+                product = list(map(add, product, map(mul, differences[j], repeat(self.__covarianceInverse[j][i]))))
+            result = list(map(add, result, map(mul, product, differences[i])))
+        return result
+
+    def nearest(self, instance: Instance, k: int, accept=None) -> list:
+        """
+        Finds the k nearest training instances to the given instance. The k smallest distances are selected with a
+        heap instead of sorting all distances, and ties are broken by position, as in a stable sort.
+
+        PARAMETERS
+        ----------
+        instance : Instance
+            Query instance.
+        k : int
+            Number of neighbors.
+        accept
+            Optional function telling whether the training instance at a position can be a neighbor.
+
+        RETURNS
+        -------
+        list
+            Positions of the nearest training instances, None if the distances can not be computed by the matrix.
+        """
+        distances = self.distances(instance)
+        if distances is None:
+            return None
+        candidates = zip(distances, range(self.__size))
+        if accept is not None:
+            candidates = [candidate for candidate in candidates if accept(candidate[1])]
+        return [row for _, row in heapq.nsmallest(k, candidates)]
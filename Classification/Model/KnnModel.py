@@ -1,11 +1,24 @@
+import heapq
+import math
+from array import array
 from functools import cmp_to_key
+from itertools import compress, repeat
+from operator import add, le, mul
 
+from Math.Matrix import Matrix
+
+from Classification.Attribute.ContinuousAttribute import ContinuousAttribute
 from Classification.Classifier.Classifier import Classifier
 from Classification.DistanceMetric.DistanceMetric import DistanceMetric
+from Classification.DistanceMetric.EuclidianDistance import EuclidianDistance
+from Classification.DistanceMetric.MahalanobisDistance import MahalanobisDistance
 from Classification.Instance.CompositeInstance import CompositeInstance
 from Classification.Instance.Instance import Instance
 from Classification.InstanceList.InstanceList import InstanceList
+from Classification.Model.KdTree import KdTree
 from Classification.Model.KnnInstance import KnnInstance
+from Classification.Model.KnnMatrix import KnnMatrix
+from Classification.Model.LshIndex import LshIndex
 from Classification.Model.Model import Model
 
 
@@ -14,10 +27,34 @@ class KnnModel(Model):
     __data: InstanceList
     __k: int
     __distanceMetric: DistanceMetric
+    __instances: list
+    __index: KdTree
+    __matrix: KnnMatrix
+    __hashIndex: LshIndex
+    __columns: list
+    __mean: list
+    __whitening: list
+    __blockSize: int
+    __blockColumns: list
+    __blockNorms: array
+    __blockScale: float
 
-    def __init__(self, data: InstanceList, k: int, distanceMetric: DistanceMetric):
+    def __init__(self, data: InstanceList, k: int, distanceMetric: DistanceMetric, useIndex: bool = False,
+                 blockSize: int = 256, hashTables: int = 0, hashBits: int = 8, seed: int = 1):
         """
-        Constructor that sets the data InstanceList, k value and the DistanceMetric.
+        Constructor that sets the data InstanceList, k value and the DistanceMetric. If an index is requested, the
+        training instances are mapped to points whose squared Euclidean distances are the distances of the metric, and
+        a KD-tree is built over the points. For EuclidianDistance, the points are the continuous attributes, whose
+        squared differences are the terms of the distance; the differences of the discrete attributes only add to the
+        distance. For MahalanobisDistance, the vectors of the instances are whitened with the Cholesky factor of the
+        inverse covariance matrix, or of its symmetric part, which gives the same distances. The points are centered by
+        their mean to keep the rounding errors small. If the metric or the data does not allow such a mapping, no index
+        is built. Without an index, the neighbors are found by an exhaustive search over a matrix of the training
+        instances, if the metric and the data allow it.
+
+        If hash tables are requested, a locality sensitive hashing index is built over the same points, and the
+        neighbors are searched only among the training instances sharing a bucket with the query, which is faster but
+        may miss some of the exact neighbors. The hashing index replaces the KD-tree.
 
         PARAMETERS
         ----------
@@ -27,10 +64,153 @@ class KnnModel(Model):
             K value.
         distanceMetric : DistanceMetric
             DistanceMetric input.
+        useIndex : bool
+            If true, a KD-tree is built to find the nearest neighbors.
+        blockSize : int
+            Number of instances whose distances are computed together by predictBatch.
+        hashTables : int
+            Number of hash tables of the approximate search, 0 for the exact search.
+        hashBits : int
+            Number of bits of the keys of the hash tables.
+        seed : int
+            Seed of the random hyperplanes of the hash tables.
         """
         self.__data = data
         self.__k = k
         self.__distanceMetric = distanceMetric
+        self.__instances = list(data.getInstances())
+        self.__index = None
+        self.__matrix = None
+        self.__hashIndex = None
+        self.__columns = None
+        self.__mean = None
+        self.__whitening = None
+        self.__blockSize = max(blockSize, 1)
+        self.__blockColumns = None
+        self.__blockNorms = None
+        self.__blockScale = 0.0
+        if hashTables > 0 and data.size() > 0:
+            points = self.__buildPoints()
+            if points is not None:
+                self.__hashIndex = LshIndex(points, hashTables, hashBits, seed)
+        elif useIndex and data.size() > 0:
+            self.__buildIndex()
+        if self.__index is None:
+            self.__matrix = KnnMatrix(self.__instances, distanceMetric)
+
+    def __buildIndex(self):
+        """
+        Builds the KD-tree over the points of the training instances, if the distance metric allows it.
+        """
+        points = self.__buildPoints()
+        if points is not None:
+            self.__index = KdTree(points)
+
+    def __buildPoints(self) -> list:
+        """
+        Maps the training instances to points, if the distance metric allows it.
+
+        RETURNS
+        -------
+        list
+            Points of the training instances, None if they can not be mapped.
+        """
+        instances = self.__instances
+        if isinstance(self.__distanceMetric, EuclidianDistance):
+            self.__columns = [i for i in range(instances[0].attributeSize())
+                              if isinstance(instances[0].getAttribute(i), ContinuousAttribute)]
+        elif isinstance(self.__distanceMetric, MahalanobisDistance):
+            self.__whitening = self.__cholesky(self.__distanceMetric.getCovarianceInverse())
+            if self.__whitening is None:
+                return None
+        else:
+            return None
+        vectors = [self.__vector(instance) for instance in instances]
+        if any(vector is None for vector in vectors) or len(vectors[0]) == 0:
+            return None
+        self.__mean = [sum(column) / len(vectors) for column in zip(*vectors)]
+        return [self.__point(vector) for vector in vectors]
+
+    @staticmethod
+    def __cholesky(matrix: Matrix) -> list:
+        """
+        Finds the lower triangular Cholesky factor L of the symmetric part of the given matrix, so that for a row
+        vector v, v M v^T is the squared length of v L.
+
+        PARAMETERS
+        ----------
+        matrix : Matrix
+            Square matrix.
+
+        RETURNS
+        -------
+        list
+            Rows of the Cholesky factor, None if the symmetric part is not positive definite.
+        """
+        size = matrix.getRow()
+        factor = [[0.0] * size for _ in range(size)]
+        for j in range(size):
+            for i in range(j, size):
+                total = (matrix.getValue(i, j) + matrix.getValue(j, i)) / 2
+                for k in range(j):
+                    total -= factor[i][k] * factor[j][k]
+                if i == j:
+                    if total <= 0.0:
+                        return None
+                    factor[j][j] = math.sqrt(total)
+                else:
+                    factor[i][j] = total / factor[j][j]
+        return factor
+
+    def __vector(self, instance: Instance) -> list:
+        """
+        Returns the values of the instance that are mapped to a point.
+
+        PARAMETERS
+        ----------
+        instance : Instance
+            Instance to be mapped.
+
+        RETURNS
+        -------
+        list
+            Continuous attributes for EuclidianDistance or the vector of the instance for MahalanobisDistance, None if
+            the instance does not fit the mapping.
+        """
+        if self.__columns is not None:
+            if len(self.__columns) > 0 and instance.attributeSize() <= self.__columns[-1]:
+                return None
+            values = []
+            for i in self.__columns:
+                attribute = instance.getAttribute(i)
+                if not isinstance(attribute, ContinuousAttribute) or attribute.getValue() is None:
+                    return None
+                values.append(attribute.getValue())
+            return values
+        vector = instance.toVector()
+        if vector.size() != len(self.__whitening):
+            return None
+        return [vector.getValue(i) for i in range(vector.size())]
+
+    def __point(self, vector: list) -> list:
+        """
+        Centers the values of an instance and whitens them for MahalanobisDistance.
+
+        PARAMETERS
+        ----------
+        vector : list
+            Values of the instance.
+
+        RETURNS
+        -------
+        list
+            Point of the instance.
+        """
+        centered = [value - mean for value, mean in zip(vector, self.__mean)]
+        if self.__whitening is None:
+            return centered
+        size = len(centered)
+        return [sum(centered[j] * self.__whitening[j][i] for j in range(i, size)) for i in range(size)]
 
     def predict(self, instance: Instance) -> str:
         """
@@ -54,6 +234,149 @@ class KnnModel(Model):
             predictedClass = Model.getMaximum(nearestNeighbors.getClassLabels())
         return predictedClass
 
+    def __buildBlockColumns(self):
+        """
+        Stores the coordinates of the points of the training instances multiplied by -2 as columns, together with the
+        squared lengths of the points, for the expansion of the squared distances in predictBatch. The columns are left
+        empty if the squared distances of the points are not the whole distances of the metric, that is, for
+        EuclidianDistance if an instance has attributes that are not continuous.
+        """
+        self.__blockColumns = []
+        if self.__data.size() == 0:
+            return
+        points = self.__buildPoints()
+        if points is None:
+            return
+        if self.__columns is not None and any(instance.attributeSize() != len(self.__columns)
+                                              for instance in self.__instances):
+            return
+        self.__blockColumns = [array('d', [-2 * point[j] for point in points]) for j in range(len(points[0]))]
+        self.__blockNorms = array('d', [sum(value * value for value in point) for point in points])
+        self.__blockScale = max(self.__blockNorms)
+
+    def __blockDistances(self, points: list) -> list:
+        """
+        Computes the matrix of the squared distances of the given points to the points of the training instances with
+        the expansion |a|^2 + |b|^2 - 2ab, column by column. The squared length of the query |a|^2 is the same for all
+        training instances, so it is left out.
+
+        PARAMETERS
+        ----------
+        points : list
+            Points of the instances of a block.
+
+        RETURNS
+        -------
+        list
+            For each point, the expanded distance to each training instance without |a|^2.
+        """
+        matrix = []
+        for point in points:
+            distances = self.__blockNorms
+            for column, value in zip(self.__blockColumns, point):
+                distances = list(map(add, distances, map(mul, column, repeat(value))))
+            matrix.append(distances)
+        return matrix
+
+    def __refine(self, instance: Instance, point: list, distances: list) -> list:
+        """
+        Finds the k nearest training instances from the expanded distances. The expansion has rounding errors, so the
+        expanded distances are only used to discard the training instances that can not be among the k nearest: an
+        instance is kept if its expanded distance is within twice the tolerance of the k'th smallest one. The distances
+        of the kept instances are computed by the distance metric, and they are ordered by distance and position, as
+        in the exhaustive search.
+
+        PARAMETERS
+        ----------
+        instance : Instance
+            Query instance.
+        point : list
+            Point of the query instance.
+        distances : list
+            Expanded distances of the query to the training instances.
+
+        RETURNS
+        -------
+        list
+            Positions of the nearest training instances.
+        """
+        tolerance = KdTree.TOLERANCE * (self.__blockScale + sum(value * value for value in point))
+        threshold = heapq.nsmallest(self.__k, distances)[-1] + 2 * tolerance
+        candidates = compress(range(len(distances)), map(le, distances, repeat(threshold)))
+        exact = sorted((self.__distanceMetric.distance(self.__instances[row], instance), row) for row in candidates)
+        return [row for _, row in exact[:self.__k]]
+
+    def predictBatch(self, instances: list) -> list:
+        """
+        Predicts the class labels of a list of instances block by block. For each block of blockSize instances, the
+        matrix of the expanded squared distances of the instances to the training instances is computed, and the k
+        nearest training instances of each instance are found from its row of the matrix. The nearest neighbors, and
+        so the predictions, are the same as in the predict method. Composite instances, instances that do not fit the
+        points of the training instances, and all instances of a model with an index or hash tables are predicted one
+        by one.
+
+        PARAMETERS
+        ----------
+        instances : list
+            Instances to make prediction.
+
+        RETURNS
+        -------
+        list
+            Predictions in the order of the instances.
+        """
+        if self.__index is not None or self.__hashIndex is not None or self.__k < 1:
+            return super().predictBatch(instances)
+        if self.__blockColumns is None:
+            self.__buildBlockColumns()
+        if len(self.__blockColumns) == 0:
+            return super().predictBatch(instances)
+        predictions = [None] * len(instances)
+        for start in range(0, len(instances), self.__blockSize):
+            rows = []
+            points = []
+            for i in range(start, min(start + self.__blockSize, len(instances))):
+                vector = None
+                if not isinstance(instances[i], CompositeInstance):
+                    vector = self.__vector(instances[i])
+                if vector is None:
+                    predictions[i] = self.predict(instances[i])
+                else:
+                    rows.append(i)
+                    points.append(self.__point(vector))
+            for i, point, distances in zip(rows, points, self.__blockDistances(points)):
+                neighbors = self.__refine(instances[i], point, distances)
+                predictions[i] = Model.getMaximum([self.__instances[row].getClassLabel() for row in neighbors])
+        return predictions
+
+    def __hashNeighbors(self, instance: Instance, accept) -> list:
+        """
+        Finds the k nearest training instances among the candidates of the hashing index.
+
+        PARAMETERS
+        ----------
+        instance : Instance
+            Query instance.
+        accept
+            Optional function telling whether the training instance at a position can be a neighbor.
+
+        RETURNS
+        -------
+        list
+            Positions of the nearest candidates, None if the instance does not fit the points of the training
+            instances or there are fewer than k candidates.
+        """
+        vector = self.__vector(instance)
+        if vector is None:
+            return None
+        candidates = self.__hashIndex.candidates(self.__point(vector))
+        if accept is not None:
+            candidates = [row for row in candidates if accept(row)]
+        if len(candidates) < self.__k:
+            return None
+        exact = sorted((self.__distanceMetric.distance(self.__instances[row], instance), row) for row in candidates)
+        return [row for _, row in exact[:self.__k]]
+
     def makeComparator(self):
         def compare(instanceA: KnnInstance, instanceB: KnnInstance):
             if instanceA.distance < instanceB.distance:
@@ -69,7 +392,10 @@ class KnnModel(Model):
         The nearestNeighbors method takes an Instance as an input. First it gets the possible class labels, then loops
         through the data InstanceList and creates new list of KnnInstances and adds the corresponding data with
         the distance between data and given instance. After sorting this newly created list, it loops k times and
-        returns the first k instances as an InstanceList.
+        returns the first k instances as an InstanceList. If the model has an index, the neighbors are found with the
+        KD-tree, otherwise with the matrix of the training instances if it can compute the distances, in the same
+        order. If the model has hash tables, the candidates sharing a bucket with the instance are ordered in the same
+        way; if there are fewer than k candidates, the exact search is used.
 
         PARAMETERS
         ----------
@@ -86,6 +412,24 @@ class KnnModel(Model):
         possibleClassLabels = []
         if isinstance(instance, CompositeInstance):
             possibleClassLabels = instance.getPossibleClassLabels()
+        accept = None
+        if isinstance(instance, CompositeInstance):
+            accept = lambda row: self.__instances[row].getClassLabel() in possibleClassLabels
+        rows = None
+        if self.__hashIndex is not None:
+            rows = self.__hashNeighbors(instance, accept)
+        if rows is None and self.__index is not None:
+            vector = self.__vector(instance)
+            if vector is not None:
+                rows = self.__index.nearest(self.__point(vector), self.__k,
+                                            lambda row: self.__distanceMetric.distance(self.__instances[row], instance),
+                                            accept)
+        elif rows is None and self.__matrix is not None:
+            rows = self.__matrix.nearest(instance, self.__k, accept)
+        if rows is not None:
+            for row in rows:
+                result.add(self.__instances[row])
+            return result
         for i in range(self.__data.size()):
             if not isinstance(instance, CompositeInstance) or self.__data.get(i).getClassLabel() in possibleClassLabels:
                 instances.append(KnnInstance(self.__data.get(i), self.__distanceMetric.distance(self.__data.get(i),
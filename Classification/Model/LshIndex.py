@@ -0,0 +1,79 @@
+import random
+
+
+class LshIndex(object):
+
+    __hyperplanes: list
+    __buckets: list
+
+    def __init__(self, points: list, tables: int, bits: int, seed: int):
+        """
+        Constructor that builds a random projection locality sensitive hashing index over the given points. Each of
+        the hash tables has bits random hyperplanes through the origin, whose normals have normally distributed
+        coordinates, and the key of a point in a table is formed by the sides of the hyperplanes the point is on.
+        Near points are likely to have the same key in at least one table. More bits give smaller buckets and faster
+        queries, more tables give more candidates and a higher recall.
+
+        PARAMETERS
+        ----------
+        points : list
+            Coordinates of the points, all of the same dimension and centered around the origin. A point is referred
+            to by its position in the list.
+        tables : int
+            Number of hash tables.
+        bits : int
+            Number of hyperplanes of each hash table.
+        seed : int
+            Seed of the random hyperplanes.
+        """
+        dimension = len(points[0]) if len(points) > 0 else 0
+        generator = random.Random(seed)
+        self.__hyperplanes = [[[generator.gauss(0.0, 1.0) for _ in range(dimension)] for _ in range(bits)]
+                              for _ in range(tables)]
+        self.__buckets = [{} for _ in range(tables)]
+        for position in range(len(points)):
+            for table in range(tables):
+                self.__buckets[table].setdefault(self.__key(table, points[position]), []).append(position)
+
+    def __key(self, table: int, point: list) -> int:
+        """
+        Computes the key of a point in a hash table, whose i'th bit is set if the point is on the positive side of the
+        i'th hyperplane of the table.
+
+        PARAMETERS
+        ----------
+        table : int
+            Number of the hash table.
+        point : list
+            Coordinates of the point.
+
+        RETURNS
+        -------
+        int
+            Key of the point.
+        """
+        key = 0
+        for hyperplane in self.__hyperplanes[table]:
+            key <<= 1
+            if sum(value * normal for value, normal in zip(point, hyperplane)) >= 0:
+                key |= 1
+        return key
+
+    def candidates(self, query: list) -> list:
+        """
+        Finds the points sharing a bucket with the query in any of the hash tables.
+
+        PARAMETERS
+        ----------
+        query : list
+            Coordinates of the query.
+
+        RETURNS
+        -------
+        list
+            Positions of the candidate points in increasing order.
+        """
+        result = set()
+        for table in range(len(self.__buckets)):
+            result.update(self.__buckets[table].get(self.__key(table, query), []))
+        return sorted(result)
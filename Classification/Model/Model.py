@@ -24,6 +24,23 @@ class Model(object):
         """
         pass
 
+    def predictBatch(self, instances: list) -> list:
+        """
+        Predicts the class labels of a list of instances. Models that can predict many instances together faster than
+        one by one override this method.
+
+        PARAMETERS
+        ----------
+        instances : list
+            Instances to make prediction.
+
+        RETURNS
+        -------
+        list
+            Predictions in the order of the instances.
+        """
+        return [self.predict(instance) for instance in instances]
+
     @staticmethod
     def getMaximum(classLabels: list) -> str:
         """
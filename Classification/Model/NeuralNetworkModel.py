@@ -3,6 +3,7 @@ from abc import abstractmethod
 from Math.Matrix import Matrix
 from Math.Vector import Vector
 
+from Classification.DataSet.SymbolTable import SymbolTable
 from Classification.Instance.CompositeInstance import CompositeInstance
 from Classification.Instance.Instance import Instance
 from Classification.InstanceList.InstanceList import InstanceList
@@ -13,6 +14,7 @@ import math
 
 class NeuralNetworkModel(ValidatedModel):
     classLabels: list
+    classSymbols: SymbolTable
     K: int
     d: int
     x: Vector
@@ -32,7 +34,8 @@ class NeuralNetworkModel(ValidatedModel):
         trainSet : InstanceList
             InstanceList to use as train set.
         """
-        self.classLabels = trainSet.getDistinctClassLabels()
+        self.classSymbols = SymbolTable(trainSet.getDistinctClassLabels())
+        self.classLabels = self.classSymbols.getSymbols()
         self.K = len(self.classLabels)
         self.d = trainSet.get(0).continuousAttributeSize()
 
@@ -176,7 +179,7 @@ class NeuralNetworkModel(ValidatedModel):
             Difference between newly created Vector and normalized output.
         """
         r = Vector()
-        r.initAllZerosExceptOne(self.K, self.classLabels.index(instance.getClassLabel()), 1.0)
+        r.initAllZerosExceptOne(self.K, self.classSymbols.indexOf(instance.getClassLabel()), 1.0)
         o = weights.multiplyWithVectorFromRight(inputVector)
         y = self.normalizeOutput(o)
         return r.difference(y)
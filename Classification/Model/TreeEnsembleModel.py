@@ -1,14 +1,18 @@
+from array import array
+
 from Math.DiscreteDistribution import DiscreteDistribution
 
 from Classification.Instance.Instance import Instance
 from Classification.Model.Model import Model
+from Classification.Performance.DetailedClassificationPerformance import DetailedClassificationPerformance
 
 
 class TreeEnsembleModel(Model):
 
     __forest: list
+    __outOfBagPerformance: DetailedClassificationPerformance
 
-    def __init__(self, forest: list):
+    def __init__(self, forest: list, outOfBagPerformance: DetailedClassificationPerformance = None):
         """
         A constructor which sets the list of DecisionTree with given input.
 
@@ -16,8 +20,22 @@ class TreeEnsembleModel(Model):
         ----------
         forest list
             A list of DecisionTrees.
+        outOfBagPerformance : DetailedClassificationPerformance
+            Optional out-of-bag performance of the forest on its training data.
         """
         self.__forest = forest
+        self.__outOfBagPerformance = outOfBagPerformance
+
+    def getOutOfBagPerformance(self) -> DetailedClassificationPerformance:
+        """
+        Accessor for the out-of-bag performance.
+
+        RETURNS
+        -------
+        DetailedClassificationPerformance
+            Out-of-bag performance of the forest, None if it is not computed.
+        """
+        return self.__outOfBagPerformance
 
     def predict(self, instance: Instance) -> str:
         """
@@ -38,3 +56,97 @@ class TreeEnsembleModel(Model):
         for tree in self.__forest:
             distribution.addItem(tree.predict(instance))
         return distribution.getMaxItem()
+
+    def predictBatch(self, instances: list, earlyStop: bool = False) -> list:
+        """
+        Predicts the class labels of a list of instances by batch voting. Each tree predicts the instances together,
+        and the votes are accumulated in a classes by instances integer array. As in predict, the class with the most
+        votes wins and ties are broken in favor of the class that got its first vote from an earlier tree.
+
+        If early stopping is requested, an instance is not given to the remaining trees once its leading class has
+        more votes than the second class plus the number of remaining trees, since the remaining votes can not
+        change the prediction then. The predictions are the same as without early stopping.
+
+        PARAMETERS
+        ----------
+        instances : list
+            Instances to make prediction.
+        earlyStop : bool
+            If true, the trees are not queried for the instances whose predictions are decided.
+
+        RETURNS
+        -------
+        list
+            Predictions in the order of the instances.
+        """
+        size = len(instances)
+        forestSize = len(self.__forest)
+        classCodes = {}
+        classLabels = []
+        votes = []
+        firstVotes = []
+        rows = list(range(size))
+        for treeIndex in range(forestSize):
+            if len(rows) == 0:
+                break
+            if len(rows) == size:
+                predictions = self.__forest[treeIndex].predictBatch(instances)
+            else:
+                predictions = self.__forest[treeIndex].predictBatch(list(map(instances.__getitem__, rows)))
+            for row, prediction in zip(rows, predictions):
+                code = classCodes.get(prediction)
+                if code is None:
+                    code = len(classLabels)
+                    classCodes[prediction] = code
+                    classLabels.append(prediction)
+                    votes.append(array('i', bytes(4 * size)))
+                    firstVotes.append(array('i', [forestSize] * size))
+                if votes[code][row] == 0:
+                    firstVotes[code][row] = treeIndex
+                votes[code][row] += 1
+            remaining = forestSize - treeIndex - 1
+            if earlyStop and treeIndex + 1 > remaining:
+                rows = [row for row in rows if not self.__decided(votes, row, remaining)]
+        predictions = []
+        for row in range(size):
+            maxItem = ""
+            maxValue = 0
+            firstVote = forestSize
+            for code in range(len(classLabels)):
+                value = votes[code][row]
+                if value > maxValue or (value == maxValue and value > 0 and firstVotes[code][row] < firstVote):
+                    maxItem = classLabels[code]
+                    maxValue = value
+                    firstVote = firstVotes[code][row]
+            predictions.append(maxItem)
+        return predictions
+
+    @staticmethod
+    def __decided(votes: list, row: int, remaining: int) -> bool:
+        """
+        Checks if the leading class of an instance can not be caught by any other class with the remaining votes.
+
+        PARAMETERS
+        ----------
+        votes : list
+            Vote counts of each class for each instance.
+        row : int
+            Position of the instance.
+        remaining : int
+            Number of trees that have not voted yet.
+
+        RETURNS
+        -------
+        bool
+            True if the prediction of the instance is decided.
+        """
+        first = 0
+        second = 0
+        for classVotes in votes:
+            value = classVotes[row]
+            if value > first:
+                second = first
+                first = value
+            elif value > second:
+                second = value
+        return first > second + remaining
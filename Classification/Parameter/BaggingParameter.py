@@ -1,11 +1,15 @@
-from Classification.Parameter.Parameter import Parameter
+from Classification.Parameter.DecisionTreeParameter import DecisionTreeParameter
 
 
-class BaggingParameter(Parameter):
+class BaggingParameter(DecisionTreeParameter):
 
     ensembleSize: int
+    workers: int
 
-    def __init__(self, seed: int, ensembleSize: int):
+    def __init__(self, seed: int, ensembleSize: int, presort: bool = False, histogramBins: int = 0,
+                 workers: int = 1, lean: bool = False,
+                 maxDepth: int = 0, minSplitSize: int = 2, minLeafSize: int = 1, minGain: float = 0.0,
+                 maxLeafCount: int = 0):
         """
         Parameters of the bagging trees algorithm.
 
@@ -15,9 +19,29 @@ class BaggingParameter(Parameter):
             Seed is used for random number generation.
         ensembleSize : int
             The number of trees in the bagged forest.
+        presort : bool
+            If true, the continuous attributes are sorted once at the root of each tree.
+        histogramBins : int
+            If positive, the maximum number of bins of a continuous attribute for histogram based split search.
+        workers : int
+            Number of processes training the trees. If 1, the trees are trained one after another.
+        lean : bool
+            If true, only the compiled form of each tree is kept after training.
+        maxDepth : int
+            If positive, the maximum depth of a split node.
+        minSplitSize : int
+            Minimum number of instances of a split node.
+        minLeafSize : int
+            Minimum number of instances of a child.
+        minGain : float
+            Minimum information gain of a split.
+        maxLeafCount : int
+            If positive, the maximum number of leaves of a tree, which is then grown best first.
         """
-        super().__init__(seed)
+        super().__init__(seed, presort, histogramBins, lean, maxDepth, minSplitSize, minLeafSize, minGain,
+                         maxLeafCount)
         self.ensembleSize = ensembleSize
+        self.workers = workers
 
     def getEnsembleSize(self) -> int:
         """
@@ -29,3 +53,14 @@ class BaggingParameter(Parameter):
             The ensemble size.
         """
         return self.ensembleSize
+
+    def getWorkers(self) -> int:
+        """
+        Accessor for the number of workers.
+
+        RETURNS
+        -------
+        int
+            Number of processes training the trees.
+        """
+        return self.workers
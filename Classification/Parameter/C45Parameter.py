@@ -1,12 +1,15 @@
-from Classification.Parameter.Parameter import Parameter
+from Classification.Parameter.DecisionTreeParameter import DecisionTreeParameter
 
 
-class C45Parameter(Parameter):
+class C45Parameter(DecisionTreeParameter):
 
     __prune: bool
     __crossValidationRatio: float
 
-    def __init__(self, seed: int, prune: bool, crossValidationRatio: float):
+    def __init__(self, seed: int, prune: bool, crossValidationRatio: float, presort: bool = False,
+                 histogramBins: int = 0, lean: bool = False,
+                 maxDepth: int = 0, minSplitSize: int = 2, minLeafSize: int = 1, minGain: float = 0.0,
+                 maxLeafCount: int = 0):
         """
         Parameters of the C4.5 univariate decision tree classifier.
 
@@ -18,8 +21,25 @@ class C45Parameter(Parameter):
             Boolean value for prune.
         crossValidationRatio : float
             Double value for cross crossValidationRatio ratio.
+        presort : bool
+            If true, the continuous attributes are sorted once at the root of the tree.
+        histogramBins : int
+            If positive, the maximum number of bins of a continuous attribute for histogram based split search.
+        lean : bool
+            If true, the nodes of the tree keep only their class counts instead of their training data.
+        maxDepth : int
+            If positive, the maximum depth of a split node.
+        minSplitSize : int
+            Minimum number of instances of a split node.
+        minLeafSize : int
+            Minimum number of instances of a child.
+        minGain : float
+            Minimum information gain of a split.
+        maxLeafCount : int
+            If positive, the maximum number of leaves of a tree, which is then grown best first.
         """
-        super().__init__(seed)
+        super().__init__(seed, presort, histogramBins, lean, maxDepth, minSplitSize, minLeafSize, minGain,
+                         maxLeafCount)
         self.__prune = prune
         self.__crossValidationRatio = crossValidationRatio
 
@@ -0,0 +1,142 @@
+from Classification.Parameter.Parameter import Parameter
+
+
+class DecisionTreeParameter(Parameter):
+
+    __presort: bool
+    __histogramBins: int
+    __lean: bool
+    __maxDepth: int
+    __minSplitSize: int
+    __minLeafSize: int
+    __minGain: float
+    __maxLeafCount: int
+
+    def __init__(self, seed: int, presort: bool = False, histogramBins: int = 0, lean: bool = False,
+                 maxDepth: int = 0, minSplitSize: int = 2, minLeafSize: int = 1, minGain: float = 0.0,
+                 maxLeafCount: int = 0):
+        """
+        Parameters of the induction of univariate decision trees, shared by the tree based classifiers.
+
+        PARAMETERS
+        ----------
+        seed : int
+            Seed is used for random number generation.
+        presort : bool
+            If true, each continuous attribute is sorted once at the root and the sorted orders are partitioned into
+            the children, so that the split search at a node is a linear scan.
+        histogramBins : int
+            If positive, each continuous attribute is quantile binned once into at most histogramBins bins and the
+            splits are searched over the bin boundaries from per bin class counts. Takes precedence over presort.
+        lean : bool
+            If true, the nodes release their training data once their children are built and keep only their class
+            counts, and forests keep only the compiled form of their trees.
+        maxDepth : int
+            If positive, nodes at this depth are not split. The root is at depth 0.
+        minSplitSize : int
+            Nodes with fewer instances are not split.
+        minLeafSize : int
+            Splits giving a child with fewer instances are not considered.
+        minGain : float
+            Splits whose information gain is not larger than minGain are not considered.
+        maxLeafCount : int
+            If positive, the tree is grown best first, always splitting the leaf whose split decreases the total
+            entropy most, until the tree has maxLeafCount leaves.
+        """
+        super().__init__(seed)
+        self.__presort = presort
+        self.__histogramBins = histogramBins
+        self.__lean = lean
+        self.__maxDepth = maxDepth
+        self.__minSplitSize = minSplitSize
+        self.__minLeafSize = minLeafSize
+        self.__minGain = minGain
+        self.__maxLeafCount = maxLeafCount
+
+    def isPresort(self) -> bool:
+        """
+        Accessor for the presort.
+
+        RETURNS
+        -------
+        bool
+            Presort.
+        """
+        return self.__presort
+
+    def getHistogramBins(self) -> int:
+        """
+        Accessor for the histogramBins.
+
+        RETURNS
+        -------
+        int
+            Maximum number of bins of a continuous attribute, 0 if histogram splits are not used.
+        """
+        return self.__histogramBins
+
+    def isLean(self) -> bool:
+        """
+        Accessor for the lean.
+
+        RETURNS
+        -------
+        bool
+            Lean.
+        """
+        return self.__lean
+
+    def getMaxDepth(self) -> int:
+        """
+        Accessor for the maxDepth.
+
+        RETURNS
+        -------
+        int
+            Maximum depth of a split node, 0 if the depth is not limited.
+        """
+        return self.__maxDepth
+
+    def getMinSplitSize(self) -> int:
+        """
+        Accessor for the minSplitSize.
+
+        RETURNS
+        -------
+        int
+            Minimum number of instances of a split node.
+        """
+        return self.__minSplitSize
+
+    def getMinLeafSize(self) -> int:
+        """
+        Accessor for the minLeafSize.
+
+        RETURNS
+        -------
+        int
+            Minimum number of instances of a child.
+        """
+        return self.__minLeafSize
+
+    def getMinGain(self) -> float:
+        """
+        Accessor for the minGain.
+
+        RETURNS
+        -------
+        float
+            Minimum information gain of a split.
+        """
+        return self.__minGain
+
+    def getMaxLeafCount(self) -> int:
+        """
+        Accessor for the maxLeafCount.
+
+        RETURNS
+        -------
+        int
+            Maximum number of leaves, 0 if the number of leaves is not limited.
+        """
+        return self.__maxLeafCount
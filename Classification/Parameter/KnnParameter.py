@@ -5,8 +5,13 @@ from Classification.Parameter.KMeansParameter import KMeansParameter
 class KnnParameter(KMeansParameter):
 
     __k: int
+    __useIndex: bool
+    __blockSize: int
+    __hashTables: int
+    __hashBits: int
 
-    def __init__(self, seed: int, k: int, distanceMetric=EuclidianDistance()):
+    def __init__(self, seed: int, k: int, distanceMetric=EuclidianDistance(), useIndex: bool = False,
+                 blockSize: int = 256, hashTables: int = 0, hashBits: int = 8):
         """
         Parameters of the K-nearest neighbor classifier.
 
@@ -18,9 +23,26 @@ class KnnParameter(KMeansParameter):
             Parameter of the K-nearest neighbor algorithm.
         distanceMetric : DistanceMetric
             Used to calculate the distance between two instances.
+        useIndex : bool
+            If true, a KD-tree is built over the training instances to find the nearest neighbors. The index is used
+            with EuclidianDistance and MahalanobisDistance and gives the same neighbors as the exhaustive search.
+        blockSize : int
+            Number of test instances whose distances to the training instances are computed together. The distance
+            matrix of a block has blockSize times the training set size entries.
+        hashTables : int
+            If positive, the nearest neighbors are searched approximately with this many random projection hash
+            tables, whose hyperplanes are generated from the seed. More tables give a higher recall and slower queries.
+            0 gives the exact search.
+        hashBits : int
+            Number of hyperplanes of each hash table. More bits give smaller buckets, faster queries and a lower
+            recall.
         """
         super().__init__(seed, distanceMetric)
         self.__k = k
+        self.__useIndex = useIndex
+        self.__blockSize = blockSize
+        self.__hashTables = hashTables
+        self.__hashBits = hashBits
 
     def getK(self) -> int:
         """
@@ -32,3 +54,47 @@ class KnnParameter(KMeansParameter):
             Value of the k.
         """
         return self.__k
+
+    def isUseIndex(self) -> bool:
+        """
+        Accessor for the useIndex.
+
+        RETURNS
+        -------
+        bool
+            UseIndex.
+        """
+        return self.__useIndex
+
+    def getBlockSize(self) -> int:
+        """
+        Accessor for the blockSize.
+
+        RETURNS
+        -------
+        int
+            BlockSize.
+        """
+        return self.__blockSize
+
+    def getHashTables(self) -> int:
+        """
+        Accessor for the hashTables.
+
+        RETURNS
+        -------
+        int
+            HashTables.
+        """
+        return self.__hashTables
+
+    def getHashBits(self) -> int:
+        """
+        Accessor for the hashBits.
+
+        RETURNS
+        -------
+        int
+            HashBits.
+        """
+        return self.__hashBits
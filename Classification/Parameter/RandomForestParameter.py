@@ -5,7 +5,10 @@ class RandomForestParameter(BaggingParameter):
 
     __attributeSubsetSize: int
 
-    def __init__(self, seed: int, ensembleSize: int, attributeSubsetSize: int):
+    def __init__(self, seed: int, ensembleSize: int, attributeSubsetSize: int, presort: bool = False,
+                 histogramBins: int = 0, workers: int = 1, lean: bool = False,
+                 maxDepth: int = 0, minSplitSize: int = 2, minLeafSize: int = 1, minGain: float = 0.0,
+                 maxLeafCount: int = 0):
         """
         Parameters of the random forest classifier.
 
@@ -17,8 +20,27 @@ class RandomForestParameter(BaggingParameter):
             The number of trees in the bagged forest.
         attributeSubsetSize : int
             Integer value for the size of attribute subset.
+        presort : bool
+            If true, the continuous attributes are sorted once at the root of each tree.
+        histogramBins : int
+            If positive, the maximum number of bins of a continuous attribute for histogram based split search.
+        workers : int
+            Number of processes training the trees. If 1, the trees are trained one after another.
+        lean : bool
+            If true, only the compiled form of each tree is kept after training.
+        maxDepth : int
+            If positive, the maximum depth of a split node.
+        minSplitSize : int
+            Minimum number of instances of a split node.
+        minLeafSize : int
+            Minimum number of instances of a child.
+        minGain : float
+            Minimum information gain of a split.
+        maxLeafCount : int
+            If positive, the maximum number of leaves of a tree, which is then grown best first.
         """
-        super().__init__(seed, ensembleSize)
+        super().__init__(seed, ensembleSize, presort, histogramBins, workers, lean,
+                         maxDepth, minSplitSize, minLeafSize, minGain, maxLeafCount)
         self.__attributeSubsetSize = attributeSubsetSize
 
     def getAttributeSubsetSize(self) -> int:
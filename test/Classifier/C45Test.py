@@ -1,6 +1,9 @@
 import unittest
 
 from Classification.Classifier.C45 import C45
+from Classification.InstanceList.Partition import Partition
+from Classification.Model.DecisionTree.DecisionNode import DecisionNode
+from Classification.Model.DecisionTree.DecisionTree import DecisionTree
 from Classification.Parameter.C45Parameter import C45Parameter
 from test.Classifier.ClassifierTest import ClassifierTest
 
@@ -25,6 +28,72 @@ class C45Test(ClassifierTest):
         c45.train(self.chess.getInstanceList(), c45Parameter)
         self.assertAlmostEqual(52.57, 100 * c45.test(self.chess.getInstanceList()).getErrorRate(), 2)
 
+    def test_TrainPresort(self):
+        c45 = C45()
+        for dataSet in [self.iris, self.bupa, self.dermatology, self.car]:
+            c45.train(dataSet.getInstanceList(), C45Parameter(1, True, 0.2))
+            errorRate = c45.test(dataSet.getInstanceList()).getErrorRate()
+            c45.train(dataSet.getInstanceList(), C45Parameter(1, True, 0.2, True))
+            self.assertAlmostEqual(errorRate, c45.test(dataSet.getInstanceList()).getErrorRate(), 6)
+
+    def test_TrainHistogram(self):
+        c45 = C45()
+        for dataSet in [self.iris, self.bupa, self.dermatology]:
+            c45.train(dataSet.getInstanceList(), C45Parameter(1, True, 0.2))
+            errorRate = c45.test(dataSet.getInstanceList()).getErrorRate()
+            c45.train(dataSet.getInstanceList(), C45Parameter(1, True, 0.2, False, 256))
+            self.assertAlmostEqual(errorRate, c45.test(dataSet.getInstanceList()).getErrorRate(), 6)
+        c45.train(self.iris.getInstanceList(), C45Parameter(1, True, 0.2, False, 8))
+        self.assertLess(100 * c45.test(self.iris.getInstanceList()).getErrorRate(), 10.0)
+
+    def test_Compiled(self):
+        for dataSet in [self.iris, self.bupa, self.car, self.tictactoe]:
+            instances = list(dataSet.getInstanceList().getInstances())
+            tree = DecisionTree(DecisionNode(dataSet.getInstanceList(), None, C45Parameter(1, False, 0.2)))
+            predictions = [tree.predict(instance) for instance in instances]
+            tree.compile()
+            self.assertEqual(predictions, [tree.predict(instance) for instance in instances])
+            self.assertEqual(predictions, tree.predictBatch(instances))
+
+    def test_Prune(self):
+        for dataSet in [self.bupa, self.car, self.tictactoe]:
+            partition = Partition(dataSet.getInstanceList(), 0.2, 1, True)
+            tree = DecisionTree(DecisionNode(partition.get(1), None, C45Parameter(1, True, 0.2)))
+            accuracy = tree.testClassifier(partition.get(0)).getAccuracy()
+            tree.prune(partition.get(0))
+            self.assertGreaterEqual(tree.testClassifier(partition.get(0)).getAccuracy(), accuracy)
+
+    def leaves(self, node: DecisionNode, depth: int = 0) -> list:
+        if node.leaf:
+            return [(depth, node.classDistribution())]
+        result = []
+        for child in node.children:
+            result.extend(self.leaves(child, depth + 1))
+        return result
+
+    def test_StoppingControls(self):
+        for dataSet in [self.bupa, self.car, self.tictactoe]:
+            instances = list(dataSet.getInstanceList().getInstances())
+            tree = DecisionTree(DecisionNode(dataSet.getInstanceList(), None, C45Parameter(1, False, 0.2)))
+            bestFirst = DecisionTree(DecisionNode(dataSet.getInstanceList(), None,
+                                                  C45Parameter(1, False, 0.2, maxLeafCount=100000)))
+            self.assertEqual(tree.predictBatch(instances), bestFirst.predictBatch(instances))
+            root = DecisionNode(dataSet.getInstanceList(), None, C45Parameter(1, False, 0.2, maxDepth=3))
+            self.assertLessEqual(max(depth for depth, _ in self.leaves(root)), 3)
+            root = DecisionNode(dataSet.getInstanceList(), None, C45Parameter(1, False, 0.2, minLeafSize=20))
+            self.assertGreaterEqual(min(sum(distribution.values()) for _, distribution in self.leaves(root)), 20)
+            root = DecisionNode(dataSet.getInstanceList(), None, C45Parameter(1, False, 0.2, maxLeafCount=10))
+            self.assertLessEqual(len(self.leaves(root)), 10)
+
+    def test_TrainLean(self):
+        c45 = C45()
+        for dataSet in [self.iris, self.bupa, self.car, self.tictactoe]:
+            instances = list(dataSet.getInstanceList().getInstances())
+            c45.train(dataSet.getInstanceList(), C45Parameter(1, True, 0.2))
+            predictions = c45.model.predictBatch(instances)
+            c45.train(dataSet.getInstanceList(), C45Parameter(1, True, 0.2, lean=True))
+            self.assertEqual(predictions, c45.model.predictBatch(instances))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -2,6 +2,8 @@ import unittest
 
 from Classification.Classifier.Knn import Knn
 from Classification.DistanceMetric.EuclidianDistance import EuclidianDistance
+from Classification.Model.KnnMatrix import KnnMatrix
+from Classification.Model.KnnModel import KnnModel
 from Classification.Parameter.KnnParameter import KnnParameter
 from test.Classifier.ClassifierTest import ClassifierTest
 
@@ -22,6 +24,58 @@ class KnnTest(ClassifierTest):
         knn.train(self.tictactoe.getInstanceList(), knnParameter)
         self.assertAlmostEqual(32.57, 100 * knn.test(self.tictactoe.getInstanceList()).getErrorRate(), 2)
 
+    def test_TrainIndex(self):
+        for dataSet in [self.iris, self.bupa, self.dermatology]:
+            instances = list(dataSet.getInstanceList().getInstances())
+            model = KnnModel(dataSet.getInstanceList(), 3, EuclidianDistance())
+            indexedModel = KnnModel(dataSet.getInstanceList(), 3, EuclidianDistance(), True)
+            for instance in instances:
+                self.assertEqual(list(model.nearestNeighbors(instance).getInstances()),
+                                 list(indexedModel.nearestNeighbors(instance).getInstances()))
+        knn = Knn()
+        knn.train(self.bupa.getInstanceList(), KnnParameter(1, 3, EuclidianDistance(), True))
+        self.assertAlmostEqual(19.42, 100 * knn.test(self.bupa.getInstanceList()).getErrorRate(), 2)
+
+    def test_Matrix(self):
+        distanceMetric = EuclidianDistance()
+        for dataSet in [self.bupa, self.car]:
+            instances = list(dataSet.getInstanceList().getInstances())
+            matrix = KnnMatrix(instances, distanceMetric)
+            for instance in instances[:50]:
+                distances = [distanceMetric.distance(other, instance) for other in instances]
+                self.assertEqual(distances, matrix.distances(instance))
+                expected = sorted(range(len(instances)), key=lambda row: distances[row])[:5]
+                self.assertEqual(expected, matrix.nearest(instance, 5))
+        knn = Knn()
+        knn.train(self.car.getInstanceList(), KnnParameter(1, 3, EuclidianDistance()))
+        self.assertAlmostEqual(20.31, 100 * knn.test(self.car.getInstanceList()).getErrorRate(), 2)
+
+    def test_PredictBatch(self):
+        for dataSet in [self.iris, self.bupa, self.dermatology, self.car]:
+            instances = list(dataSet.getInstanceList().getInstances())
+            model = KnnModel(dataSet.getInstanceList(), 3, EuclidianDistance())
+            predictions = [model.predict(instance) for instance in instances]
+            for blockSize in [1, 50, 1000]:
+                model = KnnModel(dataSet.getInstanceList(), 3, EuclidianDistance(), blockSize=blockSize)
+                self.assertEqual(predictions, model.predictBatch(instances))
+        knn = Knn()
+        knn.train(self.dermatology.getInstanceList(), KnnParameter(1, 3, EuclidianDistance(), blockSize=20))
+        self.assertAlmostEqual(3.01, 100 * knn.test(self.dermatology.getInstanceList()).getErrorRate(), 2)
+
+    def test_ApproximateRecall(self):
+        for dataSet, expectedRecall in [(self.iris, 0.99), (self.bupa, 0.95), (self.dermatology, 0.94)]:
+            instances = list(dataSet.getInstanceList().getInstances())
+            model = KnnModel(dataSet.getInstanceList(), 3, EuclidianDistance())
+            approximateModel = KnnModel(dataSet.getInstanceList(), 3, EuclidianDistance(), hashTables=8, hashBits=8)
+            found = 0
+            for instance in instances:
+                exact = set(map(id, model.nearestNeighbors(instance).getInstances()))
+                found += len(exact.intersection(map(id, approximateModel.nearestNeighbors(instance).getInstances())))
+            self.assertGreaterEqual(found / (3 * len(instances)), expectedRecall)
+        knn = Knn()
+        knn.train(self.car.getInstanceList(), KnnParameter(1, 3, EuclidianDistance(), hashTables=8, hashBits=8))
+        self.assertAlmostEqual(20.31, 100 * knn.test(self.car.getInstanceList()).getErrorRate(), 2)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,6 +1,8 @@
 import unittest
 
 from Classification.Classifier.RandomForest import RandomForest
+from Classification.InstanceList.InstanceListView import InstanceListView
+from Classification.Model.DecisionTree.ForestBuilder import ForestBuilder
 from Classification.Parameter.RandomForestParameter import RandomForestParameter
 from test.Classifier.ClassifierTest import ClassifierTest
 
@@ -21,6 +23,42 @@ class RandomForestTest(ClassifierTest):
         randomForest.train(self.tictactoe.getInstanceList(), randomForestParameter)
         self.assertAlmostEqual(0.0, 100 * randomForest.test(self.tictactoe.getInstanceList()).getErrorRate(), 2)
 
+    def test_TrainParallel(self):
+        randomForest = RandomForest()
+        for dataSet in [self.iris, self.bupa, self.car]:
+            instances = list(dataSet.getInstanceList().getInstances())
+            randomForest.train(dataSet.getInstanceList(), RandomForestParameter(1, 10, 2))
+            predictions = randomForest.model.predictBatch(instances)
+            randomForest.train(dataSet.getInstanceList(), RandomForestParameter(1, 10, 2, workers=2))
+            self.assertEqual(predictions, randomForest.model.predictBatch(instances))
+
+    def test_PredictBatch(self):
+        randomForest = RandomForest()
+        for dataSet in [self.iris, self.bupa, self.car]:
+            instances = list(dataSet.getInstanceList().getInstances())
+            randomForest.train(dataSet.getInstanceList(), RandomForestParameter(1, 20, 2))
+            predictions = [randomForest.getModel().predict(instance) for instance in instances]
+            self.assertEqual(predictions, randomForest.getModel().predictBatch(instances))
+            self.assertEqual(predictions, randomForest.getModel().predictBatch(instances, True))
+
+    def test_OutOfBag(self):
+        builder = ForestBuilder(self.iris.getInstanceList(), RandomForestParameter(1, 10, 2))
+        forest = builder.build()
+        evaluated = set()
+        for i in range(10):
+            drawn = set(InstanceListView.bootstrapIndices(self.iris.getInstanceList().size(), i))
+            outOfBag = set(builder.getOutOfBagIndices()[i])
+            self.assertEqual(0, len(drawn & outOfBag))
+            self.assertEqual(self.iris.getInstanceList().size(), len(drawn | outOfBag))
+            evaluated |= outOfBag
+        performance = builder.outOfBagPerformance(forest)
+        self.assertEqual(len(evaluated), performance.getConfusionMatrix().sumOfElements())
+        randomForest = RandomForest()
+        randomForest.train(self.iris.getInstanceList(), RandomForestParameter(1, 10, 2))
+        self.assertAlmostEqual(performance.getErrorRate(), randomForest.getModel().getOutOfBagPerformance().getErrorRate(),
+                               6)
+        self.assertLess(performance.getErrorRate(), 0.1)
+
 
 if __name__ == '__main__':
     unittest.main()
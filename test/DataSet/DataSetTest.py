@@ -1,8 +1,30 @@
+import os
+import shutil
+import tempfile
 import unittest
 
+from Sampling.Bootstrap import Bootstrap
+from Sampling.KFoldCrossValidation import KFoldCrossValidation
+from Sampling.StratifiedKFoldCrossValidation import StratifiedKFoldCrossValidation
+
 from Classification.Attribute.AttributeType import AttributeType
+from Classification.Classifier.Knn import Knn
+from Classification.Classifier.LinearPerceptron import LinearPerceptron
+from Classification.Classifier.NaiveBayes import NaiveBayes
 from Classification.DataSet.DataDefinition import DataDefinition
 from Classification.DataSet.DataSet import DataSet
+from Classification.DataSet.SymbolTable import SymbolTable
+from Classification.DistanceMetric.EuclidianDistance import EuclidianDistance
+from Classification.Filter.Normalize import Normalize
+from Classification.InstanceList.InstanceListKFoldCrossValidation import InstanceListKFoldCrossValidation
+from Classification.InstanceList.InstanceListStratifiedKFoldCrossValidation import \
+    InstanceListStratifiedKFoldCrossValidation
+from Classification.InstanceList.InstanceListView import InstanceListView
+from Classification.InstanceList.Moments import Moments
+from Classification.InstanceList.InstanceList import InstanceList
+from Classification.InstanceList.Partition import Partition
+from Classification.Parameter.KnnParameter import KnnParameter
+from Classification.Parameter.LinearPerceptronParameter import LinearPerceptronParameter
 
 
 class DataSetTest(unittest.TestCase):
@@ -70,6 +92,185 @@ class DataSetTest(unittest.TestCase):
         self.assertEquals("draw;zero;one;two;three;four;five;six;seven;eight;nine;ten;eleven;twelve;thirteen;fourteen;fifteen;sixteen",
                           self.chess.getClasses())
 
+    def test_Columnar(self):
+        attributeTypes = []
+        for i in range(6):
+            if i % 2 == 0:
+                attributeTypes.append(AttributeType.DISCRETE)
+            else:
+                attributeTypes.append(AttributeType.CONTINUOUS)
+        chess = DataSet(DataDefinition(attributeTypes), ",", "../../datasets/chess.data", True)
+        self.assertEqual(self.chess.sampleSize(), chess.sampleSize())
+        self.assertEqual(self.chess.getClasses(), chess.getClasses())
+        self.assertEqual(self.chess.getInstanceList().classDistribution(), chess.getInstanceList().classDistribution())
+        self.assertEqual(self.chess.getInstanceList().average().__str__(), chess.getInstanceList().average().__str__())
+        for i in range(chess.attributeCount()):
+            self.assertEqual(self.chess.getInstanceList().attributeClassDistribution(i),
+                             chess.getInstanceList().attributeClassDistribution(i))
+        self.assertEqual(self.chess.getInstanceList().get(100).__str__(), chess.getInstanceList().get(100).__str__())
+        iris = DataSet(DataDefinition(4 * [AttributeType.CONTINUOUS]), ",", "../../datasets/iris.data", True)
+        self.assertEqual(self.iris.getInstanceList().continuousAverage(), iris.getInstanceList().continuousAverage())
+        self.assertEqual(self.iris.getInstanceList().continuousStandardDeviation(),
+                         iris.getInstanceList().continuousStandardDeviation())
+        iris.getInstanceList().get(0).getAttribute(0).setValue(6.0)
+        self.assertEqual(6.0, iris.getInstanceList().get(0).getAttribute(0).getValue())
+
+    def test_IterChunks(self):
+        progress = []
+        dataSet = DataSet(DataDefinition(8 * [AttributeType.DISCRETE]))
+        sizes = []
+        distribution = {}
+        for chunk in dataSet.iterChunks("../../datasets/nursery.data", ",", 1024 * 1024,
+                                        lambda current, total: progress.append((current, total))):
+            sizes.append(chunk.size())
+            for label in chunk.getClassLabels():
+                distribution[label] = distribution.get(label, 0) + 1
+        self.assertTrue(len(sizes) > 1)
+        self.assertEqual(12960, sum(sizes))
+        self.assertEqual(self.nursery.getInstanceList().classDistribution().items(), distribution.items())
+        self.assertEqual(progress[-1][0], progress[-1][1])
+        sizes = [chunk.size() for chunk in DataSet().iterChunks("../../datasets/iris.data", ",", 16 * 1024, None, True)]
+        self.assertEqual(150, sum(sizes))
+
+    def test_SaveLoad(self):
+        directory = tempfile.mkdtemp()
+        fileName = os.path.join(directory, "chess.bin")
+        self.chess.save(fileName)
+        chess = DataSet.load(fileName)
+        self.assertEqual(self.chess.sampleSize(), chess.sampleSize())
+        self.assertEqual(self.chess.getClasses(), chess.getClasses())
+        self.assertEqual(self.chess.getInstanceList().classDistribution(), chess.getInstanceList().classDistribution())
+        self.assertEqual(self.chess.getInstanceList().average().__str__(), chess.getInstanceList().average().__str__())
+        self.assertEqual(self.chess.getInstanceList().get(100).__str__(), chess.getInstanceList().get(100).__str__())
+        chess.getInstanceList().get(0).getAttribute(1).setValue(6.0)
+        self.assertEqual(6.0, chess.getInstanceList().get(0).getAttribute(1).getValue())
+        chess.addInstance(self.chess.getInstanceList().get(0))
+        self.assertEqual(28057, chess.sampleSize())
+        dataFile = os.path.join(directory, "iris.data")
+        shutil.copy("../../datasets/iris.data", dataFile)
+        definition = DataDefinition(4 * [AttributeType.CONTINUOUS])
+        iris = DataSet(definition, ",", dataFile, cache=True)
+        self.assertTrue(os.path.exists(dataFile + ".bin"))
+        cached = DataSet(definition, ",", dataFile, cache=True)
+        self.assertEqual(iris.getInstanceList().continuousAverage(), cached.getInstanceList().continuousAverage())
+        self.assertEqual(self.iris.getInstanceList().classDistribution(), cached.getInstanceList().classDistribution())
+        with open(dataFile, "a") as outfile:
+            outfile.write("5.0,3.0,1.5,0.2,Iris-setosa\n")
+        self.assertEqual(151, DataSet(definition, ",", dataFile, cache=True).sampleSize())
+        shutil.rmtree(directory)
+
+    def test_MemoryMapped(self):
+        directory = tempfile.mkdtemp()
+        fileName = os.path.join(directory, "iris.bin")
+        self.iris.save(fileName)
+        iris = DataSet.load(fileName)
+        self.assertEqual(self.iris.getInstanceList().classDistribution(), iris.getInstanceList().classDistribution())
+        self.assertEqual(self.iris.getInstanceList().continuousAverage(), iris.getInstanceList().continuousAverage())
+        subList = iris.getInstanceList().subList(range(50, 100))
+        self.assertEqual(50, subList.size())
+        self.assertEqual(["Iris-versicolor"], subList.getDistinctClassLabels())
+        self.assertEqual(self.iris.getInstanceList().get(50).__str__(), subList.get(0).__str__())
+        for classifier, parameter in [(NaiveBayes(), None), (Knn(), KnnParameter(1, 3, EuclidianDistance())),
+                                      (LinearPerceptron(), LinearPerceptronParameter(1, 0.1, 0.99, 0.2, 100))]:
+            classifier.train(self.iris.getInstanceList(), parameter)
+            errorRate = classifier.test(self.iris.getInstanceList()).getErrorRate()
+            classifier.train(iris.getInstanceList(), parameter)
+            self.assertEqual(errorRate, classifier.test(iris.getInstanceList()).getErrorRate())
+        shutil.rmtree(directory)
+
+    def test_Parallel(self):
+        definition = DataDefinition(8 * [AttributeType.DISCRETE])
+        nursery = DataSet(definition, ",", "../../datasets/nursery.data", workers=3)
+        self.assertEqual(self.nursery.sampleSize(), nursery.sampleSize())
+        self.assertEqual(self.nursery.getClasses(), nursery.getClasses())
+        for i in range(nursery.attributeCount()):
+            self.assertEqual(self.nursery.getInstanceList().getAttributeValueList(i),
+                             nursery.getInstanceList().getAttributeValueList(i))
+        for i in [0, 4320, 8640, 12959]:
+            self.assertEqual(self.nursery.getInstanceList().get(i).__str__(), nursery.getInstanceList().get(i).__str__())
+        iris = DataSet(DataDefinition(4 * [AttributeType.CONTINUOUS]), ",", "../../datasets/iris.data", workers=2)
+        self.assertEqual(self.iris.getInstanceList().continuousAverage(), iris.getInstanceList().continuousAverage())
+
+    def test_SymbolTable(self):
+        classLabels = SymbolTable(self.nursery.getInstanceList().getClassLabels())
+        self.assertEqual(self.nursery.getInstanceList().getDistinctClassLabels(), classLabels.getSymbols())
+        self.assertEqual(5, classLabels.size())
+        self.assertEqual(1, classLabels.indexOf("priority"))
+        self.assertEqual(-1, classLabels.indexOf("unknown"))
+        self.assertEqual("priority", classLabels.getSymbol(1))
+        instances = self.car.getInstanceList()
+        self.assertIs(instances.get(0).getClassLabel(), instances.get(1).getClassLabel())
+        self.assertIs(instances.get(0).getAttribute(0).getValue(), instances.get(1).getAttribute(0).getValue())
+
+    def test_Views(self):
+        partition = Partition(self.car.getInstanceList(), 0.25, 1, True)
+        self.assertEqual(434, partition.get(0).size())
+        self.assertEqual(1294, partition.get(1).size())
+        classes = Partition(partition.get(1))
+        self.assertEqual(1294, sum(classes.get(i).size() for i in range(classes.size())))
+        self.assertEqual(partition.get(1).getDistinctClassLabels(),
+                         [classes.get(i).getDistinctClassLabels()[0] for i in range(classes.size())])
+        car = DataSet(DataDefinition(6 * [AttributeType.DISCRETE]), ",", "../../datasets/car.data")
+        kFold = KFoldCrossValidation(car.getInstances(), 10, 1)
+        kFoldView = InstanceListKFoldCrossValidation(self.car.getInstanceList(), 10, 1)
+        stratified = StratifiedKFoldCrossValidation(car.getClassInstances(), 10, 1)
+        stratifiedView = InstanceListStratifiedKFoldCrossValidation(self.car.getInstanceList(), 10, 1)
+        for k in [0, 9]:
+            self.assertEqual(list(map(str, kFold.getTrainFold(k))),
+                             list(map(str, kFoldView.getTrainFold(k).getInstances())))
+            self.assertEqual(list(map(str, kFold.getTestFold(k))),
+                             list(map(str, kFoldView.getTestFold(k).getInstances())))
+            self.assertEqual(list(map(str, stratified.getTrainFold(k))),
+                             list(map(str, stratifiedView.getTrainFold(k).getInstances())))
+            self.assertEqual(list(map(str, stratified.getTestFold(k))),
+                             list(map(str, stratifiedView.getTestFold(k).getInstances())))
+        self.assertEqual(list(map(str, Bootstrap(car.getInstances(), 3).getSample())),
+                         list(map(str, InstanceListView.bootstrap(self.car.getInstanceList(), 3).getInstances())))
+    def test_StatisticsCache(self):
+        instances = self.car.getInstanceList()
+        distribution = instances.classDistribution()
+        self.assertEqual(1210, distribution.getCount("unacc"))
+        distribution.removeItem("unacc")
+        self.assertEqual(1210, instances.classDistribution().getCount("unacc"))
+        self.assertEqual(1728, instances.classDistribution().getSum())
+        version = instances.getVersion()
+        instances.add(instances.get(0))
+        self.assertEqual(version + 1, instances.getVersion())
+        self.assertEqual(1211, instances.classDistribution().getCount("unacc"))
+        classLabels = instances.getDistinctClassLabels()
+        classLabels.append("unknown")
+        self.assertEqual(4, len(instances.getDistinctClassLabels()))
+        iris = DataSet(DataDefinition(4 * [AttributeType.CONTINUOUS]), ",", "../../datasets/iris.data")
+        average = iris.getInstanceList().continuousAverage()
+        self.assertAlmostEqual(5.8433, average[0], 4)
+        self.assertEqual(average, InstanceList(iris.getInstances()).continuousAverage())
+        self.assertAlmostEqual(0.8281, iris.getInstanceList().continuousStandardDeviation()[0], 4)
+        Normalize(iris).convert()
+        self.assertAlmostEqual(0.0, iris.getInstanceList().continuousAverage()[0], 6)
+        self.assertAlmostEqual(1.0, iris.getInstanceList().continuousStandardDeviation()[0], 6)
+
+    def test_Moments(self):
+        instances = self.dermatology.getInstanceList()
+        moments = instances.moments()
+        self.assertEqual(366, moments.getCount())
+        average = instances.continuousAverage()
+        for i in range(len(average)):
+            self.assertAlmostEqual(average[i], moments.getMean()[i], 10)
+        merged = Moments(moments.dimension())
+        for start in range(0, 366, 100):
+            shard = Moments(moments.dimension())
+            for instance in instances.getInstances()[start:start + 100]:
+                shard.add(instance.continuousAttributes())
+            merged.merge(shard)
+        covariance = moments.getCovariance()
+        mergedCovariance = merged.getCovariance()
+        for i in range(moments.dimension()):
+            for j in range(moments.dimension()):
+                self.assertAlmostEqual(covariance.getValue(i, j), mergedCovariance.getValue(i, j), 8)
+        columnar = DataSet(DataDefinition(4 * [AttributeType.CONTINUOUS]), ",", "../../datasets/iris.data",
+                           columnar=True)
+        self.assertAlmostEqual(0.6857, columnar.getInstanceList().moments().getVariance()[0], 4)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -25,6 +25,15 @@ class DiscreteToIndexedTest(ClassifierTest):
         linearPerceptron.train(self.tictactoe.getInstanceList(), linearPerceptronParameter)
         self.assertAlmostEqual(2.51, 100 * linearPerceptron.test(self.tictactoe.getInstanceList()).getErrorRate(), 2)
 
+    def test_SharedAttributes(self):
+        discreteToIndexed = DiscreteToIndexed(self.car)
+        discreteToIndexed.convert()
+        instances = self.car.getInstanceList()
+        self.assertFalse(hasattr(instances.get(0), "__dict__"))
+        self.assertFalse(hasattr(instances.get(0).getAttribute(0), "__dict__"))
+        self.assertEqual(instances.get(0).getAttribute(0).getValue(), instances.get(1).getAttribute(0).getValue())
+        self.assertIs(instances.get(0).getAttribute(0), instances.get(1).getAttribute(0))
+
     def test_Knn(self):
         knn = Knn()
         knnParameter = KnnParameter(1, 3, EuclidianDistance())